@@ -223,14 +223,17 @@ class AntennaControllerQt(QObject):
 
     def set_target_position(self, azimuth: float, elevation: float, timeout: float | None = None) -> None:
         self._run_backend_call(
-            lambda: self.backend.set_target_position(azimuth, elevation),
+            self.backend.set_target_position,
+            azimuth,
+            elevation,
             timeout=timeout or self._target_command_timeout(),
         )
         self._refresh_from_backend()
 
     def set_az_speed(self, speed: float, timeout: float | None = None):
         result = self._run_backend_call(
-            lambda: self.backend.set_az_speed(speed),
+            self.backend.set_az_speed,
+            speed,
             timeout=timeout or self._motion_command_timeout(),
         )
         self._refresh_from_backend()
@@ -238,7 +241,8 @@ class AntennaControllerQt(QObject):
 
     def set_el_speed(self, speed: float, timeout: float | None = None):
         result = self._run_backend_call(
-            lambda: self.backend.set_el_speed(speed),
+            self.backend.set_el_speed,
+            speed,
             timeout=timeout or self._motion_command_timeout(),
         )
         self._refresh_from_backend()
@@ -298,7 +302,10 @@ class AntennaControllerQt(QObject):
             raise ValueError(f"Unsupported manual axis: {axis!r}")
         return self._submit_manual_command(
             f"jog_{axis_name}_{direction_name.lower()}",
-            lambda: self.backend.manual_jog(axis_name, direction_name, speed),
+            self.backend.manual_jog,
+            axis_name,
+            direction_name,
+            speed,
         )
 
     def stop_manual_axis_async(self, axis: str):
@@ -314,10 +321,10 @@ class AntennaControllerQt(QObject):
             raise ValueError(f"Unsupported manual axis: {axis!r}")
         return self._submit_manual_command(f"stop_{axis_name}", coro_factory)
 
-    def _submit_manual_command(self, command_name: str, coro_factory):
+    def _submit_manual_command(self, command_name: str, coro_factory, *args):
         if not getattr(self, "thread_manager", None):
             raise RuntimeError("ThreadManager is required for antenna controller operations")
-        future = self.thread_manager.submit_coro(self.loop_name, coro_factory)
+        future = self.thread_manager.submit_coro(self.loop_name, coro_factory, *args)
 
         def command_done(completed_future) -> None:
             try:
@@ -332,11 +339,11 @@ class AntennaControllerQt(QObject):
         future.add_done_callback(command_done)
         return future
 
-    def _run_backend_call(self, coro_factory, timeout: float | None = None):
+    def _run_backend_call(self, coro_factory, *args, timeout: float | None = None):
         if not getattr(self, "thread_manager", None):
             raise RuntimeError("ThreadManager is required for antenna controller operations")
         try:
-            return self.thread_manager.run_coro(self.loop_name, coro_factory, timeout=timeout)
+            return self.thread_manager.run_coro(self.loop_name, coro_factory, *args, timeout=timeout)
         except FutureTimeoutError as exc:
             op_name = getattr(coro_factory, "__name__", None) or getattr(getattr(coro_factory, "func", None), "__name__", None) or "backend_call"
             if timeout is None:
@@ -2,10 +2,14 @@
 # Lecteur RS232 pour powermeter avec parsing du champ Power=... [dBm]
 # Auteur: Stéphane Rey (structure orientée ThreadManager)
 
+import codecs
+import os
 import re
+import select
+import sys
 import time
 import logging
-from typing import Callable, Optional
+from typing import Callable, Optional, Union
 
 try:
     import serial  # pyserial
@@ -15,11 +19,30 @@ except Exception as e:
     Serial = object  # type: ignore
     SerialException = Exception
 
+# Tables de conversion settings -> constantes pyserial (construites une seule fois)
+if serial is not None:
+    _BYTESIZE_MAP = {5: serial.FIVEBITS, 6: serial.SIXBITS, 7: serial.SEVENBITS, 8: serial.EIGHTBITS}
+    _PARITY_MAP = {
+        "N": serial.PARITY_NONE, "NONE": serial.PARITY_NONE,
+        "E": serial.PARITY_EVEN, "EVEN": serial.PARITY_EVEN,
+        "O": serial.PARITY_ODD,  "ODD": serial.PARITY_ODD,
+        "M": serial.PARITY_MARK, "MARK": serial.PARITY_MARK,
+        "S": serial.PARITY_SPACE, "SPACE": serial.PARITY_SPACE,
+    }
+    _STOPBITS_MAP = {1: serial.STOPBITS_ONE, 2: serial.STOPBITS_TWO}
+else:
+    _BYTESIZE_MAP = _PARITY_MAP = _STOPBITS_MAP = {}
+
 
 _PWR_REGEX = re.compile(
     r"Power\s*=\s*([+-]?\d+(?:\.\d+)?)\s*\[\s*dBm\s*\]",
     re.IGNORECASE
 )
+# Fallback ultra permissif: premier float suivi de [dBm]
+_PWR_FALLBACK_REGEX = re.compile(r"([+-]?\d+(?:\.\d+)?)\s*\[\s*dBm\s*\]", re.IGNORECASE)
+# Variantes bytes: le flux série est parsé sans décodage préalable
+_PWR_REGEX_BYTES = re.compile(_PWR_REGEX.pattern.encode("ascii"), re.IGNORECASE)
+_PWR_FALLBACK_REGEX_BYTES = re.compile(_PWR_FALLBACK_REGEX.pattern.encode("ascii"), re.IGNORECASE)
 
 
 class PowermeterClient:
@@ -52,6 +75,38 @@ class PowermeterClient:
         self.logger = logger or logging.getLogger("Powermeter")
         self._status_callback = status_callback
         self._ser: Optional[Serial] = None
+        # Descripteur du port (POSIX uniquement) pour lire par segments sans passer par read_until
+        self._fd: Optional[int] = None
+        self.reload_settings()
+
+    def reload_settings(self) -> None:
+        """
+        (Re)lit le bloc settings['POWERMETER'] utilisé par read_power().
+        À rappeler après modification de self.settings en cours d'exécution.
+        """
+        # Appelé depuis __init__ (thread GUI): une valeur invalide est signalée, jamais levée
+        enc = self._pm_get("encoding", "ascii")
+        try:
+            codecs.lookup(enc)
+        except (LookupError, TypeError):
+            self.logger.warning(f"POWERMETER.encoding invalide ({enc!r}) -> 'ascii'")
+            enc = "ascii"
+        self._enc = enc
+        self._inter_delay = self._pm_float("inter_read_delay_s", 0.05)
+        self._overall_timeout = self._pm_float("overall_timeout_s", 1.5)
+
+        # Commande par défaut: 'power?\r' si rien n'est fourni
+        read_cmd = self._pm_get("read_cmd", "power?\r")
+        if isinstance(read_cmd, str) and read_cmd:
+            # Ajoute un CR si pas de fin de ligne fournie (certains instruments exigent CR ou CRLF)
+            if not read_cmd.endswith(("\r", "\n")):
+                read_cmd += "\r"
+            self._read_cmd = read_cmd
+            self._read_cmd_bytes = read_cmd.encode(self._enc, errors="ignore")
+        else:
+            # Pas de commande: lecture directe du flux
+            self._read_cmd = None
+            self._read_cmd_bytes = b""
 
     # ---------- Public API (threadable) ----------
 
@@ -66,41 +121,48 @@ class PowermeterClient:
             self._ensure_serial_open()
             self._flush_input()
 
-            # --- Paramètres / défauts robustes ---
-            enc = self._pm_get("encoding", "ascii")
-            inter_delay = float(self._pm_get("inter_read_delay_s", 0.05))
-            overall_timeout = float(self._pm_get("overall_timeout_s", 1.5))
-
-            # Commande par défaut: 'power?\r' si rien n'est fourni
-            read_cmd = self._pm_get("read_cmd", "power?\r")
-            if isinstance(read_cmd, str) and read_cmd:
-                # Ajoute un CR si pas de fin de ligne fournie (certains instruments exigent CR ou CRLF)
-                if not read_cmd.endswith(("\r", "\n")):
-                    read_cmd += "\r"
-
+            # Paramètres pré-résolus par reload_settings()
+            if self._read_cmd_bytes:
                 try:
-                    self._ser.write(read_cmd.encode(enc, errors="ignore"))
+                    self._ser.write(self._read_cmd_bytes)
                 except Exception as e:
-                    raise IOError(f"Échec d'émission commande '{read_cmd}': {e}")
+                    raise IOError(f"Échec d'émission commande '{self._read_cmd}': {e}")
 
-                if inter_delay > 0:
-                    time.sleep(inter_delay)
+                if self._inter_delay > 0:
+                    time.sleep(self._inter_delay)
 
             # --- Réception/parse avec timeout global ---
-            t0 = time.time()
-            buff = ""
-            while time.time() - t0 < overall_timeout:
-                line = self._read_available_line(enc)
-                if line:
-                    buff += line
+            # Attente bloquante d'un segment (pas de busy-poll), le regex ne tourne
+            # qu'une fois par segment reçu.
+            deadline = time.monotonic() + self._overall_timeout
+            buff = b""
+            # Seul le repli read_until modifie le timeout pyserial (setter = reconfiguration du port)
+            restore_timeout = self._fd is None
+            previous_timeout = self._ser.timeout if restore_timeout else None
+            try:
+                while True:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    chunk = self._read_chunk(remaining)
+                    if not chunk:
+                        break
+                    buff += chunk
                     val = self._try_parse_power(buff)
                     if val is not None:
                         self._emit_status(f"read_power: parsed {val:.2f} dBm")
                         return val
-                else:
-                    time.sleep(0.01)  # évite busy-wait
+            finally:
+                if restore_timeout:
+                    self._ser.timeout = previous_timeout
 
-            # Dernière tentative sur le buffer agrégé
+            # Dernière tentative: ce qui reste dans le buffer d'entrée
+            try:
+                waiting = self._ser.in_waiting
+                if waiting:
+                    buff += self._ser.read(waiting)
+            except Exception:
+                pass
             val = self._try_parse_power(buff)
             if val is not None:
                 self._emit_status(f"read_power: parsed (late) {val:.2f} dBm")
@@ -115,25 +177,46 @@ class PowermeterClient:
         finally:
             self._emit_status("read_power: finish")
 
+    def _read_chunk(self, timeout_s: float) -> bytes:
+        """
+        Un segment reçu avant timeout_s (b"" si rien).
+        POSIX: select() + un seul os.read() sur le descripteur (pyserial l'ouvre en O_NONBLOCK).
+        Sinon: read_until(']') de pyserial, qui lit octet par octet.
+        """
+        fd = self._fd
+        if fd is None:
+            self._ser.timeout = timeout_s
+            return self._ser.read_until(b"]", 256)
+        ready, _, _ = select.select([fd], [], [], timeout_s)
+        if not ready:
+            return b""
+        try:
+            return os.read(fd, 4096)
+        except BlockingIOError:
+            return b""
+
     # ---------- Helpers / Parsing ----------
 
     @staticmethod
-    def extract_power_from_text(text: str) -> Optional[float]:
+    def extract_power_from_text(text: Union[str, bytes]) -> Optional[float]:
         """
-        Extraction robuste de la puissance depuis un texte.
+        Extraction robuste de la puissance depuis un texte (str) ou un buffer série brut (bytes).
         Format attendu par défaut: 'Power=-105.26[dBm]      Ref=   0.00[dBm]'
         Retourne un float ou None si non trouvé.
         """
         if not text:
             return None
-        m = _PWR_REGEX.search(text)
+        if isinstance(text, (bytes, bytearray)):
+            primary, fallback = _PWR_REGEX_BYTES, _PWR_FALLBACK_REGEX_BYTES
+        else:
+            primary, fallback = _PWR_REGEX, _PWR_FALLBACK_REGEX
+        m = primary.search(text)
         if m:
             try:
                 return float(m.group(1))
             except Exception:
                 return None
-        # Fallback ultra permissif: premier float suivi de [dBm]
-        m2 = re.search(r"([+-]?\d+(?:\.\d+)?)\s*\[\s*dBm\s*\]", text, re.IGNORECASE)
+        m2 = fallback.search(text)
         if m2:
             try:
                 return float(m2.group(1))
@@ -141,7 +224,7 @@ class PowermeterClient:
                 return None
         return None
 
-    def _try_parse_power(self, text: str) -> Optional[float]:
+    def _try_parse_power(self, text: Union[str, bytes]) -> Optional[float]:
         val = self.extract_power_from_text(text)
         if val is not None:
             self.logger.debug(f"Powermeter parse OK: {val:.5f} dBm")
@@ -176,11 +259,18 @@ class PowermeterClient:
                 timeout=timeout_s,
                 write_timeout=timeout_s
             )
+            self._fd = None
+            if sys.platform != "win32":
+                try:
+                    self._fd = self._ser.fileno()
+                except Exception:
+                    self._fd = None
             self._emit_status(f"Serial OPEN on {port} @ {baudrate} bps")
         except SerialException as e:
             raise ConnectionError(f"Ouverture série échouée sur {port}: {e}")
 
     def close(self):
+        self._fd = None
         try:
             if self._ser and getattr(self._ser, "is_open", False):
                 self._ser.close()
@@ -196,33 +286,20 @@ class PowermeterClient:
         except Exception:
             pass
 
-    def _read_available_line(self, encoding: str) -> str:
-        """
-        Lit ce qui est disponible (ligne ou chunk), renvoie str (sans garantie de fin de ligne).
-        Supporte des instruments qui ne terminent pas aux \r\n.
-        """
-        if not self._ser:
-            return ""
-        try:
-            # Lire ce qui est disponible
-            waiting = self._ser.in_waiting if hasattr(self._ser, "in_waiting") else 0
-            if waiting <= 0:
-                # tenter une lecture ligne (au cas où l'instrument fait du \n)
-                raw = self._ser.readline()
-            else:
-                raw = self._ser.read(waiting)
-            if not raw:
-                return ""
-            return raw.decode(encoding, errors="ignore")
-        except Exception:
-            return ""
-
     # ---------- Utils ----------
 
     def _pm_get(self, key: str, default=None):
         pm = self.settings.get("POWERMETER", {}) if isinstance(self.settings, dict) else {}
         return pm.get(key, default)
 
+    def _pm_float(self, key: str, default: float) -> float:
+        value = self._pm_get(key, default)
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            self.logger.warning(f"POWERMETER.{key} invalide ({value!r}) -> {default}")
+            return default
+
     def _emit_status(self, msg: str):
         try:
             self.logger.info(msg)
@@ -236,21 +313,12 @@ class PowermeterClient:
 
     @staticmethod
     def _to_bytesize(n: int):
-        from serial import FIVEBITS, SIXBITS, SEVENBITS, EIGHTBITS
-        return {5: FIVEBITS, 6: SIXBITS, 7: SEVENBITS, 8: EIGHTBITS}.get(n, EIGHTBITS)
+        return _BYTESIZE_MAP.get(n, serial.EIGHTBITS)
 
     @staticmethod
     def _to_parity(p: str):
-        from serial import PARITY_NONE, PARITY_EVEN, PARITY_ODD, PARITY_MARK, PARITY_SPACE
-        return {
-            "N": PARITY_NONE, "NONE": PARITY_NONE,
-            "E": PARITY_EVEN, "EVEN": PARITY_EVEN,
-            "O": PARITY_ODD,  "ODD": PARITY_ODD,
-            "M": PARITY_MARK, "MARK": PARITY_MARK,
-            "S": PARITY_SPACE, "SPACE": PARITY_SPACE,
-        }.get(p.upper(), PARITY_NONE)
+        return _PARITY_MAP.get(p.upper(), serial.PARITY_NONE)
 
     @staticmethod
     def _to_stopbits(n: int):
-        from serial import STOPBITS_ONE, STOPBITS_ONE_POINT_FIVE, STOPBITS_TWO
-        return {1: STOPBITS_ONE, 2: STOPBITS_TWO}.get(n, STOPBITS_ONE)
+        return _STOPBITS_MAP.get(n, serial.STOPBITS_ONE)
@@ -19,6 +19,25 @@ class CalibrationUiMixin:
                 return tab_widget.widget(index), index
         return None, -1
 
+    def _append_to_layout(self, layout, widget, stretch: bool = False):
+        """Append ``widget`` below the current content of ``layout``, spanning all grid columns."""
+        if isinstance(layout, QGridLayout):
+            row = layout.rowCount()
+            col_span = max(1, layout.columnCount())
+            layout.addWidget(widget, row, 0, 1, col_span)
+            if stretch:
+                layout.setRowStretch(row, 1)
+                for column in range(col_span):
+                    if layout.columnStretch(column) != 1:
+                        layout.setColumnStretch(column, 1)
+        elif stretch:
+            try:
+                layout.addWidget(widget, 1)
+            except TypeError:
+                layout.addWidget(widget)
+        else:
+            layout.addWidget(widget)
+
     def _setup_calibration_tab(self):
         """
         Insert the plot widget in the calibration tab and make it fill the space.
@@ -54,18 +73,7 @@ class CalibrationUiMixin:
             self.calib_plots = CalibrationPlots(target_container)
             self.calib_plots.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
 
-            if isinstance(layout, QGridLayout):
-                row = layout.rowCount()
-                col_span = max(1, layout.columnCount())
-                layout.addWidget(self.calib_plots, row, 0, 1, col_span)
-                layout.setRowStretch(row, 1)
-                for column in range(col_span or 1):
-                    layout.setColumnStretch(column, 1)
-            else:
-                try:
-                    layout.addWidget(self.calib_plots, 1)
-                except TypeError:
-                    layout.addWidget(self.calib_plots)
+            self._append_to_layout(layout, self.calib_plots, stretch=True)
 
         try:
             self.logger.info(f"Calibration tab ready (created={created}, index={index})")
@@ -75,12 +83,9 @@ class CalibrationUiMixin:
     def refresh_calibration_plots(self, step_s: float = 2.0):
         """
         Build the AOS->LOS track for the 'primary' key and feed the plots.
+        The propagation runs in a worker thread; see request_calibration_plot_refresh.
         """
-        try:
-            track = self._build_calibration_track(step_s=step_s)
-            self._apply_calibration_track(track)
-        except Exception as exc:
-            self.logger.error(f"Erreur refresh_calibration_plots: {exc}")
+        self.request_calibration_plot_refresh(step_s=step_s)
 
     def request_calibration_plot_refresh(self, step_s: float = 2.0):
         """Build the pass track in a worker thread, then update the plots on the UI thread."""
@@ -91,7 +96,7 @@ class CalibrationUiMixin:
                 return
 
             if not getattr(self, "thread_manager", None):
-                self.refresh_calibration_plots(step_s=step_s)
+                self.logger.warning("request_calibration_plot_refresh: thread_manager indisponible -> abort")
                 return
 
             if hasattr(self, "logger"):
@@ -124,10 +129,7 @@ class CalibrationUiMixin:
             raise AttributeError("EphemerisService.build_pass_track_for_key est introuvable")
         if hasattr(self, "logger"):
             self.logger.info("refresh_calibration_plots: construction du pass track...")
-        track = self.ephem.build_pass_track_for_key("primary", step_s=step_s)
-        if track and "az" not in track and "az_deg" in track:
-            track = {**track, "az": track.get("az_deg"), "el": track.get("el_deg")}
-        return track
+        return self.ephem.build_pass_track_for_key("primary", step_s=step_s)
 
     def _ensure_calibration_plots_ready(self) -> bool:
         if getattr(self, "calib_plots", None):
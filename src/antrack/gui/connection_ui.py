@@ -1,10 +1,11 @@
 """Connection and live-telemetry UI extraction for MainUi."""
 
 from __future__ import annotations
+from contextlib import suppress
 from datetime import datetime
 from time import monotonic
 
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import QTimer, Qt
 from PyQt5.QtWidgets import QComboBox, QFrame, QGridLayout, QLabel, QMessageBox, QSizePolicy
 
 from antrack.core.antenna.config import load_antenna_connection_config
@@ -20,6 +21,7 @@ from antrack.core.antenna.operational_status import (
 )
 from antrack.core.antenna.controller_qt import AntennaControllerQt
 from antrack.core.axis.axis_client import AxisClientPollingAdapter
+from antrack.gui.tracking_ui import cached_tracker_running
 from antrack.gui.ui_styles import (
     green_label_color,
     lightgrey_label_color,
@@ -35,6 +37,68 @@ _AXIS_DRIVER_REFERENCE_WARNING = "Antenna not referenced - pass AZ/EL index befo
 _INDEX_PASSING_BLUE = "color: white; background-color: #2F80ED;"
 _TOP_BANNER_GROUP_HEIGHT = 82
 _ANTENNA_LINK_FIELD_WIDTH = 150
+_TELEMETRY_FLUSH_INTERVAL_MS = 50
+_NUM = (int, float)
+_SERVER_STATUS_STYLES = {
+    "CONNECTED": green_label_color,
+    "DISCONNECTED": red_label_color,
+}
+_DATA_LABEL_ATTRS = (
+    "label_axisapp_version",
+    "label_axisaz_version",
+    "label_axisel_version",
+    "label_antenna_az_rate",
+    "label_antenna_el_rate",
+    "label_antenna_az_setrate",
+    "label_antenna_el_setrate",
+    "label_antenna_endstop_az",
+    "label_antenna_endstop_el",
+    "label_antenna_index_az",
+    "label_antenna_index_el",
+    "label_antenna_status_az",
+    "label_antenna_status_el",
+)
+_DATA_LABEL_ENTRIES = tuple((attr, None) for attr in _DATA_LABEL_ATTRS)
+_DEFAULT_LABEL_TEXTS = (
+    ("label_axisapp_version", ""),
+    ("label_axisaz_version", ""),
+    ("label_axisel_version", ""),
+    ("label_antenna_az_rate", "0.00 °/s"),
+    ("label_antenna_el_rate", "0.00 °/s"),
+    ("label_antenna_az_setrate", "--"),
+    ("label_antenna_el_setrate", "--"),
+    ("label_antenna_endstop_az", "-"),
+    ("label_antenna_endstop_el", "-"),
+    ("label_antenna_az_set_deg", "---.--°"),
+    ("label_antenna_el_set_deg", "---.--°"),
+    ("label_object_distance_km", "-"),
+    ("label_tracked_object", "-"),
+    ("target_ra_label", "-"),
+    ("target_dec_label", "-"),
+    ("target_dist_au_label", "-"),
+    ("target_visible_now_label", "-"),
+    ("target_aos_label", "-"),
+    ("target_los_label", "-"),
+    ("target_dur_label", "-"),
+    ("target_max_el_label", "-"),
+    ("target_max_el_time_label", "-"),
+    ("target_el_now_label", "-"),
+)
+
+
+_AXIS_STATE_TEXT_CACHE: dict = {}
+
+
+def axis_state_text(state) -> str:
+    """Return the label text of an axis motion state, memoized per state value."""
+    try:
+        return _AXIS_STATE_TEXT_CACHE[state]
+    except KeyError:
+        text = getattr(state, "display_name", None) or getattr(state, "name", str(state))
+        _AXIS_STATE_TEXT_CACHE[state] = text
+        return text
+    except TypeError:
+        return getattr(state, "display_name", None) or getattr(state, "name", str(state))
 
 
 def format_antenna_endpoint_summary(config, mode: str | None = None) -> str:
@@ -311,6 +375,9 @@ class ConnectionUiMixin:
             layout.setContentsMargins(0, 0, 0, 0)
             layout.setSpacing(4)
 
+        self._label_refs_cache = None
+        self._set_plain_text_labels("data", _DATA_LABEL_ENTRIES)
+
     def selected_antenna_mode(self) -> str:
         combo = getattr(self, "combo_antenna_mode", None)
         if combo is None:
@@ -570,14 +637,18 @@ class ConnectionUiMixin:
         button = getattr(self, "pushButton_antenna_track", None)
         if button is None:
             return
-        tracker_running = bool(getattr(self, "tracker", None) and self.tracker.is_running())
+        tracker_running = cached_tracker_running(self)
         positioner_running = bool(getattr(self, "positioner", None) and self.positioner.is_running())
         can_stop_motion = tracker_running or positioner_running
-        button.setEnabled(bool(self.has_connection() and (can_stop_motion or current_permission.allowed)))
+        # While AxisPrime builds the tracker, Track would race it with a second, GUI-built tracker
+        priming = bool(getattr(self, "_tracker_priming", False))
+        button.setEnabled(
+            bool(self.has_connection() and (can_stop_motion or (current_permission.allowed and not priming)))
+        )
         button.setToolTip("" if current_permission.allowed or can_stop_motion else current_permission.message())
 
     def _handle_active_tracking_permission(self, permission: TrackingPermission):
-        tracker_running = bool(getattr(self, "tracker", None) and self.tracker.is_running())
+        tracker_running = cached_tracker_running(self)
         if permission.allowed:
             self._last_tracking_inhibit_signature = None
             return
@@ -610,15 +681,18 @@ class ConnectionUiMixin:
     def stop_polling_threads(self):
         """Stop Axis polling threads and ephemeris workers."""
         try:
-            if hasattr(self, "thread_manager") and self.thread_manager:
+            thread_manager = getattr(self, "thread_manager", None)
+            if thread_manager:
                 for name in ("AxisPositionPoller", "AxisStatusPoller"):
                     try:
-                        self.thread_manager.stop_thread(name)
+                        thread_manager.stop_thread(name)
                     except Exception:
                         pass
-            if hasattr(self, "ephem"):
+            self.axis_polling = None
+            ephem = getattr(self, "ephem", None)
+            if ephem is not None:
                 try:
-                    self.ephem.stop_all()
+                    ephem.stop_all()
                 except Exception:
                     pass
         except Exception as exc:
@@ -650,6 +724,7 @@ class ConnectionUiMixin:
         try:
             self._user_requested_disconnect = True
             self._auto_restart_tracking = False
+            self._tracker_priming = False
 
             try:
                 self.pushButton_server_connect.setEnabled(False)
@@ -663,26 +738,29 @@ class ConnectionUiMixin:
             except Exception:
                 pass
             try:
-                if getattr(self, "tracker", None):
+                if self.tracker:
                     self.tracker.stop()
             except Exception:
                 pass
+            self._tracker_running_cache = None
             try:
-                if getattr(self, "positioner", None):
+                if self.positioner:
                     self.positioner.stop()
             except Exception:
                 pass
             try:
-                if hasattr(self, "_stop_manual_jog"):
-                    self._stop_manual_jog("az")
-                    self._stop_manual_jog("el")
+                stop_manual_jog = getattr(self, "_stop_manual_jog", None)
+                if stop_manual_jog is not None:
+                    stop_manual_jog("az")
+                    stop_manual_jog("el")
             except Exception:
                 pass
             self.stop_polling_threads()
             self.axis_polling = None
+            self._discard_pending_telemetry()
 
             try:
-                if getattr(self, "axis_client", None):
+                if self.axis_client:
                     try:
                         self.axis_client.blockSignals(True)
                     except Exception:
@@ -695,13 +773,15 @@ class ConnectionUiMixin:
                         ("versions_updated", self.ui_display_versions),
                     ):
                         try:
-                            if hasattr(self.axis_client, sig):
-                                getattr(self.axis_client, sig).disconnect(slot)
+                            signal = getattr(self.axis_client, sig, None)
+                            if signal is not None:
+                                signal.disconnect(slot)
                         except Exception:
                             pass
                     try:
-                        if hasattr(self.axis_client, "set_auto_reconnect"):
-                            self.axis_client.set_auto_reconnect(False)
+                        set_auto_reconnect = getattr(self.axis_client, "set_auto_reconnect", None)
+                        if set_auto_reconnect is not None:
+                            set_auto_reconnect(False)
                         elif hasattr(self.axis_client, "auto_reconnect"):
                             self.axis_client.auto_reconnect = False
                     except Exception:
@@ -709,7 +789,7 @@ class ConnectionUiMixin:
             except Exception:
                 pass
 
-            if getattr(self, "axis_client", None):
+            if self.axis_client:
                 try:
                     self.axis_client.disconnect()
                 except Exception as exc:
@@ -720,6 +800,7 @@ class ConnectionUiMixin:
                     except Exception:
                         pass
                     self.axis_client = None
+                    self._axis_status = None
 
             try:
                 self.thread_manager.stop_thread("AxisConnWatchdog")
@@ -772,44 +853,42 @@ class ConnectionUiMixin:
 
     def on_connection_success(self, axis_client):
         """Called when the connection to the Axis server succeeds."""
-        if getattr(self, "_user_requested_disconnect", False):
+        if self._user_requested_disconnect:
             self.logger.info("Connexion etablie mais l'utilisateur a demande la deconnexion -> teardown immediat.")
-            try:
+            with suppress(Exception):
                 axis_client.disconnect()
-            except Exception:
-                pass
-            try:
+            with suppress(Exception):
                 axis_client.deleteLater()
-            except Exception:
-                pass
             return
 
         self.axis_client = axis_client
+        # The controller updates axis_status in place: keep one reference for the telemetry repaint.
+        self._axis_status = getattr(axis_client, "axis_status", None)
         self.status_bar.showMessage(f"Connected to {self.axis_client.backend_name}")
         self._refresh_connection_panel()
 
-        if hasattr(self.axis_client, "connection_state_changed"):
-            self.axis_client.connection_state_changed.connect(self.on_axis_connection_state_changed)
-        if hasattr(self.axis_client, "connection_failed"):
-            self.axis_client.connection_failed.connect(self.on_axis_connection_failed)
-        if hasattr(self.axis_client, "antenna_telemetry_updated"):
-            self.axis_client.antenna_telemetry_updated.connect(self.ui_display_antenna_status)
-            try:
-                self.axis_client.antenna_telemetry_updated.connect(self.on_antenna_telemetry_ready)
-            except Exception:
-                pass
-        try:
-            az0 = getattr(getattr(self.axis_client, "antenna", None), "az", None)
-            el0 = getattr(getattr(self.axis_client, "antenna", None), "el", None)
-            self.telemetry_ready = isinstance(az0, (int, float)) and isinstance(el0, (int, float))
-        except Exception:
-            self.telemetry_ready = False
-        if hasattr(self.axis_client, "versions_updated"):
-            self.axis_client.versions_updated.connect(self.ui_display_versions)
-            try:
-                self.axis_client.emit_versions()
-            except Exception as exc:
-                self.logger.error(f"Impossible de declencher l'emission des versions: {exc}")
+        state_signal = getattr(self.axis_client, "connection_state_changed", None)
+        if state_signal is not None:
+            self._rewire_signal(state_signal, self.on_axis_connection_state_changed)
+        failed_signal = getattr(self.axis_client, "connection_failed", None)
+        if failed_signal is not None:
+            self._rewire_signal(failed_signal, self.on_axis_connection_failed)
+        telemetry_signal = getattr(self.axis_client, "antenna_telemetry_updated", None)
+        if telemetry_signal is not None:
+            # Telemetry is emitted from polling threads: always deliver on the GUI thread.
+            self._rewire_signal(telemetry_signal, self.ui_display_antenna_status, Qt.QueuedConnection)
+            self._rewire_signal(telemetry_signal, self.on_antenna_telemetry_ready, Qt.QueuedConnection)
+        antenna = getattr(self.axis_client, "antenna", None)
+        self.telemetry_ready = isinstance(getattr(antenna, "az", None), _NUM) and isinstance(getattr(antenna, "el", None), _NUM)
+        versions_signal = getattr(self.axis_client, "versions_updated", None)
+        if versions_signal is not None:
+            self._rewire_signal(versions_signal, self.ui_display_versions)
+            emit_versions = getattr(self.axis_client, "emit_versions", None)
+            if emit_versions is not None:
+                try:
+                    emit_versions()
+                except Exception as exc:
+                    self.logger.error(f"Impossible de declencher l'emission des versions: {exc}")
 
         self.pushButton_server_connect.setText("DISCONNECT")
         self.set_server_status("CONNECTED")
@@ -818,25 +897,65 @@ class ConnectionUiMixin:
 
         self.start_polling()
 
+        with suppress(Exception):
+            self.thread_manager.stop_thread("TrackingLoop")
+        self.tracker = None
+        self._tracker_running_cache = None
+        self._set_tracker_priming(True)
+
+        # Priming talks to the controller and may block on the link: keep it off the GUI thread.
+        worker = self.thread_manager.start_thread("AxisPrime", self._prime_and_build_tracker)
+        worker.result.connect(self._on_tracker_ready)
+        worker.error.connect(self._on_tracker_prime_error)
+
+    def _set_tracker_priming(self, priming: bool) -> None:
+        """Keep Track disabled while AxisPrime is building the tracker."""
+        self._tracker_priming = priming
+        with suppress(Exception):
+            self._refresh_tracking_permission_ui()
+
+    def _on_tracker_prime_error(self, msg: str) -> None:
+        self.logger.error(f"Impossible d'initialiser le tracker: {msg}")
+        self._set_tracker_priming(False)
+
+    @staticmethod
+    def _rewire_signal(signal, slot, *connection_type) -> None:
+        """Connect ``slot`` exactly once, dropping a binding left over from a previous connection."""
+        with suppress(TypeError, RuntimeError):
+            signal.disconnect(slot)
+        signal.connect(slot, *connection_type)
+
+    def _prime_and_build_tracker(self):
+        """Reset controller motion state and build the tracker (runs in the AxisPrime worker)."""
         try:
             self.prime_axis_motion()
         except Exception as exc:
             self.logger.error(f"prime_axis_motion apres reconnexion a echoue: {exc}")
+        return Tracker(self.axis_client, self.settings, self.thread_manager, self.tracked_object)
 
-        try:
-            self.thread_manager.stop_thread("TrackingLoop")
-        except Exception:
-            pass
+    def _on_tracker_ready(self, tracker):
+        """Install the tracker built by AxisPrime and resume tracking if requested."""
+        self._set_tracker_priming(False)
+        if self._user_requested_disconnect or tracker.axis_client_qt is not self.axis_client:
+            self.logger.info("Tracker construit pour une connexion obsolete -> ignore.")
+            return
+        if self.tracker is not None:
+            # A tracker already installed (and possibly registered with the TrackingManager) wins
+            self.logger.info("Tracker deja installe -> tracker AxisPrime ignore.")
+            return
 
         try:
-            self.tracker = Tracker(self.axis_client, self.settings, self.thread_manager, self.tracked_object)
+            self.tracker = tracker
+            self._tracker_running_cache = None
             try:
-                if hasattr(self.tracker, "mark_speeds_dirty"):
-                    self.tracker.mark_speeds_dirty()
+                mark_speeds_dirty = getattr(self.tracker, "mark_speeds_dirty", None)
+                if mark_speeds_dirty is not None:
+                    mark_speeds_dirty()
             except Exception:
                 pass
-            if hasattr(self, "pushButton_antenna_track"):
-                self.pushButton_antenna_track.setText("Track")
+            track_button = getattr(self, "pushButton_antenna_track", None)
+            if track_button is not None:
+                track_button.setText("Track")
                 self._refresh_tracking_permission_ui()
 
         except Exception as exc:
@@ -862,7 +981,7 @@ class ConnectionUiMixin:
 
     def on_axis_connection_failed(self, message: str):
         """Handle disconnect/failure reported by AxisClientQt."""
-        if getattr(self, "_user_requested_disconnect", False):
+        if self._user_requested_disconnect:
             self.logger.info("Deconnexion demandee par l'utilisateur: aucune reconnexion automatique.")
             return
 
@@ -875,8 +994,9 @@ class ConnectionUiMixin:
             self.telemetry_ready = False
             self.stop_polling_threads()
             self.axis_polling = None
+            self._discard_pending_telemetry()
             try:
-                if getattr(self, "tracker", None):
+                if self.tracker:
                     self.tracker.stop()
             except Exception:
                 pass
@@ -885,8 +1005,9 @@ class ConnectionUiMixin:
             except Exception:
                 pass
             try:
-                if hasattr(self, "pushButton_antenna_track"):
-                    self.pushButton_antenna_track.setText("Track")
+                track_button = getattr(self, "pushButton_antenna_track", None)
+                if track_button is not None:
+                    track_button.setText("Track")
             except Exception:
                 pass
 
@@ -905,7 +1026,7 @@ class ConnectionUiMixin:
 
     def on_axis_connection_state_changed(self, state: str):
         """Update the UI according to connection state."""
-        if getattr(self, "_user_requested_disconnect", False):
+        if self._user_requested_disconnect:
             return
         try:
             normalized = (state or "").upper()
@@ -920,7 +1041,7 @@ class ConnectionUiMixin:
                 except Exception:
                     pass
                 try:
-                    if getattr(self, "tracker", None):
+                    if self.tracker:
                         self.tracker.stop()
                 except Exception:
                     pass
@@ -937,52 +1058,70 @@ class ConnectionUiMixin:
     def set_server_status(self, state: str):
         """Update the server status label with unified text and style."""
         normalized = (state or "").upper()
-        if normalized == "CONNECTED":
-            self.label_antenna_server_status.setText("CONNECTED")
-            self.label_antenna_server_status.setStyleSheet(green_label_color)
-        elif normalized == "DISCONNECTED":
-            self.label_antenna_server_status.setText("DISCONNECTED")
-            self.label_antenna_server_status.setStyleSheet(red_label_color)
-        else:
-            self.label_antenna_server_status.setText(normalized or "UNKNOWN")
-            self.label_antenna_server_status.setStyleSheet(standard_label_color)
+        label = self.label_antenna_server_status
+        self._set_label_text(label, normalized or "UNKNOWN")
+        self._set_label_style(label, _SERVER_STATUS_STYLES.get(normalized, standard_label_color))
+
+    def _cached_label_refs(self, key: str, entries) -> tuple:
+        """Resolve ``(attr, value)`` entries to ``(widget, value)`` once per UI layout and cache them."""
+        cache = getattr(self, "_label_refs_cache", None)
+        if cache is None:
+            cache = {}
+            self._label_refs_cache = cache
+        refs = cache.get(key)
+        if refs is None:
+            refs = tuple(
+                (widget, value)
+                for attr, value in entries
+                if (widget := getattr(self, attr, None)) is not None
+            )
+            cache[key] = refs
+        return refs
+
+    def _set_plain_text_labels(self, key: str, entries):
+        """Live value labels never hold markup: skip QLabel's rich-text detection and text hit-testing."""
+        for widget, _ in self._cached_label_refs(key, entries):
+            widget.setTextFormat(Qt.PlainText)
+            widget.setTextInteractionFlags(Qt.NoTextInteraction)
+
+    def _suspend_window_updates(self):
+        """Disable repaints of the central widget; return it so the caller can re-enable them."""
+        central_widget = getattr(self, "centralWidget", None)
+        container = central_widget() if central_widget is not None else None
+        if container is None or not container.updatesEnabled():
+            return None
+        container.setUpdatesEnabled(False)
+        return container
 
     def set_data_labels_enabled(self, enabled: bool):
         """Enable or disable live data labels."""
+        container = self._suspend_window_updates()
         try:
-            for attr in (
-                "label_axisapp_version",
-                "label_axisaz_version",
-                "label_axisel_version",
-                "label_antenna_az_rate",
-                "label_antenna_el_rate",
-                "label_antenna_az_setrate",
-                "label_antenna_el_setrate",
-                "label_antenna_endstop_az",
-                "label_antenna_endstop_el",
-                "label_antenna_index_az",
-                "label_antenna_index_el",
-                "label_antenna_status_az",
-                "label_antenna_status_el",
-            ):
-                if hasattr(self, attr):
-                    getattr(self, attr).setEnabled(enabled)
+            for widget, _ in self._cached_label_refs("data", _DATA_LABEL_ENTRIES):
+                widget.setEnabled(enabled)
         except Exception as exc:
             self.logger.error(f"Erreur set_data_labels_enabled: {exc}")
+        finally:
+            if container is not None:
+                container.setUpdatesEnabled(True)
 
     def start_polling(self):
         """
         Start polling threads via the core adapter.
         """
         try:
-            if hasattr(self, "axis_polling") and self.axis_polling is not None:
+            axis_polling = self.axis_polling
+            if axis_polling is not None and axis_polling.client is self.axis_client:
+                # Same controller already polled (e.g. a repeated CONNECTED transition): keep its threads.
+                return
+            if axis_polling is not None:
                 try:
-                    self.axis_polling.stop()
+                    axis_polling.stop()
                 except Exception:
                     pass
             pos_interval = 0.2
             status_interval = 1.0
-            if getattr(self, "axis_client", None) is not None:
+            if self.axis_client is not None:
                 try:
                     pos_interval, status_interval = getattr(self.axis_client, "polling_intervals", (0.2, 1.0))
                 except Exception:
@@ -997,64 +1136,23 @@ class ConnectionUiMixin:
 
     def ui_set_default_state(self):
         """Apply the default disconnected UI state."""
+        container = self._suspend_window_updates()
         try:
             self._reset_reference_latches()
-            if hasattr(self, "label_axisapp_version"):
-                self.label_axisapp_version.setText("")
+            self._label_text_cache = {}
+            self._label_value_cache = {}
+            self._label_style_cache = {}
             if hasattr(self, "label_antenna_endpoint_summary"):
                 self.label_antenna_endpoint_summary.setStyleSheet(standard_label_color)
-            if hasattr(self, "label_axisaz_version"):
-                self.label_axisaz_version.setText("")
-            if hasattr(self, "label_axisel_version"):
-                self.label_axisel_version.setText("")
-            # self.label_antenna_az_deg.setText("---.--°")
-            # self.label_antenna_el_deg.setText("---.--°")
-            if hasattr(self, "label_antenna_az_rate"):
-                self.label_antenna_az_rate.setText("0.00 °/s")
-            if hasattr(self, "label_antenna_el_rate"):
-                self.label_antenna_el_rate.setText("0.00 °/s")
-            if hasattr(self, "label_antenna_az_setrate"):
-                self.label_antenna_az_setrate.setText("--")
-            if hasattr(self, "label_antenna_el_setrate"):
-                self.label_antenna_el_setrate.setText("--")
-            if hasattr(self, "label_antenna_endstop_az"):
-                self.label_antenna_endstop_az.setText("-")
-            if hasattr(self, "label_antenna_endstop_el"):
-                self.label_antenna_endstop_el.setText("-")
-            if hasattr(self, "label_antenna_az_set_deg"):
-                self.label_antenna_az_set_deg.setText("---.--°")
-            if hasattr(self, "label_antenna_el_set_deg"):
-                self.label_antenna_el_set_deg.setText("---.--°")
-            if hasattr(self, "label_object_distance_km"):
-                self.label_object_distance_km.setText("-")
-            if hasattr(self, "label_tracked_object"):
-                self.label_tracked_object.setText("-")
-
-            self.g1.set_setpoint(None)
-            self.g1.set_angle(None)
-            self.g1.set_error(None)
-            self.g2.set_setpoint(None)
-            self.g2.set_angle(None)
-            self.g2.set_error(None)
-
-            for attr in (
-                "target_ra_label",
-                "target_dec_label",
-                "target_dist_au_label",
-                "target_visible_now_label",
-                "target_aos_label",
-                "target_los_label",
-                "target_dur_label",
-                "target_max_el_label",
-                "target_max_el_time_label",
-                "target_el_now_label",
-            ):
+            for widget, text in self._cached_label_refs("default_text", _DEFAULT_LABEL_TEXTS):
                 try:
-                    if hasattr(self, attr):
-                        getattr(self, attr).setText("-")
+                    widget.setText(text)
                 except Exception:
                     pass
 
+            self.g1.set_state(None, None, None)
+            self.g2.set_state(None, None, None)
+
             self.set_server_status("DISCONNECTED")
 
             try:
@@ -1074,31 +1172,97 @@ class ConnectionUiMixin:
 
         except Exception as exc:
             self.logger.error(f"Erreur ui_set_default_state: {exc}")
+        finally:
+            if container is not None:
+                container.setUpdatesEnabled(True)
 
     def ui_display_versions(self, versions: dict):
         """Update server/driver version labels when connected."""
         try:
             if not isinstance(versions, dict):
                 return
-            if hasattr(self, "label_axisapp_version"):
+            app_label = getattr(self, "label_axisapp_version", None)
+            if app_label is not None:
                 version_text = str(versions.get("server_version") or getattr(self.axis_client, "backend_name", "") or "")
-                self.label_axisapp_version.setText(version_text)
-            if hasattr(self, "label_axisaz_version"):
-                self.label_axisaz_version.setText(str(versions.get("driver_version_az") or ""))
-            if hasattr(self, "label_axisel_version"):
-                self.label_axisel_version.setText(str(versions.get("driver_version_el") or ""))
+                app_label.setText(version_text)
+            az_label = getattr(self, "label_axisaz_version", None)
+            if az_label is not None:
+                az_label.setText(str(versions.get("driver_version_az") or ""))
+            el_label = getattr(self, "label_axisel_version", None)
+            if el_label is not None:
+                el_label.setText(str(versions.get("driver_version_el") or ""))
         except Exception as exc:
             self.logger.error(f"Erreur ui_display_versions: {exc}")
 
     def ui_display_antenna_status(self, data: dict):
+        """Queue a telemetry snapshot and repaint once per coalescing window."""
+        if not isinstance(data, dict):
+            return
+        self._pending_telemetry = data
+        timer = getattr(self, "_telemetry_flush_timer", None)
+        if timer is None:
+            timer = QTimer(self)
+            timer.setSingleShot(True)
+            timer.setInterval(_TELEMETRY_FLUSH_INTERVAL_MS)
+            timer.timeout.connect(self._flush_telemetry)
+            self._telemetry_flush_timer = timer
+        if not timer.isActive():
+            timer.start()
+
+    def _discard_pending_telemetry(self):
+        self._pending_telemetry = None
+        timer = getattr(self, "_telemetry_flush_timer", None)
+        if timer is not None:
+            timer.stop()
+
+    def _flush_telemetry(self):
+        data = getattr(self, "_pending_telemetry", None)
+        self._pending_telemetry = None
+        if data is not None:
+            self._display_antenna_status(data)
+
+    def _set_label_text(self, label, text: str) -> None:
+        """Call ``setText`` only when the label text actually changes."""
+        cache = getattr(self, "_label_text_cache", None)
+        if cache is None:
+            cache = self._label_text_cache = {}
+        if cache.get(label) != text:
+            label.setText(text)
+            cache[label] = text
+
+    def _set_label_number(self, label, value, decimals: int, suffix: str = "", missing: str = "--") -> None:
+        """Format ``value`` only when its displayed rounding changes, then update the label."""
+        cache = getattr(self, "_label_value_cache", None)
+        if cache is None:
+            cache = self._label_value_cache = {}
+        shown = round(value, decimals) if isinstance(value, _NUM) else None
+        key = (shown, decimals)
+        if cache.get(label) == key:
+            return
+        cache[label] = key
+        self._set_label_text(label, missing if shown is None else f"{shown:.{decimals}f}{suffix}")
+
+    def _set_label_style(self, label, style: str) -> None:
+        """Call ``setStyleSheet`` only when the label style actually changes."""
+        cache = getattr(self, "_label_style_cache", None)
+        if cache is None:
+            cache = self._label_style_cache = {}
+        if cache.get(label) != style:
+            label.setStyleSheet(style)
+            cache[label] = style
+
+    def _display_antenna_status(self, data: dict):
         """Unified live update of antenna labels and gauges."""
         try:
             if not isinstance(data, dict):
                 return
             if not self._accept_antenna_telemetry_payload(data):
                 return
+            is_num = isinstance
             az = data.get("az")
             el = data.get("el")
+            az_ok = is_num(az, _NUM)
+            el_ok = is_num(el, _NUM)
             # self.label_antenna_az_deg.setText(f"{az:.2f}°" if isinstance(az, (int, float)) else "---.--°")
             self.g1.set_angle(az)
             # self.label_antenna_el_deg.setText(f"{el:.2f}°" if isinstance(el, (int, float)) else "---.--°")
@@ -1108,52 +1272,41 @@ class ConnectionUiMixin:
             el_rate = data.get("el_rate")
             antenna_settings = self.settings.get("ANTENNA", self.settings.get("antenna", {})) if isinstance(self.settings, dict) else {}
             rate_decimals = max(0, min(5, int(antenna_settings.get("rate_display_decimals", 3))))
-            self.label_antenna_az_rate.setText(
-                f"{az_rate:.{rate_decimals}f} °/s" if isinstance(az_rate, (int, float)) else f"{0.0:.{rate_decimals}f} °/s"
-            )
-            self.label_antenna_el_rate.setText(
-                f"{el_rate:.{rate_decimals}f} °/s" if isinstance(el_rate, (int, float)) else f"{0.0:.{rate_decimals}f} °/s"
-            )
+            self._set_label_number(self.label_antenna_az_rate, az_rate if is_num(az_rate, _NUM) else 0.0, rate_decimals, " °/s")
+            self._set_label_number(self.label_antenna_el_rate, el_rate if is_num(el_rate, _NUM) else 0.0, rate_decimals, " °/s")
 
-            self.label_antenna_az_setrate.setText(f"{data.get('az_setrate'):.0f}")
-            self.label_antenna_el_setrate.setText(f"{data.get('el_setrate'):.0f}")
+            self._set_label_number(self.label_antenna_az_setrate, data.get("az_setrate"), 0)
+            self._set_label_number(self.label_antenna_el_setrate, data.get("el_setrate"), 0)
 
             end_az = data.get("endstop_az")
             end_el = data.get("endstop_el")
-            self.label_antenna_endstop_az.setText(str(end_az) if end_az is not None else "-")
-            self.label_antenna_endstop_el.setText(str(end_el) if end_el is not None else "-")
+            self._set_label_text(self.label_antenna_endstop_az, str(end_az) if end_az is not None else "-")
+            self._set_label_text(self.label_antenna_endstop_el, str(end_el) if end_el is not None else "-")
             self._refresh_reference_status_panel(data)
 
-            try:
-                if isinstance(az, (int, float)):
-                    self._last_tel_az = az
-                if isinstance(el, (int, float)):
-                    self._last_tel_el = el
-            except Exception:
-                pass
+            if az_ok:
+                self._last_tel_az = az
+            if el_ok:
+                self._last_tel_el = el
 
             try:
-                status = (
-                    getattr(self.axis_client, "axis_status", None)
-                    if hasattr(self, "axis_client")
-                    else None
-                )
-                if isinstance(status, dict):
+                status = getattr(self, "_axis_status", None)
+                if status:
                     az_state = status.get("azimuth")
                     el_state = status.get("elevation")
                     az_text = None
                     el_text = None
                     if az_state is not None:
-                        az_text = getattr(az_state, "display_name", None) or getattr(az_state, "name", str(az_state))
-                        self.label_antenna_az_status.setText(az_text)
+                        az_text = axis_state_text(az_state)
+                        self._set_label_text(self.label_antenna_az_status, az_text)
                         az_status_color = green_label_color if az_text != "STOP" else orange_label_color
-                        self.label_antenna_az_status.setStyleSheet(az_status_color)
+                        self._set_label_style(self.label_antenna_az_status, az_status_color)
                     if el_state is not None:
-                        el_text = getattr(el_state, "display_name", None) or getattr(el_state, "name", str(el_state))
-                        self.label_antenna_el_status.setText(el_text)
+                        el_text = axis_state_text(el_state)
+                        self._set_label_text(self.label_antenna_el_status, el_text)
                         el_status_color = green_label_color if el_text != "STOP" else orange_label_color
-                        self.label_antenna_el_status.setStyleSheet(el_status_color)
+                        self._set_label_style(self.label_antenna_el_status, el_status_color)
             except Exception:
                 pass
         except Exception as exc:
-            self.logger.error(f"Erreur ui_display_antenna_status: {exc}")
+            self.logger.error(f"Erreur _display_antenna_status: {exc}")
@@ -2,14 +2,18 @@
 
 from __future__ import annotations
 
+import heapq
 import time
+from dataclasses import dataclass
 from datetime import datetime
 import logging
-from typing import Any, Dict, Optional
+from operator import itemgetter
+from typing import Any, Dict, List, Optional, Tuple
 
-from PyQt5.QtCore import Qt, QTimer, pyqtSlot
-from PyQt5.QtGui import QColor, QFont
+from PyQt5.QtCore import QAbstractTableModel, QModelIndex, Qt, QTimer, pyqtSlot
+from PyQt5.QtGui import QBrush, QColor, QFont
 from PyQt5.QtWidgets import (
+    QAbstractItemView,
     QApplication,
     QDialog,
     QDialogButtonBox,
@@ -17,8 +21,7 @@ from PyQt5.QtWidgets import (
     QHBoxLayout,
     QLabel,
     QPushButton,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QTabWidget,
     QTextEdit,
     QVBoxLayout,
@@ -27,6 +30,118 @@ from PyQt5.QtWidgets import (
 
 from antrack.threading_utils.thread_manager import TaskStatus, ThreadManager
 
+# One table row: (task name, cell texts, (status column, background brush) or None)
+_Row = Tuple[str, Tuple[str, ...], Optional[Tuple[int, QBrush]]]
+
+# Tab order; only the active tab is built up front, the others on first view
+ACTIVE_TAB, HISTORY_TAB, ERRORS_TAB = range(3)
+
+# Most recent finished tasks listed in the history tab
+HISTORY_ROWS_MAX = 500
+
+# Status backgrounds, built once and shared by every row and repaint
+_BG_RUNNING = QBrush(QColor(200, 230, 200))
+_BG_COMPLETED = QBrush(QColor(200, 230, 200))
+_BG_FAILED = QBrush(QColor(255, 200, 200))
+_BG_CANCELLED = QBrush(QColor(255, 230, 180))
+
+_STATUS_BACKGROUNDS = {
+    TaskStatus.RUNNING: _BG_RUNNING,
+    TaskStatus.FINISHED: _BG_COMPLETED,
+    TaskStatus.FAILED: _BG_FAILED,
+    TaskStatus.CANCELLED: _BG_CANCELLED,
+}
+_STATUS_TEXT = {status: status.value for status in TaskStatus}
+
+
+@dataclass
+class _DiagnosticsSnapshot:
+    """Task manager state fetched once and shared by the tables and detail dialogs."""
+
+    revision: Optional[int]
+    taken_at: float
+    stats: Dict[str, Dict[str, Any]]
+    running: Dict[str, Dict[str, Any]]
+    done: Dict[str, Dict[str, Any]]
+    exceptions: Dict[str, Dict[str, Any]]
+
+
+class _TaskTableModel(QAbstractTableModel):
+    """Read-only table over a list of rows; set_rows only signals the rows that changed."""
+
+    COLUMNS: Tuple[str, ...] = ()
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self._rows: List[_Row] = []
+
+    def rowCount(self, parent=QModelIndex()) -> int:  # noqa: N802 - Qt API
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()) -> int:  # noqa: N802 - Qt API
+        return 0 if parent.isValid() else len(self.COLUMNS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):  # noqa: N802 - Qt API
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal and 0 <= section < len(self.COLUMNS):
+            return self.COLUMNS[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or not (0 <= index.row() < len(self._rows)):
+            return None
+        name, texts, background = self._rows[index.row()]
+        if role == Qt.DisplayRole:
+            return texts[index.column()] if index.column() < len(texts) else None
+        if role == Qt.UserRole:
+            return name
+        if role == Qt.BackgroundRole and background is not None and background[0] == index.column():
+            return background[1]
+        return None
+
+    def task_name(self, row: int) -> Optional[str]:
+        return self._rows[row][0] if 0 <= row < len(self._rows) else None
+
+    def set_rows(self, rows: List[_Row]) -> None:
+        """Replace the rows, emitting remove/insert for the size change and dataChanged per changed row."""
+        previous = self._rows
+        if rows == previous:
+            return
+        old_count, new_count = len(previous), len(rows)
+        if new_count < old_count:
+            self.beginRemoveRows(QModelIndex(), new_count, old_count - 1)
+            del previous[new_count:]
+            self.endRemoveRows()
+        last_col = len(self.COLUMNS) - 1
+        for row in range(min(old_count, new_count)):
+            if previous[row] != rows[row]:
+                previous[row] = rows[row]
+                self.dataChanged.emit(self.index(row, 0), self.index(row, last_col))
+        if new_count > old_count:
+            self.beginInsertRows(QModelIndex(), old_count, new_count - 1)
+            previous.extend(rows[old_count:])
+            self.endInsertRows()
+
+
+class ActiveTasksModel(_TaskTableModel):
+    COLUMNS = ("Name", "Description", "Duration (s)", "Status", "Tags")
+
+
+class HistoryModel(_TaskTableModel):
+    COLUMNS = ("Name", "Description", "Started", "Duration (s)", "Status", "Tags")
+
+
+class ErrorsModel(_TaskTableModel):
+    COLUMNS = ("Task", "Time", "Exception", "Tags")
+
+
+def _task_table_view(model: _TaskTableModel) -> QTableView:
+    view = QTableView()
+    view.setModel(model)
+    view.horizontalHeader().setStretchLastSection(True)
+    view.setSelectionBehavior(QAbstractItemView.SelectRows)
+    view.setEditTriggers(QAbstractItemView.NoEditTriggers)
+    return view
+
 
 class TaskDetailsDialog(QDialog):
     """Dialog showing task details and traceback if available."""
@@ -95,11 +210,26 @@ class ThreadDiagnosticsUI(QWidget):
         self.task_manager = task_manager
         self.logger = logging.getLogger("ThreadDiagnosticsUI")
         self.update_interval = 1000
+        # Task manager revision shown by the tables; while unchanged only running durations advance
+        self._seen_revision: Optional[int] = None
+        self._snap: Optional[_DiagnosticsSnapshot] = None
+        # (task name, format) -> (timestamp, text); finished tasks keep their times between ticks
+        self._fmt_time_cache: Dict[Tuple[str, str], Tuple[float, str]] = {}
+        # task name -> (tags list of the snapshot it was joined from, joined text)
+        self._tags_cache: Dict[str, Tuple[Any, str]] = {}
         self.setup_ui()
 
+        # Periodic refresh only runs while the widget is shown (see showEvent/hideEvent)
         self.timer = QTimer(self)
+        self.timer.setInterval(self.update_interval)
         self.timer.timeout.connect(self.update_ui)
-        self.timer.start(self.update_interval)
+
+        # Refresh requests made within one event-loop pass collapse into a single update
+        self._dirty = False
+        self._coalesce_timer = QTimer(self)
+        self._coalesce_timer.setSingleShot(True)
+        self._coalesce_timer.setInterval(0)
+        self._coalesce_timer.timeout.connect(self._flush_update)
 
         self.update_ui()
 
@@ -113,23 +243,19 @@ class ThreadDiagnosticsUI(QWidget):
         self.header_label.setAlignment(Qt.AlignCenter)
         main_layout.addWidget(self.header_label)
 
-        tabs = QTabWidget()
+        self.tabs = QTabWidget()
 
         active_tasks_widget = QWidget()
         active_layout = QVBoxLayout(active_tasks_widget)
 
-        self.active_tasks_table = QTableWidget(0, 5)
-        self.active_tasks_table.setHorizontalHeaderLabels(
-            ["Name", "Description", "Duration (s)", "Status", "Tags"]
-        )
-        self.active_tasks_table.horizontalHeader().setStretchLastSection(True)
-        self.active_tasks_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.active_tasks_table.itemDoubleClicked.connect(self.show_task_details)
+        self.active_tasks_model = ActiveTasksModel(self)
+        self.active_tasks_table = _task_table_view(self.active_tasks_model)
+        self.active_tasks_table.doubleClicked.connect(self.show_task_details)
         active_layout.addWidget(self.active_tasks_table)
 
         active_buttons_layout = QHBoxLayout()
         self.refresh_button = QPushButton("Refresh")
-        self.refresh_button.clicked.connect(self.update_ui)
+        self.refresh_button.clicked.connect(self.request_refresh)
         self.cancel_task_button = QPushButton("Cancel selected")
         self.cancel_task_button.clicked.connect(self.cancel_selected_task)
         self.cancel_all_button = QPushButton("Cancel all")
@@ -139,212 +265,285 @@ class ThreadDiagnosticsUI(QWidget):
         active_buttons_layout.addWidget(self.cancel_all_button)
         active_layout.addLayout(active_buttons_layout)
 
-        tabs.addTab(active_tasks_widget, "Active tasks")
+        self.tabs.addTab(active_tasks_widget, "Active tasks")
 
-        history_widget = QWidget()
-        history_layout = QVBoxLayout(history_widget)
-
-        self.history_table = QTableWidget(0, 6)
-        self.history_table.setHorizontalHeaderLabels(
-            ["Name", "Description", "Started", "Duration (s)", "Status", "Tags"]
-        )
-        self.history_table.horizontalHeader().setStretchLastSection(True)
-        self.history_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.history_table.itemDoubleClicked.connect(self.show_task_details)
-        history_layout.addWidget(self.history_table)
+        # History and errors pages stay empty until first selected (see _ensure_tab_built)
+        self.history_model = HistoryModel(self)
+        self.errors_model = ErrorsModel(self)
+        self.history_table: Optional[QTableView] = None
+        self.errors_table: Optional[QTableView] = None
+        self.clear_history_button: Optional[QPushButton] = None
+        self.tabs.addTab(QWidget(), "History")
+        self.tabs.addTab(QWidget(), "Errors")
+        self.tabs.currentChanged.connect(self._on_tab_changed)
 
-        history_buttons_layout = QHBoxLayout()
-        self.clear_history_button = QPushButton("Clear history")
-        self.clear_history_button.clicked.connect(self.clear_history)
-        history_buttons_layout.addWidget(self.clear_history_button)
-        history_layout.addLayout(history_buttons_layout)
+        main_layout.addWidget(self.tabs)
 
-        tabs.addTab(history_widget, "History")
+    def showEvent(self, event) -> None:
+        self.update_ui()
+        self.timer.start(self.update_interval)
+        super().showEvent(event)
+
+    def hideEvent(self, event) -> None:
+        self.timer.stop()
+        super().hideEvent(event)
+
+    def _ensure_tab_built(self, index: int) -> None:
+        """Create the history or errors table the first time its tab is shown."""
+        page = self.tabs.widget(index)
+        if index == HISTORY_TAB and self.history_table is None:
+            history_layout = QVBoxLayout(page)
+
+            self.history_table = _task_table_view(self.history_model)
+            self.history_table.doubleClicked.connect(self.show_task_details)
+            history_layout.addWidget(self.history_table)
+
+            history_buttons_layout = QHBoxLayout()
+            self.clear_history_button = QPushButton("Clear history")
+            self.clear_history_button.clicked.connect(self.clear_history)
+            history_buttons_layout.addWidget(self.clear_history_button)
+            history_layout.addLayout(history_buttons_layout)
+        elif index == ERRORS_TAB and self.errors_table is None:
+            errors_layout = QVBoxLayout(page)
+
+            self.errors_table = _task_table_view(self.errors_model)
+            self.errors_table.doubleClicked.connect(self.show_error_details)
+            errors_layout.addWidget(self.errors_table)
+
+    @pyqtSlot(int)
+    def _on_tab_changed(self, index: int) -> None:
+        try:
+            self._ensure_tab_built(index)
+            self._render_current_tab(self._snapshot())
+        except Exception as exc:
+            self.logger.error("Diagnostics tab refresh failed: %s", exc)
+
+    def _render_current_tab(self, snap: _DiagnosticsSnapshot) -> None:
+        """Only the visible table is kept in sync; the others catch up when selected."""
+        index = self.tabs.currentIndex()
+        if index == ACTIVE_TAB:
+            self.update_active_tasks_table(snap.running)
+        elif index == HISTORY_TAB:
+            self.update_history_table(snap.done)
+        elif index == ERRORS_TAB:
+            self.update_errors_table(snap.exceptions, snap.stats)
 
-        errors_widget = QWidget()
-        errors_layout = QVBoxLayout(errors_widget)
+    @pyqtSlot()
+    def refresh_all(self) -> None:
+        """Force a full refresh, even if the task manager reports no change."""
+        self._seen_revision = None
+        self._snap = None
+        self.update_ui()
 
-        self.errors_table = QTableWidget(0, 4)
-        self.errors_table.setHorizontalHeaderLabels(["Task", "Time", "Exception", "Tags"])
-        self.errors_table.horizontalHeader().setStretchLastSection(True)
-        self.errors_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.errors_table.itemDoubleClicked.connect(self.show_error_details)
-        errors_layout.addWidget(self.errors_table)
+    def request_refresh(self) -> None:
+        """Schedule a forced full refresh for the next event-loop pass."""
+        self._seen_revision = None
+        self._snap = None
+        self._dirty = True
+        if not self._coalesce_timer.isActive():
+            self._coalesce_timer.start()
 
-        tabs.addTab(errors_widget, "Errors")
+    @pyqtSlot()
+    def _flush_update(self) -> None:
+        if self._dirty:
+            self._dirty = False
+            self.update_ui()
 
-        main_layout.addWidget(tabs)
+    def _snapshot(self, max_age: float = 0.25) -> _DiagnosticsSnapshot:
+        """Return the cached snapshot while the task manager revision (or, without one, max_age) allows."""
+        revision_fn = getattr(self.task_manager, "diagnostics_revision", None)
+        revision = revision_fn() if callable(revision_fn) else None
+        snap = self._snap
+        if snap is not None:
+            if revision is not None:
+                fresh = snap.revision == revision
+            else:
+                fresh = time.monotonic() - snap.taken_at <= max_age
+            if fresh:
+                return snap
+
+        stats = self.task_manager.get_diagnostics()
+        # Split once per snapshot so neither the header nor the history re-tests every status
+        running: Dict[str, Dict[str, Any]] = {}
+        done: Dict[str, Dict[str, Any]] = {}
+        for name, info in stats.items():
+            (running if info.get("status") == TaskStatus.RUNNING else done)[name] = info
+        snap = self._snap = _DiagnosticsSnapshot(
+            revision=revision,
+            taken_at=time.monotonic(),
+            stats=stats,
+            running=running,
+            done=done,
+            exceptions=self.task_manager.get_task_exceptions(),
+        )
+        return snap
 
     @pyqtSlot()
     def update_ui(self) -> None:
         """Refresh UI with latest diagnostics."""
         try:
-            stats = self.task_manager.get_diagnostics()
-            running_tasks = {
-                name: info for name, info in stats.items() if info.get("status") == TaskStatus.RUNNING
-            }
+            snap = self._snapshot()
+            if snap.revision is not None and snap.revision == self._seen_revision:
+                if self.tabs.currentIndex() == ACTIVE_TAB:
+                    self.update_active_tasks_table(snap.running)
+                return
+
+            stats = snap.stats
+            running_tasks = snap.running
 
             total_tasks = len(stats)
             active_tasks = len(running_tasks)
-            completed_tasks = sum(1 for s in stats.values() if s.get("status") == TaskStatus.FINISHED)
-            failed_tasks = sum(1 for s in stats.values() if s.get("status") == TaskStatus.FAILED)
+            completed_tasks = sum(1 for s in snap.done.values() if s.get("status") == TaskStatus.FINISHED)
+            failed_tasks = sum(1 for s in snap.done.values() if s.get("status") == TaskStatus.FAILED)
 
             self.header_label.setText(
                 f"Total: {total_tasks} | Active: {active_tasks} | "
                 f"Completed: {completed_tasks} | Failed: {failed_tasks}"
             )
 
-            self.update_active_tasks_table(running_tasks)
-            self.update_history_table(stats)
-            self.update_errors_table(self.task_manager.get_task_exceptions())
+            self._render_current_tab(snap)
+            self._seen_revision = snap.revision
         except Exception as exc:
             self.logger.error("Diagnostics UI update failed: %s", exc)
 
+    @staticmethod
+    def _status_cell(status: Any, col: int) -> Tuple[str, Optional[Tuple[int, QBrush]]]:
+        status_text = _STATUS_TEXT.get(status)
+        if status_text is None:
+            status_text = status.value if hasattr(status, "value") else str(status)
+        brush = _STATUS_BACKGROUNDS.get(status)
+        return status_text, ((col, brush) if brush is not None else None)
+
+    def _format_time(self, name: str, timestamp: Any, fmt: str) -> str:
+        if not timestamp:
+            return ""
+        key = (name, fmt)
+        cached = self._fmt_time_cache.get(key)
+        if cached is not None and cached[0] == timestamp:
+            return cached[1]
+        text = datetime.fromtimestamp(timestamp).strftime(fmt)
+        self._fmt_time_cache[key] = (timestamp, text)
+        return text
+
+    def _tags_text(self, name: str, info: Dict[str, Any]) -> str:
+        """Joined tags, recomputed only when a new snapshot brings a new tags list."""
+        tags = info.get("tags")
+        if not tags:
+            return ""
+        cached = self._tags_cache.get(name)
+        if cached is not None and cached[0] is tags:
+            return cached[1]
+        text = ", ".join(tags)
+        self._tags_cache[name] = (tags, text)
+        return text
+
     def update_active_tasks_table(self, running_tasks: Dict[str, Dict[str, Any]]) -> None:
-        self.active_tasks_table.setRowCount(0)
-        row = 0
+        now = time.time()
+        rows: List[_Row] = []
         for name, info in running_tasks.items():
-            self.active_tasks_table.insertRow(row)
-            name_item = QTableWidgetItem(name)
-            name_item.setData(Qt.UserRole, name)
-            self.active_tasks_table.setItem(row, 0, name_item)
-
-            desc_item = QTableWidgetItem(info.get("description", ""))
-            self.active_tasks_table.setItem(row, 1, desc_item)
-
             duration = 0.0
             if info.get("started_at"):
-                duration = max(0.0, time.time() - float(info.get("started_at")))
-            duration_item = QTableWidgetItem(f"{duration:.2f}")
-            self.active_tasks_table.setItem(row, 2, duration_item)
-
-            status = info.get("status", TaskStatus.RUNNING)
-            status_text = status.value if hasattr(status, "value") else str(status)
-            status_item = QTableWidgetItem(status_text)
-            if status == TaskStatus.RUNNING:
-                status_item.setBackground(QColor(200, 230, 200))
-            self.active_tasks_table.setItem(row, 3, status_item)
-
-            tags = info.get("tags", [])
-            tags_item = QTableWidgetItem(", ".join(tags))
-            self.active_tasks_table.setItem(row, 4, tags_item)
-            row += 1
-
-    def update_history_table(self, stats: Dict[str, Dict[str, Any]]) -> None:
-        self.history_table.setRowCount(0)
-        row = 0
-
-        def sort_key(item: tuple[str, Dict[str, Any]]) -> float:
-            return float(item[1].get("finished_at") or item[1].get("started_at") or 0.0)
-
-        for name, info in sorted(stats.items(), key=sort_key, reverse=True):
-            if info.get("status") == TaskStatus.RUNNING:
-                continue
-
-            self.history_table.insertRow(row)
-            name_item = QTableWidgetItem(name)
-            name_item.setData(Qt.UserRole, name)
-            self.history_table.setItem(row, 0, name_item)
-
-            desc_item = QTableWidgetItem(info.get("description", ""))
-            self.history_table.setItem(row, 1, desc_item)
-
-            start_time = info.get("started_at")
-            start_time_str = (
-                datetime.fromtimestamp(start_time).strftime("%H:%M:%S") if start_time else ""
+                duration = max(0.0, now - float(info.get("started_at")))
+            status_text, background = self._status_cell(info.get("status", TaskStatus.RUNNING), 3)
+            texts = (
+                name,
+                info.get("description", ""),
+                f"{duration:.2f}",
+                status_text,
+                self._tags_text(name, info),
             )
-            time_item = QTableWidgetItem(start_time_str)
-            self.history_table.setItem(row, 2, time_item)
+            rows.append((name, texts, background))
+        self.active_tasks_model.set_rows(rows)
 
+    def update_history_table(self, done: Dict[str, Dict[str, Any]]) -> None:
+        """List the most recent tasks that are no longer running (the snapshot's done mapping)."""
+        if self.history_table is None:
+            return
+        finished = [
+            (float(info.get("finished_at") or info.get("started_at") or 0.0), name, info)
+            for name, info in done.items()
+        ]
+
+        rows: List[_Row] = []
+        for _, name, info in heapq.nlargest(HISTORY_ROWS_MAX, finished, key=itemgetter(0)):
+            start_time_str = self._format_time(name, info.get("started_at"), "%H:%M:%S")
             duration = info.get("last_duration_s") or 0.0
-            duration_item = QTableWidgetItem(f"{duration:.2f}")
-            self.history_table.setItem(row, 3, duration_item)
-
-            status = info.get("status", "")
-            status_text = status.value if hasattr(status, "value") else str(status)
-            status_item = QTableWidgetItem(status_text)
-
-            if status == TaskStatus.FINISHED:
-                status_item.setBackground(QColor(200, 230, 200))
-            elif status == TaskStatus.FAILED:
-                status_item.setBackground(QColor(255, 200, 200))
-            elif status == TaskStatus.CANCELLED:
-                status_item.setBackground(QColor(255, 230, 180))
-            self.history_table.setItem(row, 4, status_item)
-
-            tags = info.get("tags", [])
-            tags_item = QTableWidgetItem(", ".join(tags))
-            self.history_table.setItem(row, 5, tags_item)
-            row += 1
-
-    def update_errors_table(self, exceptions: Dict[str, Dict[str, Any]]) -> None:
-        self.errors_table.setRowCount(0)
-        row = 0
-
-        sorted_exceptions = sorted(
-            [(name, info) for name, info in exceptions.items() if info.get("time")],
-            key=lambda x: x[1]["time"] or 0.0,
-            reverse=True,
-        )
-
-        for name, info in sorted_exceptions:
-            self.errors_table.insertRow(row)
-            name_item = QTableWidgetItem(name)
-            name_item.setData(Qt.UserRole, name)
-            self.errors_table.setItem(row, 0, name_item)
-
-            error_time = info.get("time")
-            time_str = datetime.fromtimestamp(error_time).strftime("%Y-%m-%d %H:%M:%S") if error_time else ""
-            time_item = QTableWidgetItem(time_str)
-            self.errors_table.setItem(row, 1, time_item)
-
-            error_msg = str(info.get("exception") or "")
-            error_item = QTableWidgetItem(error_msg)
-            self.errors_table.setItem(row, 2, error_item)
+            status_text, background = self._status_cell(info.get("status", ""), 4)
+            texts = (
+                name,
+                info.get("description", ""),
+                start_time_str,
+                f"{duration:.2f}",
+                status_text,
+                self._tags_text(name, info),
+            )
+            rows.append((name, texts, background))
+        self.history_model.set_rows(rows)
+
+    def update_errors_table(
+        self,
+        exceptions: Dict[str, Dict[str, Any]],
+        stats: Optional[Dict[str, Dict[str, Any]]] = None,
+    ) -> None:
+        if self.errors_table is None:
+            return
+        if stats is None:
+            stats = self.task_manager.get_diagnostics()
 
-            task_info = self.task_manager.get_diagnostics().get(name, {})
-            tags = task_info.get("tags", [])
-            tags_item = QTableWidgetItem(", ".join(tags))
-            self.errors_table.setItem(row, 3, tags_item)
-            row += 1
+        # Sort on a precomputed timestamp column rather than a per-compare lambda
+        tagged = [(info["time"], name, info) for name, info in exceptions.items() if info.get("time")]
+        tagged.sort(key=itemgetter(0), reverse=True)
+
+        rows: List[_Row] = []
+        for _, name, info in tagged:
+            time_str = self._format_time(name, info.get("time"), "%Y-%m-%d %H:%M:%S")
+            texts = (
+                name,
+                time_str,
+                str(info.get("exception") or ""),
+                self._tags_text(name, stats.get(name, {})),
+            )
+            rows.append((name, texts, None))
+        self.errors_model.set_rows(rows)
 
     def _task_info(self, task_name: str) -> Dict[str, Any]:
-        info = self.task_manager.get_diagnostics().get(task_name, {}).copy()
+        info = self._snapshot().stats.get(task_name, {}).copy()
         info["name"] = task_name
         return info
 
-    def show_task_details(self, item) -> None:
-        table = item.tableWidget()
-        row = item.row()
-        task_name = table.item(row, 0).data(Qt.UserRole)
+    def show_task_details(self, index: QModelIndex) -> None:
+        task_name = index.data(Qt.UserRole)
+        if not task_name:
+            return
         dialog = TaskDetailsDialog(self._task_info(task_name), self)
         dialog.exec_()
 
-    def show_error_details(self, item) -> None:
-        table = item.tableWidget()
-        row = item.row()
-        task_name = table.item(row, 0).data(Qt.UserRole)
+    def show_error_details(self, index: QModelIndex) -> None:
+        task_name = index.data(Qt.UserRole)
+        if not task_name:
+            return
         info = self._task_info(task_name)
-        exc = self.task_manager.get_task_exceptions().get(task_name, {})
+        exc = self._snapshot().exceptions.get(task_name, {})
         info.update(exc)
         dialog = TaskDetailsDialog(info, self)
         dialog.exec_()
 
     def cancel_selected_task(self) -> None:
-        selected_items = self.active_tasks_table.selectedItems()
-        if not selected_items:
+        selected_rows = self.active_tasks_table.selectionModel().selectedRows()
+        if not selected_rows:
             return
-        row = selected_items[0].row()
-        task_name = self.active_tasks_table.item(row, 0).data(Qt.UserRole)
+        task_name = self.active_tasks_model.task_name(selected_rows[0].row())
         if task_name:
             self.task_manager.stop_thread(task_name)
-            self.update_ui()
+            self.request_refresh()
 
     def cancel_all_tasks(self) -> None:
         for name in list(self.task_manager.threads.keys()):
             self.task_manager.stop_thread(name)
-        self.update_ui()
+        self.request_refresh()
 
     def clear_history(self) -> None:
         self.task_manager.clear_history(keep_running=True)
-        self.update_ui()
+        self._fmt_time_cache.clear()
+        self._tags_cache.clear()
+        self.request_refresh()
@@ -5,6 +5,7 @@ from __future__ import annotations
 import logging
 from pathlib import Path
 
+from PyQt5.QtCore import Qt
 from PyQt5.uic import loadUi
 from PyQt5.QtWidgets import QMainWindow, QMessageBox, QStatusBar
 
@@ -57,6 +58,13 @@ class MainUi(
         self.axis_polling = None
         self.instrument = None
         self.calib_plots = None
+        self.tracker = None
+        self.positioner = None
+        self.telemetry_ready = False
+        self._user_requested_disconnect = False
+        self._auto_restart_tracking = False
+        self._last_tel_az = None
+        self._last_tel_el = None
 
         self.status_bar = QStatusBar()
         self.setStatusBar(self.status_bar)
@@ -133,18 +141,11 @@ class MainUi(
         self.pushButton_antenna_track.setEnabled(False)
 
         self.ui_set_default_state()
-        self._user_requested_disconnect = False
         self._connect_toggle_in_progress = False
         self.setup_time_ui()
         self.setup_connection_mode_selector()
 
         self.tracked_object = TrackedObject()
-        self.tracker = None
-        self.positioner = None
-        self.telemetry_ready = False
-        self._auto_restart_tracking = False
-        self._last_tel_az = None
-        self._last_tel_el = None
 
         try:
             self.setup_tracker_tab()
@@ -215,7 +216,7 @@ class MainUi(
             tle_download_timeout_s=tle_download_timeout_s,
         )
         self.ephem = EphemerisQtAdapter(base_ephem)
-        self.ephem.pose_updated.connect(self._on_pose_updated)
+        self.ephem.pose_updated.connect(self._on_pose_updated, Qt.QueuedConnection)
 
         self.multi_cards = MultiTrackTabsManager(
             ephem=self.ephem,
@@ -29,9 +29,44 @@ from antrack.tracking.tracking import Tracker, automatic_tracking_elevation_allo
 from antrack.tracking.tracking_diagnostics import load_tracking_diagnostics_config
 
 
+def sample_tracker_running(owner) -> bool:
+    """Query ``owner.tracker`` and remember the result for the current tracking UI tick."""
+    tracker = getattr(owner, "tracker", None)
+    running = bool(tracker and tracker.is_running())
+    owner._tracker_running_cache = running
+    return running
+
+
+def cached_tracker_running(owner) -> bool:
+    """Reuse the tracker state sampled by the tracking UI timer while it ticks."""
+    cached = getattr(owner, "_tracker_running_cache", None)
+    timer = getattr(owner, "_tracking_ui_timer", None)
+    if cached is not None and timer is not None and timer.isActive():
+        return cached
+    return sample_tracker_running(owner)
+
+
 class TrackingUiMixin:
     """Keep tracking selection and tracking-state UI logic out of main_ui.py."""
 
+    _TARGET_DETAIL_LABELS = tuple(
+        (attr, "-")
+        for attr in (
+            "label_object_distance_km",
+            "target_ra_label",
+            "target_dec_label",
+            "target_dist_au_label",
+            "target_el_now_label",
+            "target_next_event_label",
+            "target_dur_label",
+            "target_aos_label",
+            "target_los_label",
+            "target_max_el_label",
+            "target_max_el_time_label",
+            "target_visible_now_label",
+        )
+    )
+
     def setup_manual_antenna_controls(self):
         """Wire the manual-control panel and initialize it in Auto mode."""
         self._manual_control_mode = False
@@ -140,6 +175,7 @@ class TrackingUiMixin:
                 self.tracker.stop()
         except Exception:
             pass
+        self._tracker_running_cache = None
         self.stop_tracking_ui_timer()
         self._ui_show_tracking_stopped()
         try:
@@ -158,7 +194,7 @@ class TrackingUiMixin:
         self._ui_show_tracking_stopped()
 
     def _motion_controller_running(self) -> bool:
-        tracker_running = bool(getattr(self, "tracker", None) and self.tracker.is_running())
+        tracker_running = cached_tracker_running(self)
         positioner_running = bool(getattr(self, "positioner", None) and self.positioner.is_running())
         return tracker_running or positioner_running
 
@@ -195,7 +231,7 @@ class TrackingUiMixin:
         self._manual_control_mode = enabled
         self._manual_setpoint_mode = enabled
         if enabled:
-            if getattr(self, "tracker", None) and self.tracker.is_running():
+            if cached_tracker_running(self):
                 self._stop_tracking_loop_from_ui()
             if getattr(self, "positioner", None) and self.positioner.is_running():
                 self._stop_positioning_loop_from_ui()
@@ -262,7 +298,7 @@ class TrackingUiMixin:
         try:
             if getattr(self, "positioner", None) and self.positioner.is_running():
                 self._stop_positioning_loop_from_ui()
-            if getattr(self, "tracker", None) and self.tracker.is_running():
+            if cached_tracker_running(self):
                 self._stop_tracking_loop_from_ui()
         except Exception:
             pass
@@ -367,33 +403,11 @@ class TrackingUiMixin:
     def _clear_selected_target_details(self):
         """Clear non-pointing fields when the target context is no longer an ephemeris object."""
         try:
-            text_fields = (
-                "label_object_distance_km",
-                "target_ra_label",
-                "target_dec_label",
-                "target_dist_au_label",
-                "target_el_now_label",
-                "target_next_event_label",
-                "target_dur_label",
-                "target_aos_label",
-                "target_los_label",
-                "target_max_el_label",
-                "target_max_el_time_label",
-            )
-            for attr in text_fields:
-                if hasattr(self, attr):
-                    widget = getattr(self, attr)
-                    widget.setText("-")
-                    widget.setStyleSheet("")
-                    try:
-                        widget.setToolTip("-")
-                    except Exception:
-                        pass
-            if hasattr(self, "target_visible_now_label"):
-                self.target_visible_now_label.setText("-")
-                self.target_visible_now_label.setStyleSheet("")
+            for widget, text in self._cached_label_refs("target_details", self._TARGET_DETAIL_LABELS):
+                widget.setText(text)
+                widget.setStyleSheet("")
                 try:
-                    self.target_visible_now_label.setToolTip("-")
+                    widget.setToolTip(text)
                 except Exception:
                     pass
         except Exception as exc:
@@ -402,7 +416,7 @@ class TrackingUiMixin:
     def _start_fixed_positioning_motion(self, attempts_left: int = 20):
         """Start fixed-position motion toward the already-loaded AZ/EL setpoints."""
         try:
-            if getattr(self, "tracker", None) and self.tracker.is_running():
+            if cached_tracker_running(self):
                 if attempts_left > 0:
                     QTimer.singleShot(100, lambda: self._start_fixed_positioning_motion(attempts_left - 1))
                 else:
@@ -429,7 +443,7 @@ class TrackingUiMixin:
         """Drive the antenna to a fixed AZ/EL target and stop on arrival."""
         self._manual_setpoint_mode = True
 
-        if getattr(self, "tracker", None) and self.tracker.is_running():
+        if cached_tracker_running(self):
             self._stop_tracking_loop_from_ui()
         if getattr(self, "positioner", None) and self.positioner.is_running():
             self._stop_positioning_loop_from_ui()
@@ -494,16 +508,29 @@ class TrackingUiMixin:
             return
 
         if hasattr(self, "specific_object_dropdown"):
-            index = -1
-            for current in range(self.specific_object_dropdown.count()):
-                if self.specific_object_dropdown.itemText(current).lower() == name.lower():
-                    index = current
-                    break
+            index = self._specific_object_index_of(name)
             if index >= 0:
                 self.specific_object_dropdown.setCurrentIndex(index)
             else:
                 self.specific_object_dropdown.addItem(name)
-                self.specific_object_dropdown.setCurrentText(name)
+                self._specific_object_index_by_name[name.lower()] = self.specific_object_dropdown.count() - 1
+                self.specific_object_dropdown.setCurrentIndex(self.specific_object_dropdown.count() - 1)
+
+    def _rebuild_specific_object_index(self) -> None:
+        """Map lower-cased specific_object_dropdown labels to their row once per repopulation."""
+        dropdown = self.specific_object_dropdown
+        index_by_name = {}
+        for index in range(dropdown.count()):
+            index_by_name.setdefault(dropdown.itemText(index).lower(), index)
+        self._specific_object_index_by_name = index_by_name
+
+    def _specific_object_index_of(self, name: str) -> int:
+        """Return the specific_object_dropdown row for ``name`` (case-insensitive), or -1."""
+        index_by_name = getattr(self, "_specific_object_index_by_name", None)
+        if index_by_name is None:
+            self._rebuild_specific_object_index()
+            index_by_name = self._specific_object_index_by_name
+        return index_by_name.get(name.lower(), -1)
 
     def _prime_selected_target_display(self, name: str):
         """Show the newly selected target immediately while fresh ephemeris is loading."""
@@ -609,7 +636,22 @@ class TrackingUiMixin:
             self.label_antenna_status.setText("Tracking suspended: below horizon")
             self.label_antenna_status.setStyleSheet(red_label_color)
         if dialog:
-            QMessageBox.information(self, "Tracking", message)
+            self._show_tracking_message("Tracking", message)
+
+    def _show_tracking_message(self, title: str, text: str, icon=QMessageBox.Information) -> None:
+        """Show a modal tracking notice, reusing one QMessageBox instead of building a dialog per call."""
+        box = getattr(self, "_info_box", None)
+        if box is None:
+            box = QMessageBox(self)
+            self._info_box = box
+        elif box.isVisible():
+            # A notice is already open (exec_ runs the event loop): show this one in its own box
+            box = QMessageBox(self)
+            box.setAttribute(Qt.WA_DeleteOnClose)
+        box.setIcon(icon)
+        box.setWindowTitle(title)
+        box.setText(text)
+        box.exec_()
 
     def setup_tracker_tab(self):
         """
@@ -720,14 +762,15 @@ class TrackingUiMixin:
             try:
                 self.object_dropdown.setCurrentText("Solar System")
                 self.update_secondary_dropdown()
-                for index in range(self.specific_object_dropdown.count()):
-                    if self.specific_object_dropdown.itemText(index).lower() == "sun":
-                        self.specific_object_dropdown.setCurrentIndex(index)
-                        break
+                index = self._specific_object_index_of("Sun")
+                if index >= 0:
+                    self.specific_object_dropdown.setCurrentIndex(index)
             except Exception:
                 pass
 
             container.setLayout(layout)
+            self._label_refs_cache = None
+            self._set_plain_text_labels("target_details", self._TARGET_DETAIL_LABELS)
         except Exception as exc:
             self.logger.error(f"Erreur setup_tracker_tab: {exc}")
 
@@ -794,6 +837,7 @@ class TrackingUiMixin:
                     self._populate_rs_sources_for_current_group()
                 except Exception as exc:
                     self.logger.error(f"update_secondary_dropdown RS init error: {exc}")
+            self._rebuild_specific_object_index()
 
             try:
                 if is_sat:
@@ -858,11 +902,12 @@ class TrackingUiMixin:
             else:
                 for name, norad in rows:
                     label = f"{name} [{norad}]" if isinstance(norad, int) and norad >= 0 else name
-                    self.tle_sat_dropdown.addItem(label)
+                    # Parse once here; _current_sat_query reads the name back from the item data.
+                    self.tle_sat_dropdown.addItem(label, self._parse_sat_label(label))
             self.tle_sat_dropdown.blockSignals(False)
 
             try:
-                name = self._parse_sat_label(self.tle_sat_dropdown.currentText() or "")
+                name = self._current_sat_name()
                 enabled = bool(name) or bool((self.tle_query_edit.text() or "").strip())
                 self.apply_target_btn.setEnabled(enabled)
             except Exception:
@@ -1260,6 +1305,7 @@ class TrackingUiMixin:
                     self.logger.warning(f"[Tracking] prime_axis_motion before start failed: {exc}")
 
                 self.tracker.start()
+                self._tracker_running_cache = None
 
                 try:
                     if hasattr(self, "label_antenna_az_set_deg"):
@@ -1290,8 +1336,7 @@ class TrackingUiMixin:
                     QTimer.singleShot(250, lambda: self._start_tracker_when_ready(attempts_left - 1))
                 else:
                     self.logger.warning("[Tracking] Abandon start: telemetry or setpoints still not ready")
-                    QMessageBox.information(
-                        self,
+                    self._show_tracking_message(
                         "Tracking",
                         "Tracking non demarre: telemetrie ou setpoints indisponibles.",
                     )
@@ -1307,9 +1352,14 @@ class TrackingUiMixin:
                 self._ui_tick = 0
             self._ui_tick += 1
 
-            tracker_running = bool(getattr(self, "tracker", None) and self.tracker.is_running())
+            tracker_running = sample_tracker_running(self)
             positioner_running = bool(getattr(self, "positioner", None) and self.positioner.is_running())
             running = tracker_running or positioner_running
+            if not running and getattr(self, "_last_tracking_ui_running", None) is False:
+                # Idle state already applied on a previous tick: nothing to repaint.
+                self.stop_tracking_ui_timer()
+                return
+            self._last_tracking_ui_running = running
             if hasattr(self, "label_antenna_status"):
                 if tracker_running and self._tracking_target_below_horizon():
                     self.label_antenna_status.setText("Tracking suspended: below horizon")
@@ -1339,8 +1389,12 @@ class TrackingUiMixin:
             if el_cur is None:
                 el_cur = getattr(self, "_last_tel_el", None)
 
-            az_set = getattr(self.tracked_object, "az_set", None)
-            el_set = getattr(self.tracked_object, "el_set", None)
+            tgt = self.tracked_object
+            try:
+                az_set = tgt.az_set
+                el_set = tgt.el_set
+            except AttributeError:
+                az_set = el_set = None
 
             if running and isinstance(az_set, (int, float)) and isinstance(el_set, (int, float)):
                 if hasattr(self, "label_antenna_az_set_deg"):
@@ -1355,7 +1409,7 @@ class TrackingUiMixin:
 
                 if isinstance(az_cur, (int, float)):
                     az_err = az_cur - az_set
-                    self.tracked_object.az_error = az_err
+                    tgt.az_error = az_err
                     if hasattr(self, "label_antenna_az_error"):
                         self.label_antenna_az_error.setText(f"{az_err:.2f} °")
                         threshold = self.settings.get("ANTENNA", {}).get(
@@ -1367,7 +1421,7 @@ class TrackingUiMixin:
                     self.g1.set_error(az_err)
                 if isinstance(el_cur, (int, float)):
                     el_err = el_cur - el_set
-                    self.tracked_object.el_error = el_err
+                    tgt.el_error = el_err
                     if hasattr(self, "label_antenna_el_error"):
                         self.label_antenna_el_error.setText(f"{el_err:.2f} °")
                         threshold = self.settings.get("ANTENNA", {}).get(
@@ -1406,8 +1460,7 @@ class TrackingUiMixin:
             if selected_type == "Artificial Satellite":
                 selected_object = self._current_sat_query()
                 if not selected_object:
-                    QMessageBox.information(
-                        self,
+                    self._show_tracking_message(
                         "Target Object",
                         "Choisissez un satellite ou saisissez un Nom/NORAD.",
                     )
@@ -1415,8 +1468,7 @@ class TrackingUiMixin:
             elif selected_type == "Radio Source":
                 selected_object = self._current_rs_query()
                 if not selected_object:
-                    QMessageBox.information(
-                        self,
+                    self._show_tracking_message(
                         "Target Object",
                         "Choisissez une source radio ou tapez son nom (ex: 3C 273).",
                     )
@@ -1424,7 +1476,7 @@ class TrackingUiMixin:
             else:
                 selected_object = self.specific_object_dropdown.currentText()
                 if not selected_object:
-                    QMessageBox.information(self, "Target Object", "Veuillez selectionner un objet.")
+                    self._show_tracking_message("Target Object", "Veuillez selectionner un objet.")
                     return
 
             self._prime_selected_target_display(selected_object)
@@ -1437,7 +1489,7 @@ class TrackingUiMixin:
 
         except Exception as exc:
             self.logger.error(f"Erreur on_apply_target_clicked: {exc}")
-            QMessageBox.warning(self, "Target Object", f"Impossible de demarrer les consignes:\n{exc}")
+            self._show_tracking_message("Target Object", f"Impossible de demarrer les consignes:\n{exc}", QMessageBox.Warning)
 
     def on_track_button_clicked(self):
         """
@@ -1445,13 +1497,13 @@ class TrackingUiMixin:
         """
         try:
             if not self.has_connection():
-                QMessageBox.warning(self, "Tracking", "Veuillez d'abord vous connecter au serveur Axis.")
+                self._show_tracking_message("Tracking", "Veuillez d'abord vous connecter au serveur Axis.", QMessageBox.Warning)
                 return
             if (
                 getattr(self, "_manual_control_mode", False)
                 and not (getattr(self, "positioner", None) and self.positioner.is_running())
             ):
-                QMessageBox.information(self, "Tracking", "Repassez en mode Auto pour utiliser Track.")
+                self._show_tracking_message("Tracking", "Repassez en mode Auto pour utiliser Track.")
                 return
 
             if self.tracker is None:
@@ -1462,9 +1514,10 @@ class TrackingUiMixin:
                         self.thread_manager,
                         self.tracked_object,
                     )
+                    self._tracker_running_cache = None
                 except Exception as exc:
                     self.logger.error(f"Impossible d'initialiser le tracker: {exc}")
-                    QMessageBox.warning(self, "Tracking", "Initialisation du tracker impossible.")
+                    self._show_tracking_message("Tracking", "Initialisation du tracker impossible.", QMessageBox.Warning)
                     return
 
             if getattr(self, "positioner", None) and self.positioner.is_running():
@@ -1475,13 +1528,12 @@ class TrackingUiMixin:
                     pass
                 return
 
-            if not self.tracker.is_running():
+            if not cached_tracker_running(self):
                 az_set = getattr(self.tracked_object, "az_set", None)
                 el_set = getattr(self.tracked_object, "el_set", None)
 
                 if not self.has_setpoints():
-                    QMessageBox.information(
-                        self,
+                    self._show_tracking_message(
                         "Tracking",
                         "Selectionnez un objet puis cliquez sur 'Appliquer la selection' pour calculer les consignes.",
                     )
@@ -1599,43 +1651,27 @@ class TrackingUiMixin:
             self.logger.warning("tabWidget_3 introuvable dans l'UI.")
             return
 
-        page = None
-        for index in range(tw.count()):
-            if tw.tabText(index).strip().lower() == "solar system":
-                page = tw.widget(index)
-                break
+        page = getattr(self, "tab_SolarSystem", None)
+        if page is None or tw.indexOf(page) < 0:
+            page, _ = self._find_tab_by_title(tw, "Solar System")
         if page is None:
             self.logger.warning("Onglet 'Solar System' introuvable dans tabWidget_3.")
             return
 
-        from PyQt5.QtWidgets import QGridLayout as _QGridLayout, QVBoxLayout as _QVBoxLayout
-
         layout = page.layout()
         if layout is None:
-            layout = _QVBoxLayout(page)
+            layout = QVBoxLayout(page)
             page.setLayout(layout)
 
-        self.multi_strip = MultiTrackStrip(self.ephem, on_pick=self._on_multitrack_pick, parent=page)
-
-        if isinstance(layout, _QGridLayout):
-            row = layout.rowCount()
-            col_span = max(1, layout.columnCount())
-            layout.addWidget(self.multi_strip, row, 0, 1, col_span)
-        else:
-            layout.addWidget(self.multi_strip)
-
-    def _on_multitrack_pick(self, obj_type: str, name: str):
-        try:
-            self._select_target_from_card(obj_type, name)
-            self.on_apply_target_clicked()
-            self.status_bar.showMessage(f"Objet selectionne: {obj_type} / {name}", 3000)
-        except Exception as exc:
-            self.logger.error(f"_on_multitrack_pick error: {exc}")
+        self.multi_strip = MultiTrackStrip(self.ephem, on_pick=self._on_multi_pick, parent=page)
+        self._append_to_layout(layout, self.multi_strip)
 
     def _on_multi_pick(self, obj_type: str, name: str):
+        """Select and apply a target picked from a multi-track card."""
         try:
             self._select_target_from_card(obj_type, name)
             self.on_apply_target_clicked()
+            self.status_bar.showMessage(f"Objet selectionne: {obj_type} / {name}", 3000)
         except Exception as exc:
             self.logger.error(f"_on_multi_pick error: {exc}")
 
@@ -1661,5 +1697,14 @@ class TrackingUiMixin:
         query = query.strip()
         if query:
             return query
-        label = (self.tle_sat_dropdown.currentText() if hasattr(self, "tle_sat_dropdown") else "") or ""
-        return self._parse_sat_label(label)
+        return self._current_sat_name()
+
+    def _current_sat_name(self) -> str:
+        """Return the satellite name of the selected tle_sat_dropdown item."""
+        dropdown = getattr(self, "tle_sat_dropdown", None)
+        if dropdown is None:
+            return ""
+        name = dropdown.currentData()
+        if isinstance(name, str):
+            return name
+        return self._parse_sat_label(dropdown.currentText() or "")
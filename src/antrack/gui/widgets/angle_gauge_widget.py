@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 import math
+from functools import lru_cache
 from typing import Iterable, List, Tuple, Optional, Union
+import numpy as np
 from PyQt5 import QtCore, QtGui, QtWidgets
 
 # ===================== Couleurs par défaut =====================
@@ -25,61 +27,42 @@ def _qcol(c: Union[str, QtGui.QColor]) -> QtGui.QColor:
 
 def _clamp(v, vmin, vmax): return vmin if v < vmin else vmax if v > vmax else v
 
+def _finite_float(v) -> Tuple[bool, float]:
+    """(ok, float(v)); ok est faux pour None, non numérique, NaN ou ±inf."""
+    if v is None:
+        return False, 0.0
+    try:
+        f = float(v)
+    except (TypeError, ValueError):
+        return False, 0.0
+    return f - f == 0.0, f   # NaN et ±inf donnent NaN
+
+_CARDINAL_DEGS = np.array([0.0, 90.0, 180.0, 270.0])
+
+def _tick_endpoints(ux: np.ndarray, uy: np.ndarray, major_mask: np.ndarray,
+                    cx: float, cy: float, r_outer: float, minor_len: float, major_len: float):
+    """Extrémités (x1, y1, x2, y2) de tous les ticks, calculées en bloc sur les vecteurs unitaires."""
+    r1 = r_outer - np.where(major_mask, major_len, minor_len)
+    r2 = r_outer - 1.0
+    return cx + r1 * ux, cy + r1 * uy, cx + r2 * ux, cy + r2 * uy
+
+# Borne du cache QStaticText (une entrée par police + texte affiché)
+_STATIC_TEXT_CACHE_MAX = 512
+
 # ---------- Rendu numérique : point fixe + largeur fixe ----------
+@lru_cache(maxsize=4096)
+def _fmt_cache(n: int, decimals: int) -> Tuple[str, str]:
+    """(gauche, droite) pour une valeur déjà quantifiée n = round(value * 10**decimals)."""
+    sign = "-" if n < 0 else ""
+    n = abs(n)
+    if decimals <= 0:
+        return sign + str(n), "°"
+    scale = 10 ** decimals
+    return sign + str(n // scale), "." + str(n % scale).zfill(decimals) + "°"
+
 def _split_fixed(value: float, decimals: int) -> Tuple[str, str]:
-    s = f"{value:.{decimals}f}"
-    if value < 0 and not s.startswith("-"):
-        s = "-" + s
-    sign = "-" if s.startswith("-") else ""
-    if sign: s = s[1:]
-    if "." in s:
-        left_int, frac = s.split(".")
-        right = "." + frac + "°"
-    else:
-        left_int = s
-        right = "." + ("0" * decimals) + "°" if decimals > 0 else "°"
-    left = sign + left_int
-    return left, right
-
-def _draw_fixed_centered(p: QtGui.QPainter, cx: float, cy: float,
-                         value: float, decimals: int,
-                         font: QtGui.QFont, color: QtGui.QColor,
-                         int_digits_template: int = 3):
-    """Affiche value avec point fixe centré (gabarit xxx.xx°)."""
-    p.setFont(font)
-    fm = QtGui.QFontMetrics(font)
-    left_tpl  = "-" + ("8" * int_digits_template)
-    right_tpl = "." + ("8" * decimals) + "°" if decimals > 0 else "°"
-    left_w  = fm.boundingRect(left_tpl).width()
-    right_w = fm.boundingRect(right_tpl).width()
-    h = fm.ascent() + fm.descent()
-    rect_left  = QtCore.QRectF(cx - left_w, cy - h/2.0, left_w, h)
-    rect_right = QtCore.QRectF(cx,          cy - h/2.0, right_w, h)
-    left_txt, right_txt = _split_fixed(value, decimals)
-    p.setPen(color)
-    p.drawText(rect_left,  QtCore.Qt.AlignVCenter | QtCore.Qt.AlignRight, left_txt)
-    p.drawText(rect_right, QtCore.Qt.AlignVCenter | QtCore.Qt.AlignLeft,  right_txt)
-
-def _draw_placeholder_centered(p: QtGui.QPainter, cx: float, cy: float,
-                               decimals: int, font: QtGui.QFont,
-                               color: QtGui.QColor, int_digits_template: int = 3):
-    """
-    Affiche le placeholder '---.--°' (même centrage/largeur que _draw_fixed_centered).
-    """
-    p.setFont(font)
-    fm = QtGui.QFontMetrics(font)
-    left_tpl  = "-" + ("8" * int_digits_template)
-    right_tpl = "." + ("8" * decimals) + "°" if decimals > 0 else "°"
-    left_w  = fm.boundingRect(left_tpl).width()
-    right_w = fm.boundingRect(right_tpl).width()
-    h = fm.ascent() + fm.descent()
-    rect_left  = QtCore.QRectF(cx - left_w, cy - h/2.0, left_w, h)
-    rect_right = QtCore.QRectF(cx,          cy - h/2.0, right_w, h)
-    left_txt  = "-" * min(3, int_digits_template)
-    right_txt = "." + ("-" * decimals) + "°" if decimals > 0 else "°"
-    p.setPen(color)
-    p.drawText(rect_left,  QtCore.Qt.AlignVCenter | QtCore.Qt.AlignRight, left_txt)
-    p.drawText(rect_right, QtCore.Qt.AlignVCenter | QtCore.Qt.AlignLeft,  right_txt)
+    decimals = max(0, int(decimals))
+    return _fmt_cache(int(round(value * 10 ** decimals)), decimals)
 
 # ====================================================
 
@@ -93,6 +76,7 @@ class AngleGauge(QtWidgets.QWidget):
     _reqSetAngle  = QtCore.pyqtSignal(object)  # accepte float ou None/NaN
     _reqSetSetpt  = QtCore.pyqtSignal(object)
     _reqSetError  = QtCore.pyqtSignal(object)
+    _reqSetAll    = QtCore.pyqtSignal(object)  # (angle, setpoint, error): un seul saut inter-thread
     _reqSetRanges = QtCore.pyqtSignal(list)
 
     def __init__(self,
@@ -139,6 +123,7 @@ class AngleGauge(QtWidgets.QWidget):
 
         self.origin_screen_deg = float(origin_screen_deg)
         self.clockwise = bool(clockwise)
+        self._dir_sign = -1.0 if self.clockwise else 1.0   # écran = origine + signe * theta
         self.show_cardinals = bool(show_cardinal_labels)
         self.major_anchor_deg = float(major_anchor_deg)
         self.gradient_angle_deg = float(gradient_angle_deg)
@@ -166,12 +151,39 @@ class AngleGauge(QtWidgets.QWidget):
 
         self._err_thr   = 0.05
         self._forbidden = list(forbidden_ranges or [])
-        self._static_cache: Optional[QtGui.QPixmap] = None
+        # Clé QPixmapCache du fond statique; None = à recalculer (taille/config modifiée)
+        self._static_key: Optional[str] = None
+        # Dernière image composée et l'état dynamique qu'elle représente
+        self._frame_pm: Optional[QtGui.QPixmap] = None
+        self._last_dyn = None
+        # Hauteurs de ligne et textes pré-calculés, par police (invalidés sur FontChange)
+        self._fm_cache = {}
+        self._static_text = {}
+        self._rebuild_fonts()
+        # Triangles Actual/Set: sommets locaux (par taille/pas) + polygones réutilisés à chaque frame
+        self._tick_cache = None
+        self._forbidden_draw = None
+        self._static_image: Optional[QtGui.QImage] = None
+        # Disque central (dégradé + liseré) pré-rendu, réutilisé tant que taille/couleurs/angle ne changent pas
+        self._disc_cache_key = None
+        self._disc_pm: Optional[QtGui.QPixmap] = None
+        self._tri_local = None
+        self._tri_poly = {True: QtGui.QPolygonF([QtCore.QPointF()] * 3),
+                          False: QtGui.QPolygonF([QtCore.QPointF()] * 3)}
+
+        # Un seul repaint par ~frame écran, quel que soit le débit des setters
+        self._coalesce_timer = QtCore.QTimer(self)
+        self._coalesce_timer.setSingleShot(True)
+        self._coalesce_timer.setInterval(16)
+        self._coalesce_timer.timeout.connect(self.update)
+        # Changement reçu masqué/réduit: à repeindre au prochain affichage
+        self._repaint_pending = False
 
         # Signaux thread-safe
         self._reqSetAngle.connect(self._set_angle_gui, QtCore.Qt.QueuedConnection)
         self._reqSetSetpt.connect(self._set_setpt_gui, QtCore.Qt.QueuedConnection)
         self._reqSetError.connect(self._set_error_gui, QtCore.Qt.QueuedConnection)
+        self._reqSetAll.connect(self._set_all_gui, QtCore.Qt.QueuedConnection)
         self._reqSetRanges.connect(self._set_ranges_gui, QtCore.Qt.QueuedConnection)
 
     # ----------------------------- API publique -------------------------------
@@ -179,13 +191,17 @@ class AngleGauge(QtWidgets.QWidget):
     def set_setpoint(self, angle_deg: Optional[float]) -> None: self._reqSetSetpt.emit(angle_deg)
     def set_error(self, value: Optional[float]) -> None: self._reqSetError.emit(value)
 
-    def set_error_threshold(self, thr: float) -> None: self._err_thr = max(0.0, float(thr)); self.update()
+    def set_state(self, angle: Optional[float], setpoint: Optional[float], error: Optional[float]) -> None:
+        """Met à jour actual/set/error en une seule émission (None/NaN -> placeholder)."""
+        self._reqSetAll.emit((angle, setpoint, error))
+
+    def set_error_threshold(self, thr: float) -> None: self._err_thr = max(0.0, float(thr)); self._schedule_update()
     def set_forbidden_ranges(self, ranges: Iterable[Tuple[float, float]]) -> None: self._reqSetRanges.emit(list(ranges))
 
     # Activation/désactivation explicite
-    def set_actual_enabled(self, enabled: bool) -> None: self._actual_enabled = bool(enabled); self.update()
-    def set_set_enabled(self, enabled: bool) -> None: self._set_enabled = bool(enabled); self.update()
-    def set_error_enabled(self, enabled: bool) -> None: self._error_enabled = bool(enabled); self.update()
+    def set_actual_enabled(self, enabled: bool) -> None: self._actual_enabled = bool(enabled); self._schedule_update()
+    def set_set_enabled(self, enabled: bool) -> None: self._set_enabled = bool(enabled); self._schedule_update()
+    def set_error_enabled(self, enabled: bool) -> None: self._error_enabled = bool(enabled); self._schedule_update()
 
     def configure(self, *,
                   minor_step: Optional[float] = None,
@@ -214,7 +230,9 @@ class AngleGauge(QtWidgets.QWidget):
         if tick_minor_ratio is not None: self.tick_minor_ratio = float(tick_minor_ratio)
         if tick_major_ratio is not None: self.tick_major_ratio = float(tick_major_ratio)
         if origin_screen_deg is not None: self.origin_screen_deg = float(origin_screen_deg)
-        if clockwise is not None: self.clockwise = bool(clockwise)
+        if clockwise is not None:
+            self.clockwise = bool(clockwise)
+            self._dir_sign = -1.0 if self.clockwise else 1.0
         if show_cardinal_labels is not None: self.show_cardinals = bool(show_cardinal_labels)
         if major_anchor_deg is not None: self.major_anchor_deg = float(major_anchor_deg)
         if gradient_angle_deg is not None: self.gradient_angle_deg = float(gradient_angle_deg)
@@ -237,107 +255,249 @@ class AngleGauge(QtWidgets.QWidget):
             self._max_angle = self.start_angle + self.span_angle
             self._angle    = _clamp(self._angle, self._min_angle, self._max_angle)
             self._setpoint = _clamp(self._setpoint, self._min_angle, self._max_angle)
-        self._static_cache = None; self.update()
+        self._static_key = None; self._tri_local = None; self._last_dyn = None; self.update()
 
     # ----------------------------- Qt events ----------------------------------
     def resizeEvent(self, ev: QtGui.QResizeEvent) -> None:
-        self._static_cache = None
+        self._static_key = None
+        self._tri_local = None
+        self._rebuild_fonts()
         super().resizeEvent(ev)
 
-    def paintEvent(self, ev: QtGui.QPaintEvent) -> None:
-        if self._static_cache is None:
-            self._rebuild_static()
+    def changeEvent(self, ev: QtCore.QEvent) -> None:
+        if ev.type() == QtCore.QEvent.FontChange:
+            self._fm_cache.clear()
+            self._static_text.clear()
+            self._static_key = None
+            self._last_dyn = None
+            self._rebuild_fonts()
+        elif ev.type() == QtCore.QEvent.WindowStateChange and not self.isMinimized():
+            self._flush_pending_repaint()
+        super().changeEvent(ev)
+
+    def showEvent(self, ev: QtGui.QShowEvent) -> None:
+        # Fenêtre restaurée ou onglet réaffiché: Qt ne ré-expose que l'ancien backing store
+        self._flush_pending_repaint()
+        super().showEvent(ev)
 
+    def paintEvent(self, ev: QtGui.QPaintEvent) -> None:
+        key = self._static_key
+        if key is None:
+            key = self._static_key = self._make_static_key()
+        static_pm = QtGui.QPixmapCache.find(key)
+        if static_pm is None:
+            static_pm = self._rebuild_static()
+            QtGui.QPixmapCache.insert(key, static_pm)
+
+        # Image complète (fond + dynamique) réutilisée tant que rien d'affiché n'a changé
+        dyn = (key, self._angle, self._setpoint, self._error, self._err_thr, self.decimals,
+               self._actual_enabled, self._set_enabled, self._error_enabled)
+        if dyn != self._last_dyn or self._frame_pm is None:
+            frame = QtGui.QPixmap(static_pm)
+            fp = QtGui.QPainter(frame)
+            self._paint_dynamic(fp)
+            fp.end()
+            self._frame_pm = frame
+            self._last_dyn = dyn
+
+        # Blit 1:1 de l'image déjà antialiasée: aucun rendu lissé nécessaire ici
         p = QtGui.QPainter(self)
-        p.setRenderHint(QtGui.QPainter.Antialiasing, True)
-        p.drawPixmap(0, 0, self._static_cache)
+        p.setRenderHint(QtGui.QPainter.SmoothPixmapTransform, False)
+        p.drawPixmap(0, 0, self._frame_pm)
+        p.end()
 
-        # --------- Dynamique : triangles + valeurs numériques ----------
+    def _paint_dynamic(self, p: QtGui.QPainter) -> None:
+        """Triangles + valeurs numériques par-dessus le fond statique."""
         cx, cy, R_outer, R_inner, ring_w = self._geom()
 
         # Triangles — base identique, affichés seulement si 'enabled'
+        # (seuls les triangles ont besoin de l'antialiasing géométrique; le texte a le sien)
+        p.setRenderHint(QtGui.QPainter.Antialiasing, True)
         p.setPen(QtCore.Qt.NoPen)
         if self._actual_enabled:
             p.setBrush(_QCOLOR_ACTUAL)
-            p.drawPath(self._triangles_equal_base(True,  self._angle,   cx, cy, R_inner, R_outer))
+            p.drawConvexPolygon(self._triangle_polygon(True,  self._angle,   cx, cy, R_inner, R_outer))
         if self._set_enabled:
             p.setBrush(_QCOLOR_SET)
-            p.drawPath(self._triangles_equal_base(False, self._setpoint,cx, cy, R_inner, R_outer))
+            p.drawConvexPolygon(self._triangle_polygon(False, self._setpoint,cx, cy, R_inner, R_outer))
+        p.setRenderHint(QtGui.QPainter.Antialiasing, False)
 
-        # Tailles police
-        s = min(self.width(), self.height())
-        f_set = QtGui.QFont("DejaVu Sans", max(9,  int(s * 0.076))); f_set.setBold(True)  # Set plus petit
-        f_act = QtGui.QFont("DejaVu Sans", max(10, int(s * 0.098))); f_act.setBold(True)
-        f_err = QtGui.QFont("DejaVu Sans", max(8,  int(s * 0.070))); f_err.setBold(True)
+        f_set, f_act, f_err = self._f_set, self._f_act, self._f_err
 
         # Valeurs aux positions indépendantes (ou placeholder)
         if self._set_enabled and math.isfinite(self._setpoint):
-            _draw_fixed_centered(p, cx, cy + R_inner * self.set_value_y_ratio,
+            self._draw_fixed_centered(p, cx, cy + R_inner * self.set_value_y_ratio,
                                  self._setpoint, self.decimals, f_set, _QCOLOR_SET)
         else:
-            _draw_placeholder_centered(p, cx, cy + R_inner * self.set_value_y_ratio,
+            self._draw_placeholder_centered(p, cx, cy + R_inner * self.set_value_y_ratio,
                                        self.decimals, f_set, _QCOLOR_PLACEHOLDER)
 
         if self._actual_enabled and math.isfinite(self._angle):
-            _draw_fixed_centered(p, cx, cy + R_inner * self.actual_value_y_ratio,
+            self._draw_fixed_centered(p, cx, cy + R_inner * self.actual_value_y_ratio,
                                  self._angle, self.decimals, f_act, _QCOLOR_ACTUAL)
         else:
-            _draw_placeholder_centered(p, cx, cy + R_inner * self.actual_value_y_ratio,
+            self._draw_placeholder_centered(p, cx, cy + R_inner * self.actual_value_y_ratio,
                                        self.decimals, f_act, _QCOLOR_PLACEHOLDER)
 
         err_col = _QCOLOR_ERR_OK if abs(self._error) <= self._err_thr else _QCOLOR_ERR_BAD
         if self._error_enabled and math.isfinite(self._error):
-            _draw_fixed_centered(p, cx, cy + R_inner * self.error_value_y_ratio,
+            self._draw_fixed_centered(p, cx, cy + R_inner * self.error_value_y_ratio,
                                  self._error, self.decimals, f_err, err_col)
         else:
-            _draw_placeholder_centered(p, cx, cy + R_inner * self.error_value_y_ratio,
+            self._draw_placeholder_centered(p, cx, cy + R_inner * self.error_value_y_ratio,
                                        self.decimals, f_err, _QCOLOR_PLACEHOLDER)
 
-        p.end()
+    # --- polices / stylos dépendant de la taille (reconstruits sur resize) ---
+    def _rebuild_fonts(self) -> None:
+        s = min(self.width(), self.height())
+        self._f_set = QtGui.QFont("DejaVu Sans", max(9,  int(s * 0.076))); self._f_set.setBold(True)  # Set plus petit
+        self._f_act = QtGui.QFont("DejaVu Sans", max(10, int(s * 0.098))); self._f_act.setBold(True)
+        self._f_err = QtGui.QFont("DejaVu Sans", max(8,  int(s * 0.070))); self._f_err.setBold(True)
+        self._f_card = QtGui.QFont("DejaVu Sans", max(7, int(s * 0.035))); self._f_card.setBold(False)
+        self._card_offset = {}  # valeur cardinale -> (QStaticText, demi-largeur, demi-hauteur) pour _f_card
+        self._f_label = QtGui.QFont("DejaVu Sans", max(8, int(s * 0.045))); self._f_label.setBold(True)
+
+        ring_w = s * 0.13
+        self._pen_liseret = QtGui.QPen(_QCOLOR_LISERET, max(1.0, ring_w*0.08))
+        self._pen_ring = QtGui.QPen(_QCOLOR_RING, ring_w, QtCore.Qt.SolidLine, QtCore.Qt.FlatCap)
+        self._pen_forbid = QtGui.QPen(_QCOLOR_FORBID, max(2.0, ring_w * 0.92),
+                                      QtCore.Qt.SolidLine, QtCore.Qt.FlatCap)
+        self._pen_ticks = QtGui.QPen(_QCOLOR_TICKS, max(1.0, ring_w * 0.08),
+                                     QtCore.Qt.SolidLine, QtCore.Qt.FlatCap)
+
+    # ---------- Rendu numérique : point fixe + largeur fixe ----------
+    def _text_height(self, font: QtGui.QFont) -> int:
+        """Hauteur de ligne (ascent + descent) de la police, mesurée une fois par police."""
+        key = font.key()
+        h = self._fm_cache.get(key)
+        if h is None:
+            fm = QtGui.QFontMetrics(font)
+            h = self._fm_cache[key] = fm.ascent() + fm.descent()
+        return h
+
+    def _static(self, font: QtGui.QFont, text: str) -> QtGui.QStaticText:
+        key = (font.key(), text)
+        st = self._static_text.get(key)
+        if st is None:
+            if len(self._static_text) >= _STATIC_TEXT_CACHE_MAX:
+                self._static_text.clear()
+            st = QtGui.QStaticText(text)
+            st.setTextFormat(QtCore.Qt.PlainText)
+            st.prepare(QtGui.QTransform(), font)
+            self._static_text[key] = st
+        return st
+
+    def _card_text(self, val_deg: int):
+        """Texte statique et demi-dimensions d'un libellé cardinal, mesurés une fois par police."""
+        entry = self._card_offset.get(val_deg)
+        if entry is None:
+            st = self._static(self._f_card, f"{int(val_deg) % 360}")
+            size = st.size()
+            entry = self._card_offset[val_deg] = (st, size.width() / 2.0, size.height() / 2.0)
+        return entry
+
+    def _draw_split_centered(self, p: QtGui.QPainter, cx: float, cy: float,
+                             left_txt: str, right_txt: str,
+                             font: QtGui.QFont, color: QtGui.QColor):
+        # Point décimal ancré sur cx : partie entière alignée à droite, décimales à gauche
+        p.setFont(font)
+        p.setPen(color)
+        top = cy - self._text_height(font) / 2.0
+        st_left = self._static(font, left_txt)
+        p.drawStaticText(QtCore.QPointF(cx - st_left.size().width(), top), st_left)
+        p.drawStaticText(QtCore.QPointF(cx, top), self._static(font, right_txt))
+
+    def _draw_fixed_centered(self, p: QtGui.QPainter, cx: float, cy: float,
+                             value: float, decimals: int,
+                             font: QtGui.QFont, color: QtGui.QColor):
+        """Affiche value avec le point décimal centré sur cx."""
+        left_txt, right_txt = _split_fixed(value, decimals)
+        self._draw_split_centered(p, cx, cy, left_txt, right_txt, font, color)
+
+    def _draw_placeholder_centered(self, p: QtGui.QPainter, cx: float, cy: float,
+                                   decimals: int, font: QtGui.QFont,
+                                   color: QtGui.QColor, int_digits_template: int = 3):
+        """
+        Affiche le placeholder '---.--°' (même centrage que _draw_fixed_centered).
+        """
+        left_txt  = "-" * min(3, int_digits_template)
+        right_txt = "." + ("-" * decimals) + "°" if decimals > 0 else "°"
+        self._draw_split_centered(p, cx, cy, left_txt, right_txt, font, color)
 
     # ----------------------------- internes -----------------------------------
-    def _set_angle_gui(self, angle: Optional[float]) -> None:
-        if angle is None or (isinstance(angle, float) and not math.isfinite(angle)):
-            self._actual_enabled = False
+    def _schedule_update(self) -> None:
+        # Masqué (onglet inactif) ou fenêtre réduite: rien à peindre, repaint différé au réaffichage
+        if not self.isVisible() or self.window().isMinimized():
+            self._repaint_pending = True
+            return
+        if not self._coalesce_timer.isActive():
+            self._coalesce_timer.start()
+
+    def _flush_pending_repaint(self) -> None:
+        if self._repaint_pending:
+            self._repaint_pending = False
             self.update()
+
+    # Les setters ne repeignent que si l'affichage change réellement (télémétrie souvent identique).
+    def _set_angle_gui(self, angle: Optional[float]) -> None:
+        ok, angle = _finite_float(angle)
+        if not ok:
+            if self._actual_enabled:
+                self._actual_enabled = False
+                self._schedule_update()
+            return
+        a = _clamp(angle, self._min_angle, self._max_angle)
+        if a == self._angle and self._actual_enabled:
             return
-        a = _clamp(float(angle), self._min_angle, self._max_angle)
         self._angle = a
         self._actual_enabled = True
         self.valueChanged.emit(a)
-        self.update()
+        self._schedule_update()
 
     def _set_setpt_gui(self, angle: Optional[float]) -> None:
-        if angle is None or (isinstance(angle, float) and not math.isfinite(angle)):
-            self._set_enabled = False
-            self.update()
+        ok, angle = _finite_float(angle)
+        if not ok:
+            if self._set_enabled:
+                self._set_enabled = False
+                self._schedule_update()
+            return
+        s = _clamp(angle, self._min_angle, self._max_angle)
+        if s == self._setpoint and self._set_enabled:
             return
-        s = _clamp(float(angle), self._min_angle, self._max_angle)
         self._setpoint = s
         self._set_enabled = True
         self.setpointChanged.emit(s)
-        self.update()
+        self._schedule_update()
 
     def _set_error_gui(self, value: Optional[float]) -> None:
-        if value is None or (isinstance(value, float) and not math.isfinite(value)):
-            self._error_enabled = False
-            self.update()
+        ok, value = _finite_float(value)
+        if not ok:
+            if self._error_enabled:
+                self._error_enabled = False
+                self._schedule_update()
             return
-        self._error = float(value)
+        if value == self._error and self._error_enabled:
+            return
+        self._error = value
         self._error_enabled = True
         self.errorChanged.emit(self._error)
-        self.update()
+        self._schedule_update()
+
+    def _set_all_gui(self, payload) -> None:
+        angle, setpoint, error = payload
+        # Les setters ne planifient qu'un repaint coalescé: un seul update() pour les trois
+        self._set_angle_gui(angle)
+        self._set_setpt_gui(setpoint)
+        self._set_error_gui(error)
 
     def _set_ranges_gui(self, ranges: List[Tuple[float, float]]) -> None:
-        cleaned: List[Tuple[float, float]] = []
-        for a, b in ranges:
-            if b <= a: continue
-            a = max(self._min_angle, min(self._max_angle, float(a)))
-            b = max(self._min_angle, min(self._max_angle, float(b)))
-            if b > a: cleaned.append((a, b))
-        self._forbidden = cleaned
-        self._static_cache = None
-        self.update()
+        arr = np.asarray(ranges, dtype=np.float64).reshape(-1, 2)
+        valid = arr[:, 1] > arr[:, 0]
+        np.clip(arr, self._min_angle, self._max_angle, out=arr)
+        keep = valid & (arr[:, 1] > arr[:, 0])
+        self._forbidden = list(map(tuple, arr[keep].tolist()))
+        self._static_key = None
+        self._schedule_update()
 
     # --- géométrie / outils ---
     def _geom(self):
@@ -350,154 +510,204 @@ class AngleGauge(QtWidgets.QWidget):
         return cx, cy, R_outer, R_inner, ring_w
 
     def _theta_to_screen_rad(self, theta_deg: float) -> float:
-        if self.clockwise:
-            scr = self.origin_screen_deg - theta_deg
-        else:
-            scr = self.origin_screen_deg + theta_deg
-        return math.radians(scr)
+        return math.radians(self.origin_screen_deg + self._dir_sign * theta_deg)
+
+    def _theta_to_screen_rad_np(self, theta_deg: np.ndarray) -> np.ndarray:
+        return np.deg2rad(self.origin_screen_deg + self._dir_sign * theta_deg)
 
     def _pt(self, cx, cy, r, theta_deg) -> QtCore.QPointF:
         a = self._theta_to_screen_rad(theta_deg)
         return QtCore.QPointF(cx + r * math.cos(a), cy - r * math.sin(a))
 
     # Triangles : même base visuelle pour inner/outer --------------------------
-    def _triangles_equal_base(self, inner: bool, theta_deg, cx, cy, r_in, r_out):
+    def _triangle_local(self, inner: bool, r_in, r_out) -> np.ndarray:
+        """Sommets (apex, base, base) du triangle pour un angle écran nul, en (x, y math)."""
         ring_th = (r_out - r_in)
         r_mid   = (r_in + r_out) * 0.5
         r_base  = (r_in + ring_th*0.02) if inner else (r_out - ring_th*0.02)
         r_apex  = r_mid
         dtheta_ref_deg = max(2.5, self.minor_step * 0.35)   # référence au rayon médian
-        dtheta_base_deg = dtheta_ref_deg * (r_mid / r_base) # même longueur de base
-        p1 = self._pt(cx, cy, r_apex, theta_deg)
-        p2 = self._pt(cx, cy, r_base, theta_deg - dtheta_base_deg)
-        p3 = self._pt(cx, cy, r_base, theta_deg + dtheta_base_deg)
-        path = QtGui.QPainterPath(p1); path.lineTo(p2); path.lineTo(p3); path.closeSubpath()
-        return path
+        dtheta_base = math.radians(dtheta_ref_deg * (r_mid / r_base))  # même longueur de base
+        return np.array([
+            [r_apex, 0.0],
+            [r_base * math.cos(dtheta_base), -r_base * math.sin(dtheta_base)],
+            [r_base * math.cos(dtheta_base),  r_base * math.sin(dtheta_base)],
+        ])
+
+    def _triangle_polygon(self, inner: bool, theta_deg, cx, cy, r_in, r_out) -> QtGui.QPolygonF:
+        """Triangle tourné vers theta_deg, écrit dans un QPolygonF réutilisé (un par indicateur)."""
+        if self._tri_local is None:
+            self._tri_local = {flag: self._triangle_local(flag, r_in, r_out) for flag in (True, False)}
+        a = self._theta_to_screen_rad(theta_deg)
+        ca, sa = math.cos(a), math.sin(a)
+        pts = self._tri_local[inner] @ np.array([[ca, sa], [-sa, ca]])
+        poly = self._tri_poly[inner]
+        for i, (x, y) in enumerate(pts.tolist()):
+            poly[i] = QtCore.QPointF(cx + x, cy - y)
+        return poly
+
+    def _tick_layout(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Vecteurs unitaires écran des ticks tracés et masque 'majeur', recalculés seulement si la config change."""
+        cfg = (self.start_angle, self._max_angle, self.minor_step, self.major_step,
+               self.major_anchor_deg, self.show_cardinals, self.origin_screen_deg, self._dir_sign)
+        cached = self._tick_cache
+        if cached is not None and cached[0] == cfg:
+            return cached[1]
+        steps = max(1, int(round(self.span_angle / self.minor_step)))
+        thetas = np.minimum(self.start_angle + np.arange(steps + 1) * self.minor_step, self._max_angle)
+        if self.show_cardinals:
+            t = np.mod(thetas, 360.0)
+            card_mask = np.any(np.abs(t[:, None] - _CARDINAL_DEGS) < 1e-6, axis=1)
+            thetas = thetas[~card_mask]  # remplacés par texte
+        rel = (thetas - self.major_anchor_deg) / self.major_step
+        major_mask = np.abs(rel - np.round(rel)) < 1e-6
+        scr = self._theta_to_screen_rad_np(thetas)
+        layout = (np.cos(scr), -np.sin(scr), major_mask)
+        self._tick_cache = (cfg, layout)
+        return layout
+
+    def _forbidden_arcs(self) -> List[Tuple[int, int]]:
+        """(start, span) drawArc des zones interdites, en 1/16°, recalculés seulement si plages ou orientation changent."""
+        cfg = (tuple(self._forbidden), self._min_angle, self._max_angle, self.origin_screen_deg, self._dir_sign)
+        cached = self._forbidden_draw
+        if cached is not None and cached[0] == cfg:
+            return cached[1]
+        arcs = np.clip(np.asarray(self._forbidden, dtype=np.float64).reshape(-1, 2),
+                       self._min_angle, self._max_angle)
+        arcs = arcs[arcs[:, 1] > arcs[:, 0]]
+        sa = ((self.origin_screen_deg + self._dir_sign * arcs[:, 0]) * 16.0).astype(int)
+        sp = ((self._dir_sign * (arcs[:, 1] - arcs[:, 0])) * 16.0).astype(int)
+        draw = list(zip(sa.tolist(), sp.tolist()))
+        self._forbidden_draw = (cfg, draw)
+        return draw
 
     # --- fond statique (dégradé orienté + ticks + liseré + cardinaux) ---------
-    def _rebuild_static(self) -> None:
+    def _make_static_key(self) -> str:
+        """Tout ce dont dépend _rebuild_static(): un retour à une taille/config déjà vue réutilise le pixmap."""
         dpr = float(self.devicePixelRatioF()) if hasattr(self, "devicePixelRatioF") else 1.0
-        pm = QtGui.QPixmap(max(1, int(self.width() * dpr)), max(1, int(self.height() * dpr)))
-        pm.setDevicePixelRatio(dpr)
-        pm.fill(_QCOLOR_BG)
-
-        p = QtGui.QPainter(pm)
+        return "AngleGauge|" + "|".join(map(str, (
+            self.width(), self.height(), dpr,
+            self.start_angle, self.span_angle, self.minor_step, self.major_step,
+            self.tick_minor_ratio, self.tick_major_ratio,
+            self.origin_screen_deg, self.clockwise, self.show_cardinals, self.major_anchor_deg,
+            self.gradient_angle_deg, self.gradient_color_start.name(), self.gradient_color_end.name(),
+            self.set_label_y_ratio, self.actual_label_y_ratio, self.error_label_y_ratio,
+            tuple(self._forbidden),
+        )))
+
+    def _disc_tile(self, cx: float, cy: float, R_inner: float, ring_w: float, dpr: float):
+        """Disque dégradé + liseré rendu une fois par (taille, angle, couleurs); renvoie (origine, pixmap)."""
+        r = R_inner * 0.96
+        pad = max(1.0, ring_w*0.08) / 2.0 + 1.0
+        # Origine alignée sur un pixel physique; la fraction restante fait partie de la clé
+        x0 = math.floor((cx - r - pad) * dpr) / dpr
+        y0 = math.floor((cy - r - pad) * dpr) / dpr
+        key = (r, dpr, cx - x0, cy - y0, self.gradient_angle_deg,
+               self.gradient_color_start.rgba(), self.gradient_color_end.rgba())
+        if key != self._disc_cache_key or self._disc_pm is None:
+            side = math.ceil(2.0 * (r + pad) * dpr) + 2
+            img = QtGui.QImage(side, side, QtGui.QImage.Format_ARGB32_Premultiplied)
+            img.setDevicePixelRatio(dpr)
+            img.fill(QtCore.Qt.transparent)
+            p = QtGui.QPainter(img)
+            p.setRenderHint(QtGui.QPainter.Antialiasing, True)
+            p.translate(-x0, -y0)
+
+            # Dégradé **linéaire** orientable avec couleurs configurables
+            ang = math.radians(self.gradient_angle_deg)
+            vx, vy = math.cos(ang), -math.sin(ang)
+            p1 = QtCore.QPointF(cx - vx*R_inner, cy - vy*R_inner)
+            p2 = QtCore.QPointF(cx + vx*R_inner, cy + vy*R_inner)
+            grad = QtGui.QLinearGradient(p1, p2)
+            grad.setColorAt(0.0, self.gradient_color_start)
+            grad.setColorAt(1.0, self.gradient_color_end)
+            p.setPen(QtCore.Qt.NoPen)
+            p.setBrush(QtGui.QBrush(grad))
+            ellipse_rect = QtCore.QRectF(cx - r, cy - r, 2*r, 2*r)
+            p.drawEllipse(ellipse_rect)
+
+            # Liseré
+            p.setPen(self._pen_liseret)
+            p.setBrush(QtCore.Qt.NoBrush)
+            p.drawEllipse(ellipse_rect)
+            p.end()
+
+            self._disc_pm = QtGui.QPixmap.fromImage(img, QtCore.Qt.NoFormatConversion)
+            self._disc_cache_key = key
+        return QtCore.QPointF(x0, y0), self._disc_pm
+
+    def _rebuild_static(self) -> QtGui.QPixmap:
+        dpr = float(self.devicePixelRatioF()) if hasattr(self, "devicePixelRatioF") else 1.0
+        w_px, h_px = max(1, int(self.width() * dpr)), max(1, int(self.height() * dpr))
+        # Tampon ARGB32 prémultiplié réutilisé tant que la taille ne change pas
+        img = self._static_image
+        if img is None or img.width() != w_px or img.height() != h_px:
+            img = self._static_image = QtGui.QImage(w_px, h_px, QtGui.QImage.Format_ARGB32_Premultiplied)
+        img.setDevicePixelRatio(dpr)
+        img.fill(_QCOLOR_BG)
+
+        p = QtGui.QPainter(img)
         p.setRenderHint(QtGui.QPainter.Antialiasing, True)
 
         cx, cy, R_outer, R_inner, ring_w = self._geom()
 
-        # Disque central: dégradé **linéaire** orientable avec couleurs configurables
-        ang = math.radians(self.gradient_angle_deg)
-        vx, vy = math.cos(ang), -math.sin(ang)
-        r = R_inner
-        p1 = QtCore.QPointF(cx - vx*r, cy - vy*r)
-        p2 = QtCore.QPointF(cx + vx*r, cy + vy*r)
-        grad = QtGui.QLinearGradient(p1, p2)
-        grad.setColorAt(0.0, self.gradient_color_start)
-        grad.setColorAt(1.0, self.gradient_color_end)
-        p.setPen(QtCore.Qt.NoPen)
-        p.setBrush(QtGui.QBrush(grad))
-        ellipse_rect = QtCore.QRectF(cx - R_inner*0.96, cy - R_inner*0.96, 2*R_inner*0.96, 2*R_inner*0.96)
-        p.drawEllipse(ellipse_rect)
-
-        # Liseré
-        p.setPen(QtGui.QPen(_QCOLOR_LISERET, max(1.0, ring_w*0.08)))
-        p.setBrush(QtCore.Qt.NoBrush)
-        p.drawEllipse(ellipse_rect)
+        # Disque central: tuile pré-rendue, simple blit ici
+        p.drawPixmap(*self._disc_tile(cx, cy, R_inner, ring_w, dpr))
 
         # Couronne
-        pen_ring = QtGui.QPen(_QCOLOR_RING, ring_w, QtCore.Qt.SolidLine, QtCore.Qt.FlatCap)
-        p.setPen(pen_ring)
+        p.setPen(self._pen_ring)
         rect_ring = QtCore.QRectF(cx - (R_inner + ring_w / 2.0), cy - (R_inner + ring_w / 2.0),
                                   2 * (R_inner + ring_w / 2.0), 2 * (R_inner + ring_w / 2.0))
-        start_qt = (self.origin_screen_deg - self.start_angle if self.clockwise
-                    else self.origin_screen_deg + self.start_angle) * 16.0
-        span_qt  = ( -self.span_angle if self.clockwise else self.span_angle ) * 16.0
+        start_qt = (self.origin_screen_deg + self._dir_sign * self.start_angle) * 16.0
+        span_qt  = self._dir_sign * self.span_angle * 16.0
         p.drawArc(rect_ring, int(start_qt), int(span_qt))
 
         # Zones interdites
         if self._forbidden:
-            pen_forbid = QtGui.QPen(_QCOLOR_FORBID, max(2.0, ring_w * 0.92),
-                                    QtCore.Qt.SolidLine, QtCore.Qt.FlatCap)
-            p.setPen(pen_forbid)
-            for a, b in self._forbidden:
-                a = _clamp(a, self._min_angle, self._max_angle)
-                b = _clamp(b, self._min_angle, self._max_angle)
-                if b > a:
-                    sa = (self.origin_screen_deg - a if self.clockwise
-                          else self.origin_screen_deg + a) * 16.0
-                    sp = (-(b - a) if self.clockwise else (b - a)) * 16.0
-                    p.drawArc(rect_ring, int(sa), int(sp))
+            p.setPen(self._pen_forbid)
+            for start, span in self._forbidden_arcs():
+                p.drawArc(rect_ring, start, span)
 
         # Graduations
-        tick_width = max(1.0, ring_w * 0.08)
-        p.setPen(QtGui.QPen(_QCOLOR_TICKS, tick_width, QtCore.Qt.SolidLine, QtCore.Qt.FlatCap))
+        p.setPen(self._pen_ticks)
         minor_len = ring_w * float(self.tick_minor_ratio)
         major_len = ring_w * float(self.tick_major_ratio)
 
-        def is_major(theta):
-            rel = (theta - self.major_anchor_deg) / self.major_step
-            return abs(rel - round(rel)) < 1e-6
-
-        def is_cardinal(theta):
-            t = theta % 360.0
-            return any(abs(t - c) < 1e-6 for c in (0.0, 90.0, 180.0, 270.0))
-
-        steps = max(1, int(round(self.span_angle / self.minor_step)))
-        for i in range(steps + 1):
-            theta = min(self.start_angle + i * self.minor_step, self._max_angle)
-            if self.show_cardinals and is_cardinal(theta):
-                continue  # remplacé par texte
-            length = major_len if is_major(theta) else minor_len
-            r1 = R_outer - length
-            r2 = R_outer - 1.0
-            p1c = self._pt(cx, cy, r1, theta)
-            p2c = self._pt(cx, cy, r2, theta)
-            p.drawLine(p1c, p2c)
+        # Tous les ticks en une passe NumPy, tracés par un seul drawLines()
+        ux, uy, major_mask = self._tick_layout()
+        x1, y1, x2, y2 = _tick_endpoints(ux, uy, major_mask, cx, cy, R_outer, minor_len, major_len)
+        p.drawLines(list(map(QtCore.QLineF, x1.tolist(), y1.tolist(), x2.tolist(), y2.tolist())))
 
         # Libellés cardinaux : petits, fins, non rognés et un peu plus dedans
+        # (QStaticText: mise en page des glyphes mémorisée d'une reconstruction à l'autre)
         if self.show_cardinals:
-            f_card = QtGui.QFont("DejaVu Sans", max(7, int(min(self.width(), self.height()) * 0.035)))
-            f_card.setBold(False)
-            p.setFont(f_card)
+            p.setFont(self._f_card)
             p.setPen(_QCOLOR_TICKS)
+            r_txt = R_outer - ring_w * 0.28
 
-            def draw_card(val_deg):
-                theta = val_deg
-                if theta < self._min_angle - 1e-6 or theta > self._max_angle + 1e-6:
-                    return
-                r_txt = R_outer - ring_w * 0.28
-                pos = self._pt(cx, cy, r_txt, theta)
-                txt = f"{int(val_deg)%360}"
-                fm = QtGui.QFontMetrics(f_card)
-                w = fm.width(txt) + 4
-                h = fm.height()
-                br = QtCore.QRectF(pos.x() - w/2.0, pos.y() - h/2.0, w, h)
-                p.drawText(br, QtCore.Qt.AlignCenter, txt)
-
-            if abs(self.span_angle - 360.0) < 1e-6:
-                for v in (0, 90, 180, 270): draw_card(v)
-            else:
-                for v in (0, 90): draw_card(v)
+            for v in ((0, 90, 180, 270) if abs(self.span_angle - 360.0) < 1e-6 else (0, 90)):
+                if v < self._min_angle - 1e-6 or v > self._max_angle + 1e-6:
+                    continue
+                st, half_w, half_h = self._card_text(v)
+                pos = self._pt(cx, cy, r_txt, v)
+                p.drawStaticText(QtCore.QPointF(pos.x() - half_w, pos.y() - half_h), st)
 
         # Libellés "Set/Actual/Error" : positions **indépendantes**
         p.setPen(_QCOLOR_LABEL)
-        s = min(self.width(), self.height())
-        f_label = QtGui.QFont("DejaVu Sans", max(8, int(s * 0.045))); f_label.setBold(True)
-        p.setFont(f_label)
-        lbl_h = R_inner * 0.15
+        p.setFont(self._f_label)
 
         def draw_label(text: str, y_ratio: float):
             y_center = cy + R_inner * y_ratio
-            p.drawText(QtCore.QRectF(cx - R_inner*0.9, y_center - lbl_h/2, 2*R_inner*0.9, lbl_h),
-                       QtCore.Qt.AlignHCenter | QtCore.Qt.AlignVCenter, text)
+            st = self._static(self._f_label, text)
+            size = st.size()
+            p.drawStaticText(QtCore.QPointF(cx - size.width()/2.0, y_center - size.height()/2.0), st)
 
         draw_label("Set",    self.set_label_y_ratio)
         draw_label("Actual", self.actual_label_y_ratio)
         draw_label("Error",  self.error_label_y_ratio)
 
         p.end()
-        self._static_cache = pm
+        return QtGui.QPixmap.fromImage(img, QtCore.Qt.NoFormatConversion)
 
 # ---------------- Démo locale ----------------
 if __name__ == "__main__":
@@ -558,16 +768,14 @@ if __name__ == "__main__":
             else:
                 sp1 = (a * 0.9) % 360
                 ac1 = (a * 1.1) % 360
-                g1.set_setpoint(sp1); g1.set_angle(ac1)
                 e1 = ((ac1 - sp1 + 540) % 360) - 180
                 if   e1 > 180: e1 -= 360
                 elif e1 < -180: e1 += 360
-                g1.set_error(e1/100)
+                g1.set_state(ac1, sp1, e1/100)
 
                 sp2 = -10 + ((a * 0.7) % 110)
                 ac2 = -10 + ((a * 0.95) % 110)
-                g2.set_setpoint(sp2); g2.set_angle(ac2)
-                g2.set_error(ac2 - sp2)
+                g2.set_state(ac2, sp2, ac2 - sp2)
 
             a += 1.8
             time.sleep(0.03)
@@ -1,7 +1,9 @@
 import datetime
-import numpy as np
 import math
+import numpy as np
+from functools import lru_cache
 
+from PyQt5.QtCore import QTimer
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 try:
@@ -10,12 +12,61 @@ try:
     import matplotlib.ticker as mticker
     from cartopy.mpl.ticker import LongitudeFormatter, LatitudeFormatter
     from cartopy.feature.nightshade import Nightshade
-    import matplotlib.animation as animation
+    from cartopy.io import shapereader
+    from matplotlib.collections import PathCollection
+    from shapely.geometry import box
+    try:
+        from cartopy.mpl.patch import shapely_to_path as _geometry_to_path
+    except ImportError:  # cartopy < 0.23
+        from cartopy.mpl.patch import geos_to_path as _geometry_to_path
     cartopy_available = True
 except ImportError:
     cartopy_available = False
 
 
+# The terminator moves ~0.25 deg per minute: refreshing it more often is wasted work.
+NIGHTSHADE_REFRESH_MS = 60_000
+# Upper bound on canvas redraws (~30 fps) whatever the rate of incoming updates.
+REDRAW_INTERVAL_MS = 33
+MAP_EXTENT = (-179.9, 180, -90, 90)
+MAP_SCALE = '110m'
+
+# (Natural Earth category, dataset name, FeatureArtist style) per static map layer.
+_FEATURE_SOURCES = {
+    'land': ('physical', 'land', {'edgecolor': 'face', 'facecolor': 'land'}),
+    'coastline': ('physical', 'coastline', {'edgecolor': 'black', 'facecolor': 'never'}),
+    'rivers': ('physical', 'rivers_lake_centerlines', {'edgecolor': 'water', 'facecolor': 'never'}),
+    'lakes': ('physical', 'lakes', {'edgecolor': 'face', 'facecolor': 'water'}),
+    'borders': ('cultural', 'admin_0_boundary_lines_land', {'edgecolor': 'black', 'facecolor': 'never'}),
+}
+
+
+@lru_cache(maxsize=8)
+def _cached_feature(name, extent, scale):
+    """Read a Natural Earth layer once and keep only the geometries inside ``extent``."""
+    category, dataset, style = _FEATURE_SOURCES[name]
+    reader = shapereader.Reader(shapereader.natural_earth(resolution=scale, category=category, name=dataset))
+    lon_min, lon_max, lat_min, lat_max = extent
+    area = box(lon_min, lat_min, lon_max, lat_max)
+    geometries = tuple(geom for geom in reader.geometries() if geom is not None and area.intersects(geom))
+    style = {key: cfeature.COLORS.get(value, value) for key, value in style.items()}
+    return cfeature.ShapelyFeature(geometries, ccrs.PlateCarree(), **style)
+
+
+def _endpoint(lat, lon, azimuth, length):
+    """Scalar end point (lon, lat) of a direction line; plain math avoids numpy overhead."""
+    azimuth_rad = math.radians(azimuth)
+    return lon + length * math.sin(azimuth_rad), lat + length * math.cos(azimuth_rad)
+
+
+def _endpoints(lats, lons, azimuths, length):
+    """Vectorized end points (lons, lats) for several direction lines at once."""
+    azimuth_rad = np.deg2rad(np.asarray(azimuths, dtype=float))
+    return (
+        np.asarray(lons, dtype=float) + length * np.sin(azimuth_rad),
+        np.asarray(lats, dtype=float) + length * np.cos(azimuth_rad),
+    )
+
 
 class MapCanvas(FigureCanvas):
     def __init__(self, parent=None):
@@ -26,7 +77,7 @@ class MapCanvas(FigureCanvas):
 
         if cartopy_available:
             self.axes = fig.add_subplot(1, 1, 1, projection=ccrs.PlateCarree())
-            self.axes.set_extent([-179.9, 180, -90, 90])
+            self.axes.set_extent(list(MAP_EXTENT))
 
             dlon, dlat = 60, 30
             xticks = np.arange(-180, 180.1, dlon)
@@ -49,46 +100,95 @@ class MapCanvas(FigureCanvas):
                 label.set_fontsize(18)
                 label.set_color('#CCE5FF')
 
-            self.current_nightshade = None
-            self.anime = animation.FuncAnimation(fig, self.compute_initial_figure, interval=1000, frames=100, repeat=True)
+            # Static base layer: added once, only the nightshade is refreshed afterwards.
+            # Ocean as the axes background instead of one more feature to project and draw.
+            self.axes.set_facecolor(cfeature.COLORS['water'])
+            self.axes.add_feature(_cached_feature('land', MAP_EXTENT, MAP_SCALE))
+            self.axes.add_feature(_cached_feature('coastline', MAP_EXTENT, MAP_SCALE), lw=1)
+            self.axes.add_feature(_cached_feature('rivers', MAP_EXTENT, MAP_SCALE), lw=0.25)
+            self.axes.add_feature(_cached_feature('lakes', MAP_EXTENT, MAP_SCALE))
+            self.axes.add_feature(_cached_feature('borders', MAP_EXTENT, MAP_SCALE), linestyle='-', lw=0.5)
+            # One nightshade artist for the canvas lifetime; update_nightshade only swaps its paths.
+            self._ns_artist = PathCollection(
+                [], facecolor='black', edgecolor='none', alpha=0.2, transform=self.axes.transData
+            )
+            self.axes.add_collection(self._ns_artist, autolim=False)
 
         super().__init__(fig)
+        self._pending_draw = False
+        self._pos_artist = None
 
-    def compute_initial_figure(self, frame):
         if cartopy_available:
-            self.axes.coastlines()
-            self.axes.add_feature(cfeature.LAND)
-            self.axes.add_feature(cfeature.COASTLINE, lw=1)
-            self.axes.add_feature(cfeature.RIVERS, lw=0.25)
-            self.axes.add_feature(cfeature.LAKES)
-            self.axes.add_feature(cfeature.BORDERS, linestyle='-', lw=0.5)
-            self.axes.add_feature(cfeature.OCEAN)
-            self.axes.add_feature(Nightshade(datetime.datetime.now(), alpha=0.2))
+            self.update_nightshade()
+            self._nightshade_timer = QTimer(self)
+            self._nightshade_timer.setInterval(NIGHTSHADE_REFRESH_MS)
+            self._nightshade_timer.timeout.connect(self.update_nightshade)
+            self._nightshade_timer.start()
+
+    # The nightshade timer only runs while the map is on screen (e.g. not in a hidden tab).
+    def showEvent(self, event):
+        super().showEvent(event)
+        if cartopy_available and not self._nightshade_timer.isActive():
+            self.update_nightshade()
+            self._nightshade_timer.start()
+
+    def hideEvent(self, event):
+        if cartopy_available:
+            self._nightshade_timer.stop()
+        super().hideEvent(event)
+
+    def _nightshade_paths(self):
+        nightshade = Nightshade(datetime.datetime.now(datetime.timezone.utc))
+        paths = []
+        for geometry in nightshade.geometries():
+            projected = self.axes.projection.project_geometry(geometry, nightshade.crs)
+            converted = _geometry_to_path(projected)
+            paths.extend(converted if isinstance(converted, list) else [converted])
+        return paths
 
     def update_nightshade(self):
         if cartopy_available:
-            if self.current_nightshade is not None:
-                self.current_nightshade.remove()
-            self.current_nightshade = Nightshade(datetime.datetime.now(), alpha=0.2)
-            self.axes.add_feature(self.current_nightshade)
-            self.axes.figure.canvas.draw_idle()
+            self._ns_artist.set_paths(self._nightshade_paths())
+            self._request_draw()
+
+    def _request_draw(self):
+        """Coalesce redraw requests into at most one draw_idle per REDRAW_INTERVAL_MS."""
+        if not self._pending_draw:
+            self._pending_draw = True
+            QTimer.singleShot(REDRAW_INTERVAL_MS, self._do_draw)
+
+    def _do_draw(self):
+        self._pending_draw = False
+        self.draw_idle()
 
     def update_figure(self, lat, lon):
         if cartopy_available:
-            self.axes.plot(lon, lat, 'ro', transform=ccrs.Geodetic())
+            if self._pos_artist is None:
+                self._pos_artist, = self.axes.plot([lon], [lat], 'ro', transform=ccrs.Geodetic())
+            else:
+                self._pos_artist.set_data([lon], [lat])
+            self._request_draw()
 
     def calculate_endpoint(self, lat, lon, azimuth, length=1):
-        azimuth_rad = math.radians(azimuth)
-        delta_lon = length * math.sin(azimuth_rad)
-        delta_lat = length * math.cos(azimuth_rad)
-        return lon + delta_lon, lat + delta_lat
+        return _endpoint(float(lat), float(lon), float(azimuth), float(length))
 
-    def plot_direction_line(self, object_line, start_lat, start_lon, azimuth, length=100, color='r-'):
-        if cartopy_available:
-            end_lon, end_lat = self.calculate_endpoint(start_lat, start_lon, azimuth, length)
+    def plot_direction_lines(self, object_lines, start_lats, start_lons, azimuths, length=100, color='r-'):
+        """Update (or create) one direction line per object, then request a single redraw."""
+        if not cartopy_available:
+            return list(object_lines)
+        start_lats = np.asarray(start_lats, dtype=float)
+        start_lons = np.asarray(start_lons, dtype=float)
+        end_lons, end_lats = _endpoints(start_lats, start_lons, azimuths, length)
+        lines = []
+        for object_line, lat0, lon0, lat1, lon1 in zip(object_lines, start_lats, start_lons, end_lats, end_lons):
             if object_line is None:
-                object_line, = self.axes.plot([start_lon, end_lon], [start_lat, end_lat], color, alpha=0.8, linewidth=3, transform=self.axes.projection)
+                object_line, = self.axes.plot([lon0, lon1], [lat0, lat1], color, alpha=0.8, linewidth=3, transform=self.axes.projection)
             else:
-                object_line.set_data([start_lon, end_lon], [start_lat, end_lat])
-            self.axes.figure.canvas.draw_idle()
-            return object_line
\ No newline at end of file
+                object_line.set_data([lon0, lon1], [lat0, lat1])
+            lines.append(object_line)
+        self._request_draw()
+        return lines
+
+    def plot_direction_line(self, object_line, start_lat, start_lon, azimuth, length=100, color='r-'):
+        if cartopy_available:
+            return self.plot_direction_lines([object_line], [start_lat], [start_lon], [azimuth], length, color)[0]
@@ -1,18 +1,17 @@
 from __future__ import annotations
 
 # gui/multi_track_card.py
-from datetime import datetime, timezone
 import time
+from datetime import datetime, timezone
 
-from PyQt5.QtCore import QEvent, Qt, pyqtSignal
+import numpy as np
+from PyQt5.QtCore import QAbstractListModel, QModelIndex, QRectF, QSize, Qt
+from PyQt5.QtGui import QColor, QCursor, QFont, QFontMetrics, QPainter, QPen
 from PyQt5.QtWidgets import (
-    QFormLayout,
+    QAbstractItemView,
     QFrame,
-    QGroupBox,
-    QHBoxLayout,
-    QLabel,
-    QScrollArea,
-    QSizePolicy,
+    QListView,
+    QStyledItemDelegate,
     QTabWidget,
     QVBoxLayout,
     QWidget,
@@ -22,82 +21,118 @@ from antrack.gui.event_countdown import format_next_event_countdown, next_event_
 
 PASTEL_GREEN = "#CCFFCC"
 PASTEL_RED = "#FFCCCC"
-BORDER_CSS = "border:1px solid #A0A0A0; border-radius:8px;"
+BORDER_COLOR = "#A0A0A0"
 CARD_WIDTH = 135
 
+_QCOLOR_BG = {PASTEL_GREEN: QColor(PASTEL_GREEN), PASTEL_RED: QColor(PASTEL_RED)}
+_CARD_ROWS = ("AOS:", "LOS:", "NEXT:", "DUR:", "MAX EL:", "EL NOW:")
+# Shared by every strip; created lazily once a QApplication exists.
+_HAND_CURSOR = None
+
+
+# (time.time() of the last refresh, UTC date): pose updates only need the day.
+_TODAY = [0.0, None]
+
+
+def _utc_today():
+    """UTC date, refreshed at most once per second."""
+    t = time.time()
+    if t - _TODAY[0] > 1.0 or _TODAY[1] is None:
+        _TODAY[0] = t
+        _TODAY[1] = datetime.now(timezone.utc).date()
+    return _TODAY[1]
 
-class MultiTrackCard(QGroupBox):
-    """Compact clickable card showing pass summary for one object."""
 
-    clicked = pyqtSignal(str, str)
+def _fmt_deg(value: float) -> str:
+    return f"{value:.1f}°" if np.isfinite(value) else "-"
 
-    def __init__(self, ephem, key: str, obj_type: str, name: str, parent=None, time_formatter=None, time_tooltip_formatter=None):
-        super().__init__(name, parent)
+
+class TrackModel(QAbstractListModel):
+    """Pass summary of every target of a strip, one row per target.
+
+    Numeric fields live in per-column arrays indexed by row; a pose update only
+    touches its row and emits a single dataChanged for it.
+    """
+
+    # Compact AOS/LOS strings shared by all models; relative to the UTC day they were built on.
+    _TIME_CACHE: dict = {}
+    _TIME_CACHE_DATE = None
+
+    def __init__(self, ephem, parent=None, time_formatter=None, time_tooltip_formatter=None):
+        super().__init__(parent)
         self.ephem = ephem
-        self.key = key
-        self.obj_type = obj_type
-        self.target_name = name
         self._time_formatter = time_formatter
         self._time_tooltip_formatter = time_tooltip_formatter
 
-        self.setMinimumWidth(CARD_WIDTH)
-        self.setMaximumWidth(CARD_WIDTH)
-        sp = self.sizePolicy()
-        sp.setHorizontalPolicy(QSizePolicy.Fixed)
-        sp.setVerticalPolicy(QSizePolicy.Minimum)
-        self.setSizePolicy(sp)
-        self.setCursor(Qt.PointingHandCursor)
-
-        self.setStyleSheet(
-            f"QGroupBox {{ {BORDER_CSS}; background:{PASTEL_RED}; font-weight:600; font-size:7pt; margin-top:8px; }}"
-            "QGroupBox::title { subcontrol-origin: margin; left: 10px; padding:0 3px; font-size:7pt; }"
-            "QLabel { background: transparent; font-size:7pt; }"
-        )
-
-        form = QFormLayout()
-        form.setContentsMargins(8, 6, 8, 4)
-        form.setHorizontalSpacing(6)
-        form.setVerticalSpacing(1)
-
-        self.lbl_aos = QLabel("-")
-        self.lbl_los = QLabel("-")
-        self.lbl_next = QLabel("-")
-        self.lbl_dur = QLabel("-")
-        self.lbl_maxel = QLabel("-")
-        self.lbl_now = QLabel("-")
-        for label in (
-            self.lbl_aos,
-            self.lbl_los,
-            self.lbl_next,
-            self.lbl_dur,
-            self.lbl_maxel,
-            self.lbl_now,
-        ):
-            label.setTextInteractionFlags(Qt.TextSelectableByMouse)
-
-        form.addRow("AOS:", self.lbl_aos)
-        form.addRow("LOS:", self.lbl_los)
-        form.addRow("NEXT:", self.lbl_next)
-        form.addRow("DUR:", self.lbl_dur)
-        form.addRow("MAX EL:", self.lbl_maxel)
-        form.addRow("EL NOW:", self.lbl_now)
-        self.setLayout(form)
-
-        self._press_ts = None
-        self._press_pos = None
-        for label in (
-            self.lbl_aos,
-            self.lbl_los,
-            self.lbl_next,
-            self.lbl_dur,
-            self.lbl_maxel,
-            self.lbl_now,
-        ):
-            label.installEventFilter(self)
+        self._keys: list[str] = []
+        self._types: list[str] = []
+        self._names: list[str] = []
+        self._row_by_key: dict[str, int] = {}
+        self._max_el = np.empty(0, dtype=float)
+        self._el_now = np.empty(0, dtype=float)
+        self._visible = np.empty(0, dtype=bool)
+        # Per-row texts: (aos, los, next, dur) and (aos, los, next) tooltips.
+        self._texts: list[tuple] = []
+        self._tips: list[tuple] = []
+        self._times_key: list = []
+        self._times_text: list[tuple] = []
 
         self.ephem.pose_updated.connect(self._on_pose_updated)
-        self.ephem.start_object(self.key, self.obj_type, self.target_name, interval=0.5)
 
+    # ----- Qt model API -----
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._keys)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row = index.row()
+        if role == Qt.DisplayRole:
+            return self._names[row]
+        if role == Qt.ToolTipRole:
+            aos_tip, los_tip, next_tip = self._tips[row]
+            return f"AOS: {aos_tip}\nLOS: {los_tip}\nNEXT: {next_tip}"
+        if role == Qt.BackgroundRole:
+            return _QCOLOR_BG[self.color(row)]
+        return None
+
+    # ----- rows -----
+    def add_target(self, key: str, obj_type: str, name: str) -> int:
+        row = self._row_by_key.get(key)
+        if row is not None:
+            return row
+        row = len(self._keys)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._keys.append(key)
+        self._types.append(obj_type)
+        self._names.append(name)
+        self._row_by_key[key] = row
+        self._max_el = np.append(self._max_el, np.nan)
+        self._el_now = np.append(self._el_now, np.nan)
+        self._visible = np.append(self._visible, False)
+        self._texts.append(("-", "-", "-", "-"))
+        self._tips.append(("-", "-", "-"))
+        self._times_key.append(None)
+        self._times_text.append(("-", "-", "-", "-"))
+        self.endInsertRows()
+        self.ephem.start_object(key, obj_type, name, interval=0.5)
+        return row
+
+    def keys(self) -> list[str]:
+        return list(self._keys)
+
+    def target(self, row: int) -> tuple[str, str]:
+        return self._types[row], self._names[row]
+
+    def color(self, row: int) -> str:
+        return PASTEL_GREEN if self._visible[row] else PASTEL_RED
+
+    def card_values(self, row: int) -> tuple:
+        """Values displayed by the delegate, in _CARD_ROWS order."""
+        aos, los, nxt, dur = self._texts[row]
+        return aos, los, nxt, dur, _fmt_deg(self._max_el[row]), _fmt_deg(self._el_now[row])
+
+    # ----- time formatting -----
     def _compact_time(self, utc_str: str) -> str | None:
         if not utc_str:
             return None
@@ -106,17 +141,28 @@ class MultiTrackCard(QGroupBox):
                 return self._time_formatter(utc_str, compact=True)
             except Exception:
                 pass
+        today = _utc_today()
+        cache = TrackModel._TIME_CACHE
+        if TrackModel._TIME_CACHE_DATE != today:
+            cache.clear()
+            TrackModel._TIME_CACHE_DATE = today
+        compact = cache.get(utc_str)
+        if compact is None:
+            compact = cache[utc_str] = self._format_compact_time(utc_str, today)
+        return compact
+
+    @staticmethod
+    def _format_compact_time(utc_str: str, today) -> str:
         try:
-            dt = datetime.strptime(utc_str, "%Y-%m-%d %H:%M:%S").replace(tzinfo=timezone.utc)
-            now = datetime.now(timezone.utc)
-            d_days = (dt.date() - now.date()).days
-            hhmm = dt.strftime("%H:%M")
+            dt = datetime.fromisoformat(utc_str.replace(" ", "T"))
+            d_days = (dt.date() - today).days
+            hhmm = f"{dt.hour:02d}:{dt.minute:02d}"
             if d_days == 0:
                 return hhmm
             if -2 <= d_days <= 2:
                 sign = "+" if d_days > 0 else "-"
                 return f"{sign}{abs(d_days)}j {hhmm}"
-            return dt.strftime("%m-%d %H:%M")
+            return f"{dt.month:02d}-{dt.day:02d} {hhmm}"
         except Exception:
             return utc_str
 
@@ -130,114 +176,156 @@ class MultiTrackCard(QGroupBox):
                 pass
         return utc_str
 
-    def eventFilter(self, obj, ev):
-        if ev.type() == QEvent.MouseButtonPress and ev.button() == Qt.LeftButton:
-            self._press_ts = time.monotonic()
-            self._press_pos = ev.globalPos()
-        elif ev.type() == QEvent.MouseButtonRelease and ev.button() == Qt.LeftButton:
-            if self._press_ts is not None and self._press_pos is not None:
-                dt = time.monotonic() - self._press_ts
-                moved = (ev.globalPos() - self._press_pos).manhattanLength()
-                if dt < 0.35 and moved <= 6:
-                    self.clicked.emit(self.obj_type, self.target_name)
-        return False
-
+    # ----- updates -----
     def _on_pose_updated(self, key: str, payload: dict):
-        if key != self.key or not isinstance(payload, dict):
+        row = self._row_by_key.get(key)
+        if row is None or not isinstance(payload, dict):
             return
 
         aos_full = payload.get("aos_utc")
         los_full = payload.get("los_utc")
-
-        self.lbl_aos.setText(self._compact_time(aos_full) or "-")
-        self.lbl_los.setText(self._compact_time(los_full) or "-")
-        self.lbl_aos.setToolTip(self._tooltip_time(aos_full))
-        self.lbl_los.setToolTip(self._tooltip_time(los_full))
-
-        self.lbl_next.setText(format_next_event_countdown(payload))
-        self.lbl_next.setToolTip(next_event_tooltip(payload))
-
-        self.lbl_dur.setText(payload.get("dur_str") or "-")
         max_el = payload.get("max_el_deg")
-        self.lbl_maxel.setText(f"{max_el:.1f}°" if isinstance(max_el, (int, float)) else "-")
         el_now = payload.get("el_now_deg", payload.get("el"))
-        self.lbl_now.setText(f"{el_now:.1f}°" if isinstance(el_now, (int, float)) else "-")
 
-        vis = payload.get("visible_now")
-        self._set_bg(PASTEL_GREEN if vis is True else PASTEL_RED)
+        # AOS/LOS strings rarely change between ticks: format them again only on change
+        # (or when the UTC day rolls over, since the compact form is relative to today).
+        times_key = (aos_full, los_full, _utc_today())
+        if times_key != self._times_key[row]:
+            self._times_key[row] = times_key
+            self._times_text[row] = (
+                self._compact_time(aos_full) or "-",
+                self._compact_time(los_full) or "-",
+                self._tooltip_time(aos_full),
+                self._tooltip_time(los_full),
+            )
+        aos_text, los_text, aos_tip, los_tip = self._times_text[row]
+
+        texts = (aos_text, los_text, format_next_event_countdown(payload), payload.get("dur_str") or "-")
+        tips = (aos_tip, los_tip, next_event_tooltip(payload))
+        max_el = float(max_el) if isinstance(max_el, (int, float)) else np.nan
+        el_now = float(el_now) if isinstance(el_now, (int, float)) else np.nan
+        visible = payload.get("visible_now") is True
+
+        changed = texts != self._texts[row] or tips != self._tips[row] or visible != self._visible[row]
+        for column, value in ((self._max_el, max_el), (self._el_now, el_now)):
+            old = column[row]
+            if not (old == value or (np.isnan(old) and np.isnan(value))):
+                column[row] = value
+                changed = True
+        if not changed:
+            return
 
-    def _set_bg(self, color: str):
-        self.setStyleSheet(
-            f"QGroupBox {{ {BORDER_CSS}; background:{color}; font-weight:600; font-size:7pt; margin-top:8px; }}"
-            "QGroupBox::title { subcontrol-origin: margin; left: 10px; padding:0 3px; font-size:7pt; }"
-            "QLabel { background: transparent; font-size:7pt; }"
-        )
+        self._texts[row] = texts
+        self._tips[row] = tips
+        self._visible[row] = visible
+        index = self.index(row)
+        self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.ToolTipRole, Qt.BackgroundRole])
 
-    def mousePressEvent(self, event):
-        if event.button() == Qt.LeftButton:
-            self.clicked.emit(self.obj_type, self.target_name)
-        super().mousePressEvent(event)
+    def stop_all(self):
+        for key in self._keys:
+            try:
+                self.ephem.stop_object(key)
+            except Exception:
+                pass
 
-    def closeEvent(self, event):
-        try:
-            self.ephem.stop_object(self.key)
-        except Exception:
-            pass
-        super().closeEvent(event)
 
+class TrackDelegate(QStyledItemDelegate):
+    """Paint one target row as a compact pass-summary card."""
 
-class MultiTrackStrip(QWidget):
-    """Horizontal scrollable strip of cards."""
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._title_font = QFont()
+        self._title_font.setPointSize(7)
+        self._title_font.setBold(True)
+        self._text_font = QFont()
+        self._text_font.setPointSize(7)
+        self._border_pen = QPen(QColor(BORDER_COLOR))
+        self._text_pen = QPen(QColor("#000000"))
+
+        fm = QFontMetrics(self._text_font)
+        self._line_h = fm.height() + 1
+        self._label_w = max(fm.horizontalAdvance(text) for text in _CARD_ROWS) + 6
+        self._title_h = QFontMetrics(self._title_font).height() + 4
+        self._size = QSize(CARD_WIDTH, self._title_h + self._line_h * len(_CARD_ROWS) + 10)
+
+    def sizeHint(self, option, index) -> QSize:
+        return self._size
+
+    def paint(self, painter, option, index):
+        model = index.model()
+        row = index.row()
+        rect = QRectF(option.rect).adjusted(0.5, 0.5, -0.5, -0.5)
+
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing, True)
+        painter.setPen(self._border_pen)
+        painter.setBrush(_QCOLOR_BG[model.color(row)])
+        painter.drawRoundedRect(rect, 8, 8)
+
+        painter.setPen(self._text_pen)
+        painter.setFont(self._title_font)
+        x = rect.left() + 8
+        painter.drawText(QRectF(x, rect.top() + 2, rect.width() - 16, self._title_h),
+                         Qt.AlignLeft | Qt.AlignVCenter, model.data(index, Qt.DisplayRole))
+
+        painter.setFont(self._text_font)
+        y = rect.top() + self._title_h + 2
+        value_w = rect.width() - 16 - self._label_w
+        for label, value in zip(_CARD_ROWS, model.card_values(row)):
+            painter.drawText(QRectF(x, y, self._label_w, self._line_h), Qt.AlignLeft | Qt.AlignVCenter, label)
+            painter.drawText(QRectF(x + self._label_w, y, value_w, self._line_h),
+                             Qt.AlignLeft | Qt.AlignVCenter, value)
+            y += self._line_h
+        painter.restore()
+
+
+class MultiTrackStrip(QListView):
+    """Horizontal scrollable strip of pass-summary cards (one view, one row per target)."""
 
     def __init__(self, ephem, on_pick, parent=None, time_formatter=None, time_tooltip_formatter=None):
         super().__init__(parent)
         self.ephem = ephem
         self.on_pick = on_pick
-        self.cards = {}
-        self._time_formatter = time_formatter
-        self._time_tooltip_formatter = time_tooltip_formatter
-
-        content = QWidget()
-        self.row = QHBoxLayout(content)
-        self.row.setContentsMargins(8, 8, 8, 8)
-        self.row.setSpacing(8)
-        self.row.setAlignment(Qt.AlignLeft | Qt.AlignTop)
-
-        scroll = QScrollArea(self)
-        scroll.setWidgetResizable(True)
-        scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-        scroll.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        scroll.setFrameShape(QFrame.NoFrame)
-        scroll.setWidget(content)
-
-        outer = QVBoxLayout(self)
-        outer.setContentsMargins(0, 0, 0, 0)
-        outer.addWidget(scroll)
-
-    def add_target(self, obj_type: str, name: str, key: str = None):
+        self.track_model = TrackModel(
+            ephem,
+            self,
+            time_formatter=time_formatter,
+            time_tooltip_formatter=time_tooltip_formatter,
+        )
+        self.setModel(self.track_model)
+        self.setItemDelegate(TrackDelegate(self))
+
+        self.setViewMode(QListView.ListMode)
+        self.setFlow(QListView.LeftToRight)
+        self.setWrapping(False)
+        self.setUniformItemSizes(True)
+        self.setSpacing(4)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
+        self.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.setFrameShape(QFrame.NoFrame)
+        self.setSelectionMode(QAbstractItemView.NoSelection)
+        self.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.setFocusPolicy(Qt.NoFocus)
+        global _HAND_CURSOR
+        if _HAND_CURSOR is None:
+            _HAND_CURSOR = QCursor(Qt.PointingHandCursor)
+        self.viewport().setCursor(_HAND_CURSOR)
+        self.viewport().setAutoFillBackground(False)
+        self.setStyleSheet("QListView { background: transparent; }")
+
+        self.clicked.connect(self._on_clicked)
+
+    def add_target(self, obj_type: str, name: str, key: str = None) -> str:
         key = key or f"mt:{obj_type}:{name}".lower().replace(" ", "_")
-        if key in self.cards:
-            return self.cards[key]
+        self.track_model.add_target(key, obj_type, name)
+        return key
 
-        card = MultiTrackCard(
-            self.ephem,
-            key,
-            obj_type,
-            name,
-            time_formatter=self._time_formatter,
-            time_tooltip_formatter=self._time_tooltip_formatter,
-        )
-        card.clicked.connect(lambda t=obj_type, n=name: self.on_pick(t, n))
-        self.row.addWidget(card, 0, Qt.AlignTop)
-        self.cards[key] = card
-        return card
+    def _on_clicked(self, index):
+        if index.isValid():
+            self.on_pick(*self.track_model.target(index.row()))
 
     def stop_all(self):
-        for key in list(self.cards):
-            try:
-                self.ephem.stop_object(key)
-            except Exception:
-                pass
+        self.track_model.stop_all()
 
 
 class MultiTrackTabsManager:
@@ -248,6 +336,7 @@ class MultiTrackTabsManager:
         self.on_pick = on_pick
         self.tab_widget = tab_widget
         self._strips_by_page = {}
+        self._pages_by_title = {}
         self._time_formatter = time_formatter
         self._time_tooltip_formatter = time_tooltip_formatter
 
@@ -256,9 +345,14 @@ class MultiTrackTabsManager:
             return tab
         if isinstance(tab, str):
             text = tab.strip().lower()
+            page = self._pages_by_title.get(text)
+            if page is not None and self.tab_widget.indexOf(page) >= 0:
+                return page
             for index in range(self.tab_widget.count()):
                 if self.tab_widget.tabText(index).strip().lower() == text:
-                    return self.tab_widget.widget(index)
+                    page = self.tab_widget.widget(index)
+                    self._pages_by_title[text] = page
+                    return page
         return None
 
     def _ensure_strip(self, page: QWidget) -> MultiTrackStrip:
@@ -11,53 +11,94 @@ if __package__ in (None, ""):
 
 from antrack.app_info import display_version
 
+import atexit
 import logging
-from logging.handlers import TimedRotatingFileHandler
-from PyQt5.QtWidgets import QApplication, QMessageBox
-from PyQt5.QtCore import QTimer
+import os
+import queue
+from typing import Optional
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener, TimedRotatingFileHandler
+from PyQt5.QtWidgets import QApplication, QLabel, QMessageBox
+from PyQt5.QtCore import Qt, QTimer
 
 from antrack.core.antenna.config import load_antenna_connection_config
-from antrack.threading_utils.thread_manager import ThreadManager
-from antrack.tracking.tracking_manager import TrackingManager
 from antrack.utils.paths import get_log_file, get_logs_dir
 from antrack.utils.settings_loader import load_settings, resolve_settings_path
-from antrack.gui.main_ui import MainUi
-
-# Configuration du logging (console + fichier tournant quotidien, conservation 7 jours)
-log_dir = get_logs_dir()
-log_dir.mkdir(parents=True, exist_ok=True)
-log_file = get_log_file()
-
-root_logger = logging.getLogger()
-root_logger.setLevel(logging.INFO)
-
-# Nettoyer d'éventuels handlers déjà présents (si basicConfig a été appelé ailleurs)
-if root_logger.handlers:
-    for h in list(root_logger.handlers):
-        root_logger.removeHandler(h)
-
-console_handler = logging.StreamHandler(sys.stdout)
-console_handler.setLevel(logging.INFO)
-console_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
-
-file_handler = TimedRotatingFileHandler(
-    str(log_file),
-    when="D",
-    interval=1,
-    backupCount=7,
-    encoding="utf-8",
-    utc=False,
-)
-file_handler.setLevel(logging.INFO)
-file_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
-
-root_logger.addHandler(console_handler)
-root_logger.addHandler(file_handler)
+
+# Écritures fichier groupées: vidage tous les 512 enregistrements, sur ERROR, ou par le timer de main()
+LOG_FLUSH_INTERVAL_MS = 30000
+
+_file_buffer: Optional[MemoryHandler] = None
+
+
+def _configure_logging(log_dir: Path, log_file: Path) -> MemoryHandler:
+    """Configure le logging (console + fichier tournant quotidien, conservation 7 jours), une seule fois."""
+    global _file_buffer
+    root_logger = logging.getLogger()
+    if getattr(root_logger, "_antrack_configured", False) and _file_buffer is not None:
+        return _file_buffer
+
+    log_dir.mkdir(parents=True, exist_ok=True)
+    root_logger.setLevel(logging.INFO)
+    # Aucun format n'utilise thread/process: on évite de les relever à chaque enregistrement
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+
+    # Nettoyer d'éventuels handlers déjà présents (si basicConfig a été appelé ailleurs)
+    if root_logger.handlers:
+        for h in list(root_logger.handlers):
+            root_logger.removeHandler(h)
+
+    # Un seul formateur, partagé par la console et le fichier
+    formatter = logging.Formatter("{asctime} - {name} - {levelname} - {message}", style="{")
+
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.setLevel(logging.INFO)
+    console_handler.setFormatter(formatter)
+
+    file_handler = TimedRotatingFileHandler(
+        str(log_file),
+        when="D",
+        interval=1,
+        backupCount=7,
+        encoding="utf-8",
+        utc=False,
+    )
+    file_handler.setLevel(logging.INFO)
+    file_handler.setFormatter(formatter)
+
+    file_buffer = MemoryHandler(512, flushLevel=logging.ERROR, target=file_handler, flushOnClose=True)
+    file_buffer.setLevel(logging.INFO)
+
+    # Les appels logger.* ne font que déposer l'enregistrement dans une file; l'écriture console/fichier
+    # (et la rotation) se fait dans le thread du QueueListener, hors du thread Qt.
+    log_queue = queue.SimpleQueue()
+    root_logger.addHandler(QueueHandler(log_queue))
+    log_listener = QueueListener(log_queue, console_handler, file_buffer, respect_handler_level=True)
+    log_listener.start()
+    atexit.register(log_listener.stop)
+
+    root_logger._antrack_configured = True
+    _file_buffer = file_buffer
+    return file_buffer
+
 
 logger = logging.getLogger("main")
 
 
+def _show_splash(app_version: str) -> QLabel:
+    """Minimal splash shown while the heavy GUI modules are imported."""
+    splash = QLabel(f"Antenna Noise Tracker {app_version}\nChargement...")
+    splash.setWindowFlags(Qt.SplashScreen | Qt.FramelessWindowHint)
+    splash.setAlignment(Qt.AlignCenter)
+    splash.setMargin(24)
+    splash.show()
+    QApplication.processEvents()
+    return splash
+
+
 def main() -> int:
+    file_buffer = _configure_logging(get_logs_dir(), get_log_file())
     app_version = display_version()
     logger.info(
         "\n"
@@ -67,10 +108,20 @@ def main() -> int:
     )
     logger.info(f"Version application: {app_version}")
 
-    app = None
+    # Qt app first, outside the try: the splash appears before settings and GUI modules are
+    # loaded, and the error dialog below never has to create a second QApplication
+    app = QApplication(sys.argv)
+    app.setApplicationName("Antenna Noise Tracker")
+    splash = None
     thread_manager = None
 
     try:
+        log_flush_timer = QTimer(app)
+        log_flush_timer.timeout.connect(file_buffer.flush)
+        log_flush_timer.start(LOG_FLUSH_INTERVAL_MS)
+        app.aboutToQuit.connect(file_buffer.flush)
+        splash = _show_splash(app_version)
+
         # Settings
         settings_path = resolve_settings_path()
         logger.info(f"Chargement des paramètres depuis: {settings_path}")
@@ -87,20 +138,26 @@ def main() -> int:
             antenna_config.axis_server.port,
         )
 
-        # Qt app
-        app = QApplication(sys.argv)
-        app.setApplicationName("Antenna Noise Tracker")
+        # Deferred imports: MainUi pulls in the whole GUI stack (widgets, ephemeris, plots)
+        from antrack.threading_utils.thread_manager import ThreadManager
+        from antrack.tracking.tracking_manager import TrackingManager
+        from antrack.gui.main_ui import MainUi
 
         # Thread manager
         thread_manager = ThreadManager(max_workers=max_workers)
         thread_manager.tracking_manager = TrackingManager(thread_manager=thread_manager, settings=settings)
+        # Threads du pool créés maintenant plutôt que pendant les premières frames de l'UI
+        thread_manager.prewarm(min(os.cpu_count() or 1, 4))
         logger.info("Gestionnaire de threads initialisé")
 
         # UI
         ui = MainUi(thread_manager=thread_manager, settings=settings)
         ui.show()
+        splash.close()
+        splash = None
         logger.info("Interface graphique initialisée")
 
+        logger.debug("Entrée dans la boucle d'événements Qt")
         exit_code = app.exec_()
 
         logger.info("Fermeture de l'application...")
@@ -111,9 +168,8 @@ def main() -> int:
     except Exception as e:
         logger.exception("Erreur lors de l'initialisation de l'application")
 
-        # Ensure a QApplication exists before showing a QMessageBox
-        if QApplication.instance() is None:
-            app = QApplication(sys.argv)
+        if splash is not None:
+            splash.close()
 
         QMessageBox.critical(
             None,
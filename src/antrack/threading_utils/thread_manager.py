@@ -3,15 +3,19 @@
 from __future__ import annotations
 
 import logging
+import threading
 import time
 import traceback
+import weakref
 from collections import deque
 from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import partial
 from typing import Any, Callable, Deque, Dict, List, Optional
 
-from PyQt5.QtCore import QObject, QThread, pyqtSignal
+from PyQt5 import sip
+from PyQt5.QtCore import QObject, QRunnable, Qt, QThreadPool, pyqtSignal, pyqtSlot
 
 
 class TaskStatus(Enum):
@@ -40,29 +44,66 @@ class TaskRecord:
     cancel_requested: bool = False
 
 
-class Worker(QObject):
-    """Worker that executes a function in a dedicated QThread."""
+class WorkerSignals(QObject):
+    """Signals of a Worker; QRunnable is not a QObject, so they live on this helper."""
 
     status = pyqtSignal(str)
     error = pyqtSignal(str)
     result = pyqtSignal(object)
     finished = pyqtSignal()
+    _relay = pyqtSignal(str, object)
+
+    def __init__(self) -> None:
+        super().__init__()
+        # A pooled thread can run the task before start_thread()'s caller has connected its
+        # slots; relaying through this object's thread defers every emission by one event-loop pass.
+        self._relay.connect(self._emit_relayed, Qt.QueuedConnection)
+
+    def relay(self, name: str, payload: Any = None) -> None:
+        """Emit ``name`` from this object's thread (callable from any thread)."""
+        self._relay.emit(name, payload)
+
+    @pyqtSlot(str, object)
+    def _emit_relayed(self, name: str, payload: Any) -> None:
+        if name == "finished":
+            self.finished.emit()
+        else:
+            getattr(self, name).emit(payload)
+
+
+class Worker(QRunnable):
+    """Worker that executes a function on the ThreadManager thread pool."""
 
     def __init__(self, func: Callable, *args, **kwargs) -> None:
         super().__init__()
+        # The ThreadManager keeps the reference; the pool must not delete the runnable itself
+        self.setAutoDelete(False)
+        self.signals = WorkerSignals()
+        self.status = self.signals.status
+        self.error = self.signals.error
+        self.result = self.signals.result
+        self.finished = self.signals.finished
         self.func = func
         self.args = args
         self.kwargs = kwargs
         self.abort = False
         self.last_exception: Optional[BaseException] = None
         self.last_traceback: Optional[str] = None
+        self._done = threading.Event()
+
+    def _relay(self, name: str, payload: Any = None) -> None:
+        # At interpreter exit the signals object may already be gone; nothing may escape run()
+        try:
+            self.signals.relay(name, payload)
+        except RuntimeError:
+            pass
 
     def run(self) -> None:
         """Execute the function and emit status, result, and errors."""
         logger = logging.getLogger("ThreadManager.Worker")
         try:
             msg = f"START func={getattr(self.func, '__name__', str(self.func))}"
-            self.status.emit(msg)
+            self._relay("status", msg)
             logger.info(msg)
         except Exception:
             pass
@@ -70,7 +111,7 @@ class Worker(QObject):
         try:
             if not self.abort:
                 result = self.func(*self.args, **self.kwargs)
-                self.result.emit(result)
+                self._relay("result", result)
         except Exception as exc:
             self.last_exception = exc
             self.last_traceback = traceback.format_exc()
@@ -82,33 +123,64 @@ class Worker(QObject):
                 )
             except Exception:
                 pass
-            self.error.emit(str(exc))
+            self._relay("error", str(exc))
         finally:
             try:
                 msg = f"FINISH func={getattr(self.func, '__name__', str(self.func))}"
-                self.status.emit(msg)
+                self._relay("status", msg)
                 logger.info(msg)
             except Exception:
                 pass
-            self.finished.emit()
+            try:
+                self._relay("finished")
+            finally:
+                self._done.set()
+
+
+class PooledThread:
+    """QThread-like view of a pooled Worker, so callers can keep using threads[name].isRunning()."""
+
+    __slots__ = ("worker",)
+
+    def __init__(self, worker: Worker) -> None:
+        self.worker = worker
+
+    def isRunning(self) -> bool:  # noqa: N802 - QThread API
+        """True from submission until the worker has returned (queued tasks count as running)."""
+        return not self.worker._done.is_set()
+
+    def isFinished(self) -> bool:  # noqa: N802 - QThread API
+        return self.worker._done.is_set()
+
+    def quit(self) -> None:
+        """No-op: pooled workers have no event loop; cancellation goes through Worker.abort."""
+
+    def wait(self, msecs: Optional[int] = None) -> bool:
+        return self.worker._done.wait(None if msecs is None else max(0, msecs) / 1000.0)
 
 
 class ThreadManager:
     """Background task manager with diagnostics and clean shutdown."""
 
-    def __init__(self, max_workers: int = 4) -> None:
-        self.threads: Dict[str, QThread] = {}
+    def __init__(self, max_workers: int = 4, max_threads: int = 32) -> None:
+        self.threads: Dict[str, PooledThread] = {}
         self.workers: Dict[str, Worker] = {}
         self.logger = logging.getLogger("ThreadManager")
         self.asyncio_loops: Dict[str, Any] = {}
         self._tasks: Dict[str, TaskRecord] = {}
         self._history: Deque[str] = deque(maxlen=200)
+        # Bumped whenever a task is added, removed or changes status (see diagnostics_revision)
+        self._revision = 0
         self._shutdown_started = False
         self.max_workers = int(max(1, max_workers))
         self.executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="AntrackPool")
+        # Named tasks (start_thread) reuse the threads of this pool; most of them are long-running
+        # loops, so the bound must stay above the number of loops alive at once.
+        self._pool = QThreadPool()
+        self._pool.setMaxThreadCount(int(max(1, max_threads)))
 
     def start_thread(self, thread_name: str, func: Callable, *args, **kwargs) -> Worker:
-        """Start a function in a dedicated QThread.
+        """Start a function on the named-task thread pool.
 
         Args:
             thread_name: Unique task/thread identifier.
@@ -135,17 +207,10 @@ class ThreadManager:
                 self.logger.info("start_thread('%s'): thread still running; reuse", thread_name)
                 return self.workers[thread_name]
             self.logger.info("start_thread('%s'): previous thread finished; recreating", thread_name)
-            try:
-                th.quit()
-                th.wait(500)
-            except Exception:
-                pass
             self.threads.pop(thread_name, None)
             self.workers.pop(thread_name, None)
 
-        thread = QThread()
         worker = Worker(func, *args, **kwargs)
-        worker.moveToThread(thread)
 
         record = self._ensure_task(thread_name, description=getattr(func, "__name__", str(func)))
         record.status = TaskStatus.RUNNING
@@ -156,31 +221,45 @@ class ThreadManager:
         record.last_traceback = None
         record.last_status = None
         record.cancel_requested = False
+        self._revision += 1
 
-        thread.started.connect(worker.run)
-        worker.finished.connect(thread.quit)
-        worker.finished.connect(worker.deleteLater)
-        thread.finished.connect(thread.deleteLater)
-        thread.finished.connect(lambda: self._cleanup_thread(thread_name))
+        # Weak reference: a strong one would keep the worker alive through its own signal connection
+        worker_ref = weakref.ref(worker)
+        worker.finished.connect(partial(self._on_worker_finished, thread_name, worker_ref))
         try:
-            worker.error.connect(lambda msg, name=thread_name: self._record_error(name, msg))
+            worker.error.connect(partial(self._record_error, thread_name))
         except Exception:
             pass
         try:
-            worker.status.connect(lambda msg, name=thread_name: self._record_status(name, msg))
+            worker.status.connect(partial(self._record_status, thread_name))
         except Exception:
             pass
 
-        self.threads[thread_name] = thread
+        self.threads[thread_name] = PooledThread(worker)
         self.workers[thread_name] = worker
 
-        thread.start()
+        if self._pool.activeThreadCount() >= self._pool.maxThreadCount():
+            self.logger.warning(
+                "Thread '%s' queued: all %d pool threads are busy", thread_name, self._pool.maxThreadCount()
+            )
+        self._pool.start(worker)
         self.logger.info("Thread '%s' started", thread_name)
 
         return worker
 
-    def _cleanup_thread(self, thread_name: str) -> None:
-        """Finalize task state after thread completion."""
+    def _on_worker_finished(self, thread_name: str, worker_ref: "weakref.ref[Worker]") -> None:
+        worker = worker_ref()
+        if worker is not None:
+            self._cleanup_thread(thread_name, worker)
+
+    def _cleanup_thread(self, thread_name: str, worker: Optional[Worker] = None) -> None:
+        """Finalize task state after thread completion.
+
+        ``worker`` is the run that finished; a late notification from a run that has already been
+        replaced under the same name is ignored.
+        """
+        if worker is not None and self.workers.get(thread_name) is not worker:
+            return
         record = self._tasks.get(thread_name)
         if record and record.status in (TaskStatus.RUNNING, TaskStatus.FAILED, TaskStatus.CANCELLED):
             record.finished_at = time.time()
@@ -193,6 +272,7 @@ class ThreadManager:
                 else:
                     record.status = TaskStatus.FINISHED
             self._retain_history(thread_name)
+            self._revision += 1
 
         if thread_name in self.threads:
             self.threads.pop(thread_name, None)
@@ -212,6 +292,7 @@ class ThreadManager:
             record.cancel_requested = True
             if record.status == TaskStatus.RUNNING:
                 record.status = TaskStatus.CANCELLED
+                self._revision += 1
 
         if thread_name in self.workers:
             self.workers[thread_name].abort = True
@@ -233,6 +314,31 @@ class ThreadManager:
             raise RuntimeError("ThreadManager is shutting down; pooled tasks are rejected")
         return self.executor.submit(func, *args, **kwargs)
 
+    def prewarm(self, n: Optional[int] = None) -> List[Any]:
+        """Start up to ``n`` worker threads now rather than on the first task.
+
+        Both pools are warmed: the executor behind submit_task() and the QThreadPool that runs
+        start_thread() tasks. Each warm-up task waits on a barrier shared with its pool so no
+        thread can take two of them. The caller does not wait; the returned executor futures
+        complete once those threads exist.
+        """
+        requested = int(n) if n else self.max_workers
+
+        def _barrier_wait(barrier: threading.Barrier) -> None:
+            try:
+                barrier.wait(timeout=2.0)
+            except threading.BrokenBarrierError:
+                pass
+
+        pool_count = max(1, min(self._pool.maxThreadCount(), requested))
+        pool_barrier = threading.Barrier(pool_count)
+        for _ in range(pool_count):
+            self._pool.start(partial(_barrier_wait, pool_barrier))
+
+        count = max(1, min(self.max_workers, requested))
+        barrier = threading.Barrier(count)
+        return [self.submit_task(_barrier_wait, barrier) for _ in range(count)]
+
     def shutdown(self, graceful: bool = True, timeout_s: float = 5.0) -> None:
         """Shutdown all tasks with a bounded timeout.
 
@@ -256,27 +362,52 @@ class ThreadManager:
             if graceful:
                 self._request_cancel(thread_name)
 
-        for thread_name, thread in list(self.threads.items()):
-            remaining = max(0.0, timeout_s - (time.time() - start))
-            if remaining <= 0:
-                break
+        # Tasks still waiting for a pool thread are dropped rather than started during shutdown
+        for thread_name, worker in list(self.workers.items()):
             try:
-                thread.quit()
-                thread.wait(int(remaining * 1000))
+                if self._pool.tryTake(worker):
+                    worker._done.set()
+                    self._cleanup_thread(thread_name, worker)
             except Exception:
                 pass
+        try:
+            self._pool.clear()
+            remaining = max(0.0, timeout_s - (time.time() - start))
+            self._pool.waitForDone(int(remaining * 1000))
+        except Exception:
+            pass
 
+        stragglers = []
         for thread_name, thread in list(self.threads.items()):
             if thread.isRunning():
+                stragglers.append(self.workers.get(thread_name))
                 record = self._tasks.get(thread_name)
                 if record:
                     record.last_status = "shutdown timeout"
                 self.logger.warning("Thread '%s' still running after shutdown timeout", thread_name)
+        if stragglers:
+            self._release_to_cpp(stragglers)
         try:
             self.executor.shutdown(wait=False, cancel_futures=False)
         except Exception:
             pass
 
+    def _release_to_cpp(self, workers: List[Optional[Worker]]) -> None:
+        """Hand the pool and still-running workers over to C++.
+
+        PyQt destroys Python-owned Qt objects at interpreter exit: the pool destructor would block
+        until every task returned, and a running worker would lose its signals object mid-run.
+        Owned by C++, they simply outlive the interpreter and die with the process.
+        """
+        try:
+            sip.transferto(self._pool, None)
+            for worker in workers:
+                if worker is not None:
+                    sip.transferto(worker.signals, None)
+                    sip.transferto(worker, None)
+        except Exception as exc:
+            self.logger.error("Unable to detach running tasks from shutdown: %s", exc)
+
     def _request_cancel(self, thread_name: str) -> None:
         record = self._tasks.get(thread_name)
         if record:
@@ -303,6 +434,7 @@ class ThreadManager:
         if record:
             record.last_error = msg
             record.status = TaskStatus.FAILED
+            self._revision += 1
             worker = self.workers.get(thread_name)
             if worker and worker.last_traceback:
                 record.last_traceback = worker.last_traceback
@@ -345,6 +477,10 @@ class ThreadManager:
             }
         return out
 
+    def diagnostics_revision(self) -> int:
+        """Counter that changes whenever get_diagnostics() would list different tasks or statuses."""
+        return self._revision
+
     def get_running_tasks(self) -> Dict[str, Dict[str, Any]]:
         """Return running tasks with diagnostic fields."""
         diag = self.get_diagnostics()
@@ -372,6 +508,7 @@ class ThreadManager:
         else:
             self._tasks.clear()
         self._history.clear()
+        self._revision += 1
 
     def diagnostics_summary(self) -> str:
         """Return a textual summary of task diagnostics."""
@@ -433,12 +570,16 @@ class ThreadManager:
         if not ready:
             self.logger.error("Asyncio loop '%s' did not init in time", loop_name)
 
-    def run_coro(self, loop_name: str, coro_or_factory, timeout: float = None):
-        """Run a coroutine on a persistent asyncio loop and return its result."""
-        fut = self.submit_coro(loop_name, coro_or_factory)
+    def run_coro(self, loop_name: str, coro_or_factory, *args, timeout: float = None):
+        """Run a coroutine on a persistent asyncio loop and return its result.
+
+        Extra positional args are passed to ``coro_or_factory`` when it is callable,
+        so callers can hand over a bound coroutine method without wrapping it in a lambda.
+        """
+        fut = self.submit_coro(loop_name, coro_or_factory, *args)
         return fut.result(timeout=timeout) if timeout is not None else fut.result()
 
-    def submit_coro(self, loop_name: str, coro_or_factory):
+    def submit_coro(self, loop_name: str, coro_or_factory, *args):
         """Schedule a coroutine on a persistent loop without blocking the caller."""
         import asyncio as _asyncio
 
@@ -447,7 +588,7 @@ class ThreadManager:
         if loop is None:
             raise RuntimeError(f"Asyncio loop '{loop_name}' not initialized")
         try:
-            coro = coro_or_factory() if callable(coro_or_factory) else coro_or_factory
+            coro = coro_or_factory(*args) if callable(coro_or_factory) else coro_or_factory
         except Exception:
             raise
         return _asyncio.run_coroutine_threadsafe(coro, loop)
@@ -84,6 +84,28 @@ class Dec:
 
 # --- Tracked target ---
 class TrackedObject:
+    # Slots keep the setpoint/error reads done by the tracking loop and the 10 Hz UI timer cheap.
+    __slots__ = (
+        "az_set",
+        "el_set",
+        "az_theoretical_deg",
+        "el_theoretical_deg",
+        "az_error",
+        "el_error",
+        "snr_db",
+        "snr_mode",
+        "scan_offset_az_deg",
+        "scan_offset_el_deg",
+        "scan_probe_offset_az_deg",
+        "scan_probe_offset_el_deg",
+        "distance_km",
+        "ra_set",
+        "dec_set",
+        "ra_error",
+        "dec_error",
+        "distance_au",
+    )
+
     def __init__(self):
         self.az_set: float = 0.0
         self.el_set: float = 0.0
@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 import os
+from functools import lru_cache
 from pathlib import Path
 
 
+@lru_cache(maxsize=1)
 def get_repo_root() -> Path:
     """Return the repository root (dev mode only)."""
     return Path(__file__).resolve().parents[3]
@@ -56,13 +58,15 @@ def get_config_path() -> Path:
     override = os.getenv("ANTRACK_CONFIG_PATH")
     if override:
         return Path(override).expanduser().resolve()
-
-    repo_default = get_repo_root() / "settings.txt"
-    if repo_default.exists():
-        return repo_default.resolve()
-
-    legacy = get_src_root() / "antrack" / "settings.cfg"
-    if legacy.exists():
-        return legacy.resolve()
-
-    return repo_default.resolve()
+    return _default_config_path()
+
+
+@lru_cache(maxsize=1)
+def _default_config_path() -> Path:
+    """Probe the repo-local and legacy settings files once per process."""
+    # The repo root is already resolved, so each candidate costs a single stat
+    candidates = (
+        get_repo_root() / "settings.txt",
+        get_src_root() / "antrack" / "settings.cfg",
+    )
+    return next((path for path in candidates if path.is_file()), candidates[0])
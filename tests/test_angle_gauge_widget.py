@@ -0,0 +1,267 @@
+import os
+
+import numpy as np
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtCore import QEvent, Qt
+from PyQt5.QtTest import QTest
+from PyQt5.QtWidgets import QApplication
+
+from antrack.gui.widgets.angle_gauge_widget import AngleGauge, _finite_float, _split_fixed, _tick_endpoints
+
+
+def test_text_metrics_are_cached_across_paints_and_reset_on_font_change():
+    app = QApplication.instance() or QApplication([])
+    gauge = AngleGauge(decimals=2)
+    gauge.resize(200, 200)
+    gauge._set_angle_gui(123.45)
+    gauge._set_setpt_gui(None)
+
+    gauge.grab()
+    metrics = dict(gauge._fm_cache)
+    assert metrics
+    # Une seule hauteur par police, quels que soient les décimales et le gabarit
+    assert set(metrics) <= {gauge._f_act.key(), gauge._f_set.key(), gauge._f_err.key()}
+    assert any(text == "123" for _, text in gauge._static_text)
+    assert any(text == ".--°" for _, text in gauge._static_text)
+
+    gauge.grab()
+    assert gauge._fm_cache == metrics
+
+    QApplication.sendEvent(gauge, QEvent(QEvent.FontChange))
+    assert gauge._fm_cache == {}
+    assert gauge._static_text == {}
+    app.processEvents()
+
+
+def test_cardinal_labels_are_measured_once_per_font():
+    app = QApplication.instance() or QApplication([])
+    gauge = AngleGauge(span_angle=360.0, show_cardinal_labels=True)
+    gauge.resize(210, 210)
+    app.sendPostedEvents()
+
+    gauge._rebuild_static()
+    entries = dict(gauge._card_offset)
+    assert sorted(entries) == [0, 90, 180, 270]
+
+    gauge._rebuild_static()
+    assert all(gauge._card_offset[v] is entries[v] for v in entries)
+
+    QApplication.sendEvent(gauge, QEvent(QEvent.FontChange))
+    assert gauge._card_offset == {}
+
+
+def test_split_fixed_quantizes_to_displayed_precision():
+    assert _split_fixed(123.456, 2) == ("123", ".46°")
+    assert _split_fixed(-5.5, 2) == ("-5", ".50°")
+    assert _split_fixed(0.05, 2) == ("0", ".05°")
+    assert _split_fixed(359.999, 2) == ("360", ".00°")
+    assert _split_fixed(-0.001, 2) == ("0", ".00°")
+    assert _split_fixed(42.7, 0) == ("43", "°")
+
+
+def test_unchanged_values_do_not_schedule_a_repaint(monkeypatch):
+    app = QApplication.instance() or QApplication([])
+    gauge = AngleGauge(decimals=2)
+    updates = []
+    monkeypatch.setattr(gauge, "_schedule_update", lambda: updates.append(True))
+
+    gauge._set_angle_gui(10.0)
+    gauge._set_angle_gui(10.0)
+    gauge._set_error_gui(0.01)
+    gauge._set_error_gui(0.01)
+    gauge._set_setpt_gui(None)
+    gauge._set_setpt_gui(float("nan"))
+
+    assert len(updates) == 3
+    assert app is not None
+
+
+def test_static_layer_is_reused_when_returning_to_a_previous_size(monkeypatch):
+    app = QApplication.instance() or QApplication([])
+    gauge = AngleGauge(span_angle=123.0)
+    rebuilds = []
+    original = gauge._rebuild_static
+
+    def counting_rebuild():
+        rebuilds.append(gauge.size())
+        return original()
+
+    monkeypatch.setattr(gauge, "_rebuild_static", counting_rebuild)
+
+    for size in ((200, 200), (260, 260), (200, 200)):
+        gauge.resize(*size)
+        app.sendPostedEvents()
+        gauge.grab()
+
+    assert len(rebuilds) == 2
+
+
+def test_gradient_disc_tile_survives_static_rebuilds_until_its_inputs_change():
+    app = QApplication.instance() or QApplication([])
+    gauge = AngleGauge(span_angle=360.0)
+    gauge.resize(220, 220)
+    app.sendPostedEvents()
+    gauge.grab()
+    tile = gauge._disc_pm
+
+    gauge.configure(major_step=45.0)
+    gauge.resize(240, 220)
+    app.sendPostedEvents()
+    gauge.grab()
+    assert gauge._disc_pm is tile
+
+    gauge.configure(gradient_angle_deg=45.0)
+    gauge.grab()
+    assert gauge._disc_pm is not tile
+
+
+def test_setter_bursts_are_coalesced_into_one_update(monkeypatch):
+    app = QApplication.instance() or QApplication([])
+    gauge = AngleGauge(decimals=2)
+    updates = []
+    monkeypatch.setattr(gauge, "update", lambda *args: updates.append(args))
+    gauge._coalesce_timer.timeout.disconnect()
+    gauge._coalesce_timer.timeout.connect(gauge.update)
+    gauge.show()
+
+    gauge._set_angle_gui(10.0)
+    gauge._set_setpt_gui(20.0)
+    gauge._set_error_gui(0.5)
+    assert updates == []
+    assert gauge._coalesce_timer.isActive()
+
+    QTest.qWait(50)
+    assert len(updates) == 1
+    assert app is not None
+
+
+def test_hidden_or_minimized_gauge_does_not_schedule_repaints():
+    app = QApplication.instance() or QApplication([])
+    gauge = AngleGauge(decimals=2)
+
+    gauge._set_angle_gui(10.0)
+    assert gauge._angle == 10.0
+    assert not gauge._coalesce_timer.isActive()
+
+    gauge.show()
+    app.processEvents()
+    assert gauge._last_dyn is not None and gauge._last_dyn[1] == 10.0
+    gauge.setWindowState(Qt.WindowMinimized)
+    gauge._set_angle_gui(11.0)
+    assert not gauge._coalesce_timer.isActive()
+
+    gauge.setWindowState(Qt.WindowNoState)
+    app.processEvents()
+    # La valeur reçue pendant la réduction est peinte au réaffichage
+    assert gauge._last_dyn is not None and gauge._last_dyn[1] == 11.0
+    assert not gauge._repaint_pending
+
+    gauge._set_angle_gui(12.0)
+    assert gauge._coalesce_timer.isActive()
+
+
+def test_set_state_applies_all_three_values_from_one_queued_call():
+    app = QApplication.instance() or QApplication([])
+    gauge = AngleGauge(span_angle=360.0)
+    gauge.show()
+    gauge._set_error_gui(0.25)
+
+    gauge.set_state(12.5, 14.0, float("nan"))
+    assert gauge._angle != 12.5
+    app.sendPostedEvents()
+
+    assert gauge._angle == 12.5 and gauge._actual_enabled
+    assert gauge._setpoint == 14.0 and gauge._set_enabled
+    assert not gauge._error_enabled
+    assert gauge._coalesce_timer.isActive()
+
+
+def test_repaint_with_unchanged_state_reuses_the_composed_frame(monkeypatch):
+    app = QApplication.instance() or QApplication([])
+    gauge = AngleGauge(decimals=2)
+    gauge.resize(200, 200)
+    gauge._set_angle_gui(45.0)
+    dynamic_paints = []
+    original = gauge._paint_dynamic
+    monkeypatch.setattr(gauge, "_paint_dynamic", lambda p: (dynamic_paints.append(True), original(p)))
+
+    gauge.grab()
+    gauge.grab()
+    assert len(dynamic_paints) == 1
+
+    gauge._set_angle_gui(46.0)
+    gauge.grab()
+    assert len(dynamic_paints) == 2
+    assert app is not None
+
+
+def test_forbidden_ranges_are_clamped_and_empty_spans_dropped():
+    app = QApplication.instance() or QApplication([])
+    gauge = AngleGauge(start_angle_deg=-10, span_angle=110)
+
+    gauge._set_ranges_gui([(-20, 5), (50, 40), (95, 140), (120, 130)])
+    assert gauge._forbidden == [(-10.0, 5.0), (95.0, 100.0)]
+
+    gauge._set_ranges_gui([])
+    assert gauge._forbidden == []
+    assert app is not None
+
+
+def test_forbidden_arcs_are_cached_until_ranges_or_orientation_change():
+    app = QApplication.instance() or QApplication([])
+    gauge = AngleGauge(span_angle=360.0, origin_screen_deg=90, clockwise=True,
+                       forbidden_ranges=[(45.0, 90.0)])
+
+    arcs = gauge._forbidden_arcs()
+    assert arcs == [((90 - 45) * 16, -45 * 16)]
+    assert gauge._forbidden_arcs() is arcs
+
+    gauge.configure(clockwise=False)
+    assert gauge._forbidden_arcs() == [((90 + 45) * 16, 45 * 16)]
+
+    gauge._set_ranges_gui([(10.0, 20.0)])
+    assert gauge._forbidden_arcs() == [((90 + 10) * 16, 10 * 16)]
+    assert app is not None
+
+
+def test_tick_endpoints_batch_major_and_minor_lengths():
+    ux = np.array([1.0, 0.0, -1.0])
+    uy = np.array([0.0, -1.0, 0.0])
+    major = np.array([True, False, False])
+
+    x1, y1, x2, y2 = _tick_endpoints(ux, uy, major, 100.0, 50.0, 40.0, 5.0, 10.0)
+
+    np.testing.assert_allclose(x1, [130.0, 100.0, 65.0])
+    np.testing.assert_allclose(y1, [50.0, 15.0, 50.0])
+    np.testing.assert_allclose(x2, [139.0, 100.0, 61.0])
+    np.testing.assert_allclose(y2, [50.0, 11.0, 50.0])
+
+
+def test_indicator_triangle_reuses_its_polygon_and_points_at_the_angle():
+    import math
+
+    app = QApplication.instance() or QApplication([])
+    gauge = AngleGauge(span_angle=360, origin_screen_deg=90, clockwise=True)
+    gauge.resize(200, 200)
+    cx, cy, r_outer, r_inner, _ = gauge._geom()
+
+    first = gauge._triangle_polygon(True, 0.0, cx, cy, r_inner, r_outer)
+    second = gauge._triangle_polygon(True, 90.0, cx, cy, r_inner, r_outer)
+
+    assert first is second
+    assert len(second) == 3
+    r_mid = (r_inner + r_outer) * 0.5
+    apex = second[0]
+    assert math.isclose(apex.x(), cx + r_mid, abs_tol=1e-9)
+    assert math.isclose(apex.y(), cy, abs_tol=1e-9)
+    assert gauge._triangle_polygon(False, 90.0, cx, cy, r_inner, r_outer) is not second
+    assert app is not None
+
+
+def test_finite_float_rejects_missing_and_non_finite_values():
+    assert _finite_float(12) == (True, 12.0)
+    assert _finite_float(np.float32(1.5)) == (True, 1.5)
+    for bad in (None, "abc", float("nan"), float("inf"), -float("inf"), np.float32("nan")):
+        assert _finite_float(bad)[0] is False
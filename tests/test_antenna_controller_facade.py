@@ -9,8 +9,8 @@ from antrack.core.antenna.types import AntennaConnectionMode, AntennaConnectionS
 
 
 class DummyThreadManager:
-    def run_coro(self, _loop_name, coro_or_factory, timeout=None):
-        coro = coro_or_factory() if callable(coro_or_factory) else coro_or_factory
+    def run_coro(self, _loop_name, coro_or_factory, *args, timeout=None):
+        coro = coro_or_factory(*args) if callable(coro_or_factory) else coro_or_factory
         return asyncio.run(coro)
 
 
@@ -18,16 +18,16 @@ class RecordingThreadManager:
     def __init__(self):
         self.timeouts = []
 
-    def run_coro(self, _loop_name, coro_or_factory, timeout=None):
+    def run_coro(self, _loop_name, coro_or_factory, *args, timeout=None):
         self.timeouts.append(timeout)
-        coro = coro_or_factory() if callable(coro_or_factory) else coro_or_factory
+        coro = coro_or_factory(*args) if callable(coro_or_factory) else coro_or_factory
         return asyncio.run(coro)
 
 
 class SubmittingThreadManager(DummyThreadManager):
-    def submit_coro(self, _loop_name, coro_or_factory):
+    def submit_coro(self, _loop_name, coro_or_factory, *args):
         future = Future()
-        coro = coro_or_factory() if callable(coro_or_factory) else coro_or_factory
+        coro = coro_or_factory(*args) if callable(coro_or_factory) else coro_or_factory
         try:
             future.set_result(asyncio.run(coro))
         except Exception as exc:
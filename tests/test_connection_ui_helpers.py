@@ -1,6 +1,16 @@
+import os
+import time
+from types import SimpleNamespace
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtCore import QObject
+from PyQt5.QtWidgets import QApplication, QPushButton
+
 from antrack.core.antenna.config import load_antenna_connection_config
 from antrack.core.antenna.types import AntennaTelemetry
 from antrack.gui.connection_ui import (
+    ConnectionUiMixin,
     axis_reference_valid,
     compute_axis_reference_indicator,
     format_antenna_endpoint_summary,
@@ -140,3 +150,205 @@ def test_axis_operational_tooltip_contains_raw_details_and_timestamp():
     assert "Motor alarm active (raw code 20)" in tooltip
     assert "Raw endstop: 4" in tooltip
     assert "Last update:" in tooltip
+
+
+def test_telemetry_updates_are_coalesced_into_one_repaint():
+    app = QApplication.instance() or QApplication([])
+
+    class Harness(QObject, ConnectionUiMixin):
+        def __init__(self):
+            super().__init__()
+            self.painted = []
+
+        def _display_antenna_status(self, data):
+            self.painted.append(data)
+
+    harness = Harness()
+    for az in (1.0, 2.0, 3.0):
+        harness.ui_display_antenna_status({"az": az})
+
+    deadline = time.monotonic() + 1.0
+    while not harness.painted and time.monotonic() < deadline:
+        app.processEvents()
+        time.sleep(0.01)
+
+    assert harness.painted == [{"az": 3.0}]
+
+
+def test_data_labels_are_resolved_once_until_layout_changes():
+    app = QApplication.instance() or QApplication([])
+    from PyQt5.QtWidgets import QLabel
+
+    class Harness(ConnectionUiMixin):
+        def __init__(self):
+            self.label_axisapp_version = QLabel("v1")
+
+    harness = Harness()
+    harness.set_data_labels_enabled(False)
+    assert harness.label_axisapp_version.isEnabled() is False
+
+    harness.label_antenna_status_az = QLabel("")
+    harness.set_data_labels_enabled(False)
+    assert harness.label_antenna_status_az.isEnabled() is True
+
+    harness._label_refs_cache = None
+    harness.set_data_labels_enabled(False)
+    assert harness.label_antenna_status_az.isEnabled() is False
+    assert app is not None
+
+
+def test_live_labels_are_switched_to_plain_text():
+    from PyQt5.QtCore import Qt
+    from PyQt5.QtWidgets import QLabel
+
+    app = QApplication.instance() or QApplication([])
+
+    class Harness(ConnectionUiMixin):
+        def __init__(self):
+            self.label_antenna_az_rate = QLabel("0.00 °/s")
+
+    harness = Harness()
+    harness._set_plain_text_labels("data", (("label_antenna_az_rate", None), ("label_missing", None)))
+
+    assert harness.label_antenna_az_rate.textFormat() == Qt.PlainText
+    assert harness.label_antenna_az_rate.textInteractionFlags() == Qt.NoTextInteraction
+    assert app is not None
+
+
+def test_set_label_text_skips_unchanged_values():
+    app = QApplication.instance() or QApplication([])
+
+    class CountingLabel:
+        def __init__(self):
+            self.calls = []
+
+        def setText(self, text):
+            self.calls.append(text)
+
+    class Harness(ConnectionUiMixin):
+        pass
+
+    harness = Harness()
+    label = CountingLabel()
+    harness._set_label_text(label, "1.000 °/s")
+    harness._set_label_text(label, "1.000 °/s")
+    harness._set_label_text(label, "2.000 °/s")
+
+    assert label.calls == ["1.000 °/s", "2.000 °/s"]
+    assert app is not None
+
+
+def test_axis_state_text_uses_display_name_and_plain_strings():
+    from antrack.core.axis.axis_client import AxisStatus
+    from antrack.gui.connection_ui import axis_state_text
+
+    assert axis_state_text(AxisStatus.MOTION_AZ_CW) == "CW"
+    assert axis_state_text(AxisStatus.MOTION_AZ_CW) == "CW"
+    assert axis_state_text(AxisStatus.TRACKING) == "TRACKING"
+    assert axis_state_text("STOP") == "STOP"
+
+
+def test_set_label_number_skips_values_with_same_display_rounding():
+    class CountingLabel:
+        def __init__(self):
+            self.calls = []
+
+        def setText(self, text):
+            self.calls.append(text)
+
+    class Harness(ConnectionUiMixin):
+        pass
+
+    harness = Harness()
+    label = CountingLabel()
+    harness._set_label_number(label, 1.2341, 2, " °/s")
+    harness._set_label_number(label, 1.2349, 2, " °/s")
+    harness._set_label_number(label, 1.2391, 2, " °/s")
+    harness._set_label_number(label, None, 2, " °/s")
+
+    assert label.calls == ["1.23 °/s", "1.24 °/s", "--"]
+
+
+def test_start_polling_keeps_existing_adapter_for_same_client():
+    class Polling:
+        def __init__(self, client):
+            self.client = client
+            self.stopped = False
+
+        def stop(self):
+            self.stopped = True
+
+    class Harness(ConnectionUiMixin):
+        pass
+
+    harness = Harness()
+    harness.axis_client = object()
+    existing = Polling(harness.axis_client)
+    harness.axis_polling = existing
+
+    harness.start_polling()
+
+    assert harness.axis_polling is existing
+    assert existing.stopped is False
+
+
+def test_rewire_signal_keeps_a_single_binding():
+    from PyQt5.QtCore import pyqtSignal
+
+    class Emitter(QObject):
+        fired = pyqtSignal(int)
+
+    received = []
+    emitter = Emitter()
+    for _ in range(3):
+        ConnectionUiMixin._rewire_signal(emitter.fired, received.append)
+    emitter.fired.emit(7)
+
+    assert received == [7]
+
+
+def _priming_harness():
+    class Client:
+        def is_connected(self):
+            return True
+
+    class Harness(ConnectionUiMixin):
+        def tracking_permission(self):
+            return SimpleNamespace(allowed=True, reasons=(), message=lambda: "")
+
+    harness = Harness()
+    harness.axis_client = Client()
+    harness.tracker = None
+    harness.positioner = None
+    harness._user_requested_disconnect = False
+    harness._auto_restart_tracking = False
+    harness.logger = SimpleNamespace(info=lambda *a, **k: None, error=lambda *a, **k: None)
+    harness.pushButton_antenna_track = QPushButton()
+    return harness
+
+
+def test_track_button_stays_disabled_until_the_primed_tracker_is_ready():
+    app = QApplication.instance() or QApplication([])
+    harness = _priming_harness()
+    harness._set_tracker_priming(True)
+    assert not harness.pushButton_antenna_track.isEnabled()
+
+    harness._refresh_tracking_permission_ui()
+    assert not harness.pushButton_antenna_track.isEnabled()
+
+    primed = SimpleNamespace(axis_client_qt=harness.axis_client, is_running=lambda: False)
+    harness._on_tracker_ready(primed)
+    assert harness.tracker is primed
+    assert harness.pushButton_antenna_track.isEnabled()
+
+
+def test_primed_tracker_does_not_replace_an_installed_tracker():
+    app = QApplication.instance() or QApplication([])
+    harness = _priming_harness()
+    harness._set_tracker_priming(True)
+    installed = SimpleNamespace(axis_client_qt=harness.axis_client, is_running=lambda: True)
+    harness.tracker = installed
+
+    harness._on_tracker_ready(SimpleNamespace(axis_client_qt=harness.axis_client, is_running=lambda: False))
+    assert harness.tracker is installed
+    assert harness.pushButton_antenna_track.isEnabled()
@@ -0,0 +1,73 @@
+import os
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+SRC_ROOT = Path(__file__).resolve().parents[1] / "src"
+
+
+def _run(code: str, tmp_path: Path) -> subprocess.CompletedProcess:
+    env = dict(os.environ, PYTHONPATH=str(SRC_ROOT), QT_QPA_PLATFORM="offscreen")
+    return subprocess.run(
+        [sys.executable, "-c", textwrap.dedent(code)],
+        cwd=tmp_path,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+
+
+def test_importing_main_installs_no_handlers(tmp_path):
+    result = _run(
+        """
+        import logging
+        import antrack.main
+        root = logging.getLogger()
+        assert root.handlers == [], root.handlers
+        assert not getattr(root, "_antrack_configured", False)
+        """,
+        tmp_path,
+    )
+    assert result.returncode == 0, result.stderr
+
+
+def test_configure_logging_runs_once(tmp_path):
+    result = _run(
+        """
+        import logging
+        from logging.handlers import QueueHandler
+        from pathlib import Path
+        from antrack.main import _configure_logging
+
+        first = _configure_logging(Path("logs"), Path("logs") / "app.log")
+        second = _configure_logging(Path("other"), Path("other") / "app.log")
+        assert second is first
+        handlers = logging.getLogger().handlers
+        assert len(handlers) == 1 and isinstance(handlers[0], QueueHandler), handlers
+        assert not Path("other").exists()
+        """,
+        tmp_path,
+    )
+    assert result.returncode == 0, result.stderr
+    assert (tmp_path / "logs" / "app.log").exists()
+
+
+def test_console_and_file_use_the_same_format(tmp_path):
+    result = _run(
+        """
+        import logging
+        from pathlib import Path
+        from antrack.main import _configure_logging
+
+        _configure_logging(Path("logs"), Path("logs") / "app.log")
+        logging.getLogger("probe").info("hello %s", "world")
+        """,
+        tmp_path,
+    )
+    assert result.returncode == 0, result.stderr
+    console_line = next(line for line in result.stdout.splitlines() if "hello world" in line)
+    file_line = (tmp_path / "logs" / "app.log").read_text(encoding="utf-8").strip()
+    assert console_line.endswith(" - probe - INFO - hello world")
+    assert console_line == file_line
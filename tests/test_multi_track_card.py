@@ -0,0 +1,98 @@
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtCore import QObject, pyqtSignal
+from PyQt5.QtWidgets import QApplication
+
+from antrack.gui.widgets.multi_track_card import PASTEL_GREEN, PASTEL_RED, MultiTrackStrip, TrackModel
+
+
+class FakeEphem(QObject):
+    pose_updated = pyqtSignal(str, dict)
+
+    def __init__(self):
+        super().__init__()
+        self.started = []
+        self.stopped = []
+
+    def start_object(self, key, *args, **kwargs):
+        self.started.append(key)
+
+    def stop_object(self, key):
+        self.stopped.append(key)
+
+
+def test_pose_update_formats_times_once_and_only_touches_its_row():
+    app = QApplication.instance() or QApplication([])
+    calls = []
+
+    def formatter(utc_str, compact=False):
+        calls.append(utc_str)
+        return utc_str[-8:-3]
+
+    ephem = FakeEphem()
+    model = TrackModel(ephem, time_formatter=formatter)
+    model.add_target("mt:sun", "Solar System", "Sun")
+    model.add_target("mt:moon", "Solar System", "Moon")
+    changed_rows = []
+    model.dataChanged.connect(lambda top, bottom, roles: changed_rows.append((top.row(), bottom.row())))
+    payload = {
+        "aos_utc": "2026-01-01 10:00:00",
+        "los_utc": "2026-01-01 12:30:00",
+        "max_el_deg": 42.0,
+        "el_now_deg": 12.34,
+        "visible_now": True,
+    }
+
+    ephem.pose_updated.emit("mt:sun", payload)
+    ephem.pose_updated.emit("mt:sun", dict(payload, el_now_deg=12.5))
+    ephem.pose_updated.emit("mt:sun", dict(payload, el_now_deg=12.5))
+
+    assert ephem.started == ["mt:sun", "mt:moon"]
+    assert calls == ["2026-01-01 10:00:00", "2026-01-01 12:30:00"]
+    assert model.card_values(0)[0] == "10:00"
+    assert model.card_values(0)[5] == "12.5°"
+    assert model.color(0) == PASTEL_GREEN
+    assert model.color(1) == PASTEL_RED
+    assert changed_rows == [(0, 0), (0, 0)]
+    assert app is not None
+
+
+def test_compact_time_fallback_is_relative_to_today():
+    from datetime import datetime, timedelta, timezone
+
+    app = QApplication.instance() or QApplication([])
+    model = TrackModel(FakeEphem())
+    now = datetime.now(timezone.utc)
+    tomorrow = (now + timedelta(days=1)).replace(hour=5, minute=7, second=0)
+    later = (now + timedelta(days=10)).replace(hour=23, minute=59, second=0)
+
+    assert model._compact_time(tomorrow.strftime("%Y-%m-%d %H:%M:%S")) == "+1j 05:07"
+    assert model._compact_time(later.strftime("%Y-%m-%d %H:%M:%S")) == later.strftime("%m-%d 23:59")
+    assert model._compact_time("not a date") == "not a date"
+    assert app is not None
+
+
+def test_click_on_card_picks_its_target():
+    from PyQt5.QtCore import Qt
+    from PyQt5.QtTest import QTest
+
+    app = QApplication.instance() or QApplication([])
+    picked = []
+    ephem = FakeEphem()
+    strip = MultiTrackStrip(ephem, on_pick=lambda obj_type, name: picked.append((obj_type, name)))
+    strip.add_target("Solar System", "Sun")
+    key = strip.add_target("Solar System", "Mars")
+    assert strip.add_target("Solar System", "Mars") == key
+    strip.resize(400, 150)
+    strip.show()
+    app.processEvents()
+
+    rect = strip.visualRect(strip.track_model.index(1))
+    QTest.mouseClick(strip.viewport(), Qt.LeftButton, Qt.NoModifier, rect.center())
+
+    assert picked == [("Solar System", "Mars")]
+    strip.stop_all()
+    assert ephem.stopped == ["mt:solar_system:sun", key]
+    strip.close()
@@ -27,3 +27,34 @@ def test_config_override(monkeypatch, tmp_path: Path):
     settings = load_settings(cfg)
     assert settings["AXIS_SERVER"]["ip_address"] == "1.2.3.4"
     assert settings["AXIS_SERVER"]["port"] == 1234
+
+
+def test_default_config_path_is_probed_once(monkeypatch):
+    monkeypatch.delenv("ANTRACK_CONFIG_PATH", raising=False)
+    paths._default_config_path.cache_clear()
+    first = paths.get_config_path()
+
+    calls = []
+    monkeypatch.setattr(Path, "is_file", lambda self: calls.append(self) or False)
+    assert paths.get_config_path() == first
+    assert calls == []
+
+
+def test_default_config_path_falls_back_to_legacy_then_repo_default(monkeypatch, tmp_path: Path):
+    monkeypatch.delenv("ANTRACK_CONFIG_PATH", raising=False)
+    monkeypatch.setattr(paths, "get_repo_root", lambda: tmp_path)
+    legacy = tmp_path / "src" / "antrack" / "settings.cfg"
+    legacy.parent.mkdir(parents=True)
+    try:
+        paths._default_config_path.cache_clear()
+        assert paths.get_config_path() == tmp_path / "settings.txt"
+
+        legacy.write_text("[AXIS_SERVER]\n", encoding="utf-8")
+        paths._default_config_path.cache_clear()
+        assert paths.get_config_path() == legacy
+
+        (tmp_path / "settings.txt").write_text("[AXIS_SERVER]\n", encoding="utf-8")
+        paths._default_config_path.cache_clear()
+        assert paths.get_config_path() == tmp_path / "settings.txt"
+    finally:
+        paths._default_config_path.cache_clear()
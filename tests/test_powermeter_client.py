@@ -13,3 +13,115 @@ def test_extract_power_from_text_parses_fallback_pattern():
 
 def test_extract_power_from_text_handles_missing_value():
     assert PowermeterClient.extract_power_from_text("") is None
+
+
+def test_extract_power_from_text_parses_raw_serial_bytes():
+    assert PowermeterClient.extract_power_from_text(b"Power=-105.26[dBm]  Ref=   0.00[dBm]\r\n") == -105.26
+    assert PowermeterClient.extract_power_from_text(b"Level -42.5 [dBm]") == -42.5
+
+
+def test_read_power_blocks_on_serial_until_dbm_field():
+    class FakeSerial:
+        is_open = True
+
+        def __init__(self, payload):
+            self.timeout = 0.5
+            self._payload = payload
+            self.timeouts_seen = []
+
+        def write(self, data):
+            return len(data)
+
+        def reset_input_buffer(self):
+            pass
+
+        def reset_output_buffer(self):
+            pass
+
+        @property
+        def in_waiting(self):
+            return len(self._payload)
+
+        def read_until(self, expected, size):
+            self.timeouts_seen.append(self.timeout)
+            end = self._payload.find(expected)
+            end = len(self._payload) if end < 0 else end + len(expected)
+            chunk, self._payload = self._payload[:end], self._payload[end:]
+            return chunk
+
+        def read(self, size):
+            chunk, self._payload = self._payload[:size], self._payload[size:]
+            return chunk
+
+    client = PowermeterClient({"POWERMETER": {"comport": "COM1", "inter_read_delay_s": 0}})
+    fake = FakeSerial(b"power?\r[echo]\r\nPower=-98.75[dBm]  Ref=   0.00[dBm]\r\n")
+    client._ser = fake
+    client._ensure_serial_open = lambda: None
+
+    assert client.read_power() == -98.75
+    assert fake.timeout == 0.5
+    assert len(fake.timeouts_seen) == 2
+
+
+def test_read_command_is_encoded_once_and_reloaded_on_demand():
+    settings = {"POWERMETER": {"comport": "COM1", "read_cmd": "PWR?"}}
+    client = PowermeterClient(settings)
+    assert client._read_cmd_bytes == b"PWR?\r"
+
+    settings["POWERMETER"]["read_cmd"] = ""
+    assert client._read_cmd_bytes == b"PWR?\r"
+    client.reload_settings()
+    assert client._read_cmd_bytes == b""
+
+
+def test_invalid_settings_fall_back_to_defaults_with_a_warning(caplog):
+    settings = {"POWERMETER": {"comport": "COM1", "encoding": "no-such-codec",
+                               "inter_read_delay_s": "fast", "overall_timeout_s": None}}
+    with caplog.at_level("WARNING", logger="Powermeter"):
+        client = PowermeterClient(settings)
+
+    assert client._enc == "ascii"
+    assert client._read_cmd_bytes == b"power?\r"
+    assert client._inter_delay == 0.05
+    assert client._overall_timeout == 1.5
+    assert len(caplog.records) == 3
+
+
+def test_read_power_reads_raw_fd_segments_when_available():
+    import os
+
+    read_fd, write_fd = os.pipe()
+
+    class FdSerial:
+        is_open = True
+
+        @property
+        def timeout(self):
+            return 0.5
+
+        @timeout.setter
+        def timeout(self, value):
+            raise AssertionError("fd path should not reconfigure the port timeout")
+
+        def write(self, data):
+            os.write(write_fd, b"Power=-101.50[dBm]  Ref=   0.00[dBm]\r\n")
+            return len(data)
+
+        def reset_input_buffer(self):
+            pass
+
+        def reset_output_buffer(self):
+            pass
+
+        def read_until(self, expected, size):
+            raise AssertionError("fd path should not use read_until")
+
+    client = PowermeterClient({"POWERMETER": {"comport": "COM1", "inter_read_delay_s": 0}})
+    client._ser = FdSerial()
+    client._fd = read_fd
+    client._ensure_serial_open = lambda: None
+    try:
+        assert client.read_power() == -101.5
+    finally:
+        os.close(read_fd)
+        os.close(write_fd)
@@ -0,0 +1,341 @@
+import os
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import pytest
+from PyQt5.QtCore import Qt
+from PyQt5.QtWidgets import QApplication
+
+from antrack.gui.diagnostics import diagnostics_ui
+from antrack.gui.diagnostics.diagnostics_ui import ERRORS_TAB, HISTORY_TAB, ThreadDiagnosticsUI
+from antrack.threading_utils.thread_manager import TaskStatus
+
+
+@pytest.fixture(scope="module")
+def app():
+    instance = QApplication.instance() or QApplication([])
+    yield instance
+
+
+class _FakeManager:
+    def __init__(self):
+        self.stats = {}
+        self.exceptions = {}
+        self.diagnostics_calls = 0
+        self.revision = None
+
+    def get_diagnostics(self):
+        self.diagnostics_calls += 1
+        return {name: dict(info) for name, info in self.stats.items()}
+
+    def get_task_exceptions(self):
+        return dict(self.exceptions)
+
+    def diagnostics_revision(self):
+        return self.revision
+
+
+def _cell(model, row, col, role=Qt.DisplayRole):
+    return model.index(row, col).data(role)
+
+
+def _finished(name, finished_at, duration=1.0):
+    return {
+        "status": TaskStatus.FINISHED,
+        "description": f"{name} task",
+        "started_at": finished_at - duration,
+        "finished_at": finished_at,
+        "last_duration_s": duration,
+        "tags": ["io"],
+    }
+
+
+def test_refresh_signals_only_changed_rows_and_trims_removed_rows(app):
+    manager = _FakeManager()
+    now = time.time()
+    manager.revision = 1
+    manager.stats = {"a": _finished("a", now - 10), "b": _finished("b", now - 20)}
+    ui = ThreadDiagnosticsUI(manager)
+    ui.timer.stop()
+    ui.tabs.setCurrentIndex(HISTORY_TAB)
+
+    model = ui.history_model
+    assert ui.history_table.model() is model
+    assert model.rowCount() == 2
+    changed = []
+    resets = []
+    model.dataChanged.connect(lambda top, bottom, *_: changed.append((top.row(), bottom.row())))
+    model.modelReset.connect(lambda: resets.append(True))
+
+    ui.update_ui()
+    assert changed == []
+
+    manager.stats["b"]["status"] = TaskStatus.FAILED
+    manager.revision += 1
+    ui.update_ui()
+    assert changed == [(1, 1)]
+    assert _cell(model, 1, 4) == "failed"
+    assert _cell(model, 1, 4, Qt.BackgroundRole).color().getRgb()[:3] == (255, 200, 200)
+
+    del manager.stats["a"]
+    manager.revision += 1
+    ui.update_ui()
+    assert model.rowCount() == 1
+    assert _cell(model, 0, 0, Qt.UserRole) == "b"
+    assert resets == []
+
+
+def test_errors_table_reads_tags_from_one_diagnostics_snapshot(app):
+    manager = _FakeManager()
+    now = time.time()
+    manager.stats = {name: _finished(name, now - i) for i, name in enumerate("abcd")}
+    manager.exceptions = {name: {"time": now - i, "exception": "boom"} for i, name in enumerate("abcd")}
+    ui = ThreadDiagnosticsUI(manager)
+    ui.timer.stop()
+    ui.tabs.setCurrentIndex(ERRORS_TAB)
+
+    manager.diagnostics_calls = 0
+    ui.refresh_all()
+
+    assert manager.diagnostics_calls == 1
+    assert ui.errors_model.rowCount() == 4
+    assert _cell(ui.errors_model, 0, 3) == "io"
+
+
+def test_idle_ticks_only_advance_running_durations(app):
+    manager = _FakeManager()
+    manager.revision = 1
+    manager.stats = {
+        "loop": {"status": TaskStatus.RUNNING, "description": "loop", "started_at": time.time() - 5.0, "tags": []},
+    }
+    ui = ThreadDiagnosticsUI(manager)
+    ui.timer.stop()
+    assert _cell(ui.active_tasks_model, 0, 2).startswith("5.")
+
+    manager.stats["loop"]["started_at"] -= 10.0
+    manager.diagnostics_calls = 0
+    ui.update_ui()
+    assert manager.diagnostics_calls == 0
+    assert _cell(ui.active_tasks_model, 0, 2).startswith("5.")
+
+    ui.refresh_all()
+    assert manager.diagnostics_calls == 1
+    assert _cell(ui.active_tasks_model, 0, 2).startswith("15.")
+
+
+def test_snapshot_is_shared_until_it_ages_out_without_a_revision(app, monkeypatch):
+    manager = _FakeManager()
+    manager.stats = {"a": _finished("a", time.time())}
+    ui = ThreadDiagnosticsUI(manager)
+    ui.timer.stop()
+
+    manager.diagnostics_calls = 0
+    assert ui._task_info("a")["description"] == "a task"
+    ui.update_ui()
+    assert manager.diagnostics_calls == 0
+
+    clock = time.monotonic() + 1.0
+    monkeypatch.setattr(time, "monotonic", lambda: clock)
+    ui.update_ui()
+    assert manager.diagnostics_calls == 1
+
+
+def test_history_lists_most_recent_first_up_to_the_row_cap(app, monkeypatch):
+    monkeypatch.setattr(diagnostics_ui, "HISTORY_ROWS_MAX", 2)
+    manager = _FakeManager()
+    now = time.time()
+    manager.stats = {name: _finished(name, now - age) for name, age in (("old", 30), ("new", 1), ("mid", 10))}
+    ui = ThreadDiagnosticsUI(manager)
+    ui.timer.stop()
+    ui.tabs.setCurrentIndex(HISTORY_TAB)
+
+    names = [_cell(ui.history_model, row, 0) for row in range(ui.history_model.rowCount())]
+    assert names == ["new", "mid"]
+
+
+def test_history_and_error_tables_are_built_when_first_shown(app):
+    manager = _FakeManager()
+    manager.revision = 1
+    manager.stats = {"a": _finished("a", time.time())}
+    ui = ThreadDiagnosticsUI(manager)
+    ui.timer.stop()
+    assert ui.history_table is None
+    assert ui.errors_table is None
+
+    manager.diagnostics_calls = 0
+    ui.tabs.setCurrentIndex(HISTORY_TAB)
+    assert ui.history_model.rowCount() == 1
+    assert ui.errors_table is None
+    assert manager.diagnostics_calls == 0
+
+    manager.stats["b"] = _finished("b", time.time())
+    manager.revision += 1
+    ui.tabs.setCurrentIndex(ERRORS_TAB)
+    ui.update_ui()
+    assert ui.history_model.rowCount() == 1
+
+    ui.tabs.setCurrentIndex(HISTORY_TAB)
+    assert ui.history_model.rowCount() == 2
+
+
+def test_status_background_follows_the_status_column(app):
+    manager = _FakeManager()
+    manager.revision = 1
+    now = time.time()
+    manager.stats = {"a": _finished("a", now)}
+    ui = ThreadDiagnosticsUI(manager)
+    ui.timer.stop()
+    ui.tabs.setCurrentIndex(HISTORY_TAB)
+    model = ui.history_model
+    assert _cell(model, 0, 4, Qt.BackgroundRole).color().getRgb()[:3] == (200, 230, 200)
+    assert _cell(model, 0, 1, Qt.BackgroundRole) is None
+
+    manager.stats["a"]["status"] = TaskStatus.CANCELLED
+    manager.revision += 1
+    ui.update_ui()
+    assert _cell(model, 0, 4) == "cancelled"
+    assert _cell(model, 0, 4, Qt.BackgroundRole).color().getRgb()[:3] == (255, 230, 180)
+
+    manager.stats["a"]["status"] = "unknown"
+    manager.revision += 1
+    ui.update_ui()
+    assert _cell(model, 0, 4, Qt.BackgroundRole) is None
+
+
+def test_cancel_selected_task_uses_the_selected_row(app):
+    manager = _FakeManager()
+    manager.revision = 1
+    manager.stats = {
+        name: {"status": TaskStatus.RUNNING, "description": name, "started_at": time.time(), "tags": []}
+        for name in ("first", "second")
+    }
+    stopped = []
+    manager.stop_thread = stopped.append
+    ui = ThreadDiagnosticsUI(manager)
+    ui.timer.stop()
+
+    ui.active_tasks_table.selectRow(1)
+    ui.cancel_selected_task()
+    assert stopped == ["second"]
+
+
+def test_refresh_requests_in_one_pass_are_coalesced(app):
+    manager = _FakeManager()
+    manager.revision = 1
+    ui = ThreadDiagnosticsUI(manager)
+    ui.timer.stop()
+
+    manager.diagnostics_calls = 0
+    ui.request_refresh()
+    ui.request_refresh()
+    ui.request_refresh()
+    assert manager.diagnostics_calls == 0
+
+    app.processEvents()
+    assert manager.diagnostics_calls == 1
+
+
+def test_periodic_refresh_only_runs_while_shown(app):
+    ui = ThreadDiagnosticsUI(_FakeManager())
+    assert not ui.timer.isActive()
+
+    ui.show()
+    assert ui.timer.isActive()
+
+    ui.hide()
+    assert not ui.timer.isActive()
+
+
+def test_status_backgrounds_are_shared_module_brushes(app):
+    manager = _FakeManager()
+    now = time.time()
+    manager.stats = {"a": _finished("a", now), "b": _finished("b", now - 1)}
+    manager.stats["b"]["status"] = TaskStatus.FAILED
+    ui = ThreadDiagnosticsUI(manager)
+    ui.timer.stop()
+    ui.tabs.setCurrentIndex(HISTORY_TAB)
+
+    assert ui.history_model._rows[0][2][1] is diagnostics_ui._BG_COMPLETED
+    assert ui.history_model._rows[1][2][1] is diagnostics_ui._BG_FAILED
+
+
+def test_history_start_times_are_formatted_once_per_task(app, monkeypatch):
+    manager = _FakeManager()
+    manager.revision = 1
+    manager.stats = {"a": _finished("a", time.time())}
+    ui = ThreadDiagnosticsUI(manager)
+    ui.timer.stop()
+    ui.tabs.setCurrentIndex(HISTORY_TAB)
+    started = _cell(ui.history_model, 0, 2)
+
+    class _NoFormat:
+        @staticmethod
+        def fromtimestamp(_ts):
+            raise AssertionError("start time formatted again")
+
+    monkeypatch.setattr(diagnostics_ui, "datetime", _NoFormat)
+    manager.stats["a"]["description"] = "renamed"
+    manager.revision += 1
+    ui.update_ui()
+    assert _cell(ui.history_model, 0, 1) == "renamed"
+    assert _cell(ui.history_model, 0, 2) == started
+
+    monkeypatch.undo()
+    manager.stats["a"]["started_at"] -= 3600
+    manager.revision += 1
+    ui.update_ui()
+    assert _cell(ui.history_model, 0, 2) != started
+
+
+def test_snapshot_splits_running_and_done_tasks_once(app):
+    manager = _FakeManager()
+    now = time.time()
+    manager.stats = {
+        "loop": {"status": TaskStatus.RUNNING, "description": "loop", "started_at": now, "tags": []},
+        "job": _finished("job", now),
+    }
+    ui = ThreadDiagnosticsUI(manager)
+    ui.timer.stop()
+    ui.tabs.setCurrentIndex(HISTORY_TAB)
+
+    snap = ui._snapshot()
+    assert set(snap.running) == {"loop"}
+    assert set(snap.done) == {"job"}
+    assert [_cell(ui.history_model, row, 0) for row in range(ui.history_model.rowCount())] == ["job"]
+
+
+def test_errors_are_listed_newest_first(app):
+    manager = _FakeManager()
+    now = time.time()
+    manager.exceptions = {
+        "old": {"time": now - 60, "exception": "a"},
+        "none": {"time": None, "exception": "b"},
+        "new": {"time": now, "exception": "c"},
+    }
+    ui = ThreadDiagnosticsUI(manager)
+    ui.timer.stop()
+    ui.tabs.setCurrentIndex(ERRORS_TAB)
+
+    names = [_cell(ui.errors_model, row, 0) for row in range(ui.errors_model.rowCount())]
+    assert names == ["new", "old"]
+
+
+def test_running_tags_are_joined_once_per_snapshot(app):
+    manager = _FakeManager()
+    manager.revision = 1
+    manager.stats = {
+        "loop": {"status": TaskStatus.RUNNING, "description": "loop", "started_at": time.time(), "tags": ["io", "net"]},
+    }
+    ui = ThreadDiagnosticsUI(manager)
+    ui.timer.stop()
+    assert _cell(ui.active_tasks_model, 0, 4) == "io, net"
+    cached = ui._tags_cache["loop"]
+
+    ui.update_ui()
+    assert ui._tags_cache["loop"] is cached
+
+    manager.stats["loop"]["tags"] = ["io"]
+    manager.revision += 1
+    ui.update_ui()
+    assert _cell(ui.active_tasks_model, 0, 4) == "io"
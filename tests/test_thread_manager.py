@@ -1,3 +1,18 @@
+import ast
+import os
+import subprocess
+import sys
+import textwrap
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtWidgets import QApplication
+
+from antrack.threading_utils import thread_manager as thread_manager_module
 from antrack.threading_utils.thread_manager import TaskStatus, ThreadManager
 
 
@@ -45,3 +60,157 @@ def test_thread_manager_can_submit_coro_without_waiting_for_result():
 
     assert future.result(timeout=1.0) == 42
     tm.stop_thread("TestAsyncLoop")
+
+
+def test_thread_manager_run_coro_passes_args_to_factory():
+    tm = ThreadManager()
+
+    async def scaled(value, factor):
+        return value * factor
+
+    assert tm.run_coro("TestAsyncArgsLoop", scaled, 21, 2, timeout=1.0) == 42
+    tm.stop_thread("TestAsyncArgsLoop")
+
+
+def test_thread_manager_revision_tracks_task_state_changes():
+    tm = ThreadManager()
+    start = tm.diagnostics_revision()
+
+    record = tm._ensure_task("RevTask", description="work")
+    record.status = TaskStatus.RUNNING
+    record.started_at = 300.0
+    tm._record_status("RevTask", "START func=work")
+    assert tm.diagnostics_revision() == start
+
+    tm._cleanup_thread("RevTask")
+    after_cleanup = tm.diagnostics_revision()
+    assert after_cleanup != start
+
+    tm.clear_history()
+    assert tm.diagnostics_revision() != after_cleanup
+
+
+def test_thread_manager_prewarm_starts_distinct_pool_threads():
+    tm = ThreadManager(max_workers=3)
+
+    futures = tm.prewarm(8)
+    for future in futures:
+        future.result(timeout=3.0)
+
+    assert len(futures) == 3
+    assert len(tm.executor._threads) == 3
+    tm.shutdown(graceful=True, timeout_s=0.1)
+
+
+def test_thread_manager_prewarm_starts_qthreadpool_threads(monkeypatch):
+    pool_idents = set()
+
+    class RecordingBarrier(threading.Barrier):
+        def wait(self, timeout=None):
+            if not threading.current_thread().name.startswith("AntrackPool"):
+                pool_idents.add(threading.get_ident())
+            return super().wait(timeout)
+
+    monkeypatch.setattr(thread_manager_module.threading, "Barrier", RecordingBarrier)
+    tm = ThreadManager(max_workers=2, max_threads=4)
+
+    tm.prewarm(8)
+    assert tm._pool.waitForDone(1000)
+    assert len(pool_idents) == 4
+    tm.shutdown(graceful=True, timeout_s=0.1)
+
+
+def test_thread_manager_module_defines_each_class_once():
+    tree = ast.parse(Path(thread_manager_module.__file__).read_text(encoding="utf-8"))
+    names = Counter(node.name for node in tree.body if isinstance(node, (ast.ClassDef, ast.FunctionDef)))
+    assert [name for name, count in names.items() if count > 1] == []
+    assert not hasattr(thread_manager_module, "ThreadStats")
+
+
+def _process_until(app, predicate, timeout_s=3.0):
+    deadline = time.monotonic() + timeout_s
+    while not predicate() and time.monotonic() < deadline:
+        app.processEvents()
+        time.sleep(0.005)
+    return predicate()
+
+
+def test_start_thread_runs_on_reused_pool_threads():
+    app = QApplication.instance() or QApplication([])
+    tm = ThreadManager()
+    idents = []
+    results = []
+
+    for _ in range(2):
+        worker = tm.start_thread("PoolTask", lambda: idents.append(threading.get_ident()) or len(idents))
+        worker.result.connect(results.append)
+        assert _process_until(app, lambda: "PoolTask" not in tm.threads)
+        assert _process_until(app, lambda: tm._pool.activeThreadCount() == 0)
+
+    assert results == [1, 2]
+    assert len(set(idents)) == 1 and idents[0] != threading.get_ident()
+    diag = tm.get_diagnostics()["PoolTask"]
+    assert diag["status"] == TaskStatus.FINISHED
+    assert diag["start_count"] == 2
+    tm.shutdown(graceful=True, timeout_s=0.1)
+
+
+def test_pooled_thread_view_tracks_the_running_worker():
+    app = QApplication.instance() or QApplication([])
+    tm = ThreadManager()
+    release = threading.Event()
+    worker = tm.start_thread("Blocking", release.wait, 2.0)
+    thread = tm.threads["Blocking"]
+
+    assert thread.isRunning()
+    assert tm.start_thread("Blocking", release.wait, 2.0) is worker
+    assert not thread.wait(10)
+
+    release.set()
+    assert thread.wait(1000)
+    assert thread.isFinished()
+    assert _process_until(app, lambda: "Blocking" not in tm.threads)
+    tm.shutdown(graceful=True, timeout_s=0.1)
+
+
+def test_cleanup_from_a_replaced_worker_is_ignored():
+    tm = ThreadManager()
+    record = tm._ensure_task("Replaced", description="work")
+    record.status = TaskStatus.RUNNING
+    record.started_at = 400.0
+    current = object()
+    tm.workers["Replaced"] = current
+
+    tm._cleanup_thread("Replaced", object())
+    assert tm.get_diagnostics()["Replaced"]["status"] == TaskStatus.RUNNING
+
+    tm._cleanup_thread("Replaced", current)
+    assert tm.get_diagnostics()["Replaced"]["status"] == TaskStatus.FINISHED
+
+
+def test_task_outliving_shutdown_does_not_block_process_exit(tmp_path):
+    code = textwrap.dedent(
+        """
+        import time
+        from PyQt5.QtWidgets import QApplication
+        from antrack.threading_utils.thread_manager import ThreadManager
+
+        app = QApplication([])
+        tm = ThreadManager()
+        tm.start_thread("SlowLoop", time.sleep, 30.0)
+        time.sleep(0.05)
+        tm.shutdown(graceful=True, timeout_s=0.3)
+        assert tm.threads["SlowLoop"].isRunning()
+        print("shutdown returned", flush=True)
+        """
+    )
+    env = dict(os.environ, PYTHONPATH=str(Path(__file__).resolve().parents[1] / "src"), QT_QPA_PLATFORM="offscreen")
+    start = time.monotonic()
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=tmp_path, env=env, capture_output=True, text=True, timeout=20
+    )
+
+    assert result.returncode == 0, result.stderr
+    assert "shutdown returned" in result.stdout
+    assert "has been deleted" not in result.stderr
+    assert time.monotonic() - start < 10.0
@@ -0,0 +1,37 @@
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtWidgets import QApplication, QMessageBox, QWidget
+
+from antrack.gui.tracking_ui import TrackingUiMixin
+
+
+class _Harness(QWidget, TrackingUiMixin):
+    pass
+
+
+def test_notice_raised_while_one_is_open_gets_its_own_box(monkeypatch):
+    app = QApplication.instance() or QApplication([])
+    harness = _Harness()
+    shown = []
+
+    def fake_exec(box):
+        shown.append((box, box.text()))
+        if len(shown) == 1:
+            # exec_() runs the event loop: a queued retry can raise a second notice meanwhile
+            box.show()
+            harness._show_tracking_message("Tracking", "Abandon start")
+            assert box.text() == "first"
+            box.hide()
+        return 0
+
+    monkeypatch.setattr(QMessageBox, "exec_", fake_exec)
+    harness._show_tracking_message("Tracking", "first")
+
+    assert [text for _, text in shown] == ["first", "Abandon start"]
+    assert shown[0][0] is harness._info_box
+    assert shown[1][0] is not harness._info_box
+
+    harness._show_tracking_message("Tracking", "again")
+    assert shown[2][0] is harness._info_box